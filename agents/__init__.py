@@ -1,3 +1,5 @@
+import importlib
+
 from schema import (
     Contractor,
     ContractorList,
@@ -5,7 +7,9 @@ from schema import (
     ReviewSummary,
     VettedContractor,
 )
-from workflows import AgentState, build_discovery_vetting_graph
+
+# The workflow (LangGraph included) is only imported when first used.
+_WORKFLOW_EXPORTS = ("AgentState", "build_discovery_vetting_graph")
 
 __all__ = [
     "Contractor",
@@ -16,3 +20,11 @@ __all__ = [
     "AgentState",
     "build_discovery_vetting_graph",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _WORKFLOW_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module("workflows"), name)
+    globals()[name] = value
+    return value
@@ -1,10 +1,11 @@
 import logging
 from tools.firecrawl_tool import search_contractors
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     # Get user context
     service_type = input("What service are you looking for? (e.g., Roofing, Plumbing): ")
     zip_code = input("Enter your ZIP code: ")
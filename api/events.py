@@ -0,0 +1,86 @@
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Optional
+
+from schema.serialization import dumps, to_jsonable
+from tools.env import env_float
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_EVENTS = {"completed", "failed"}
+
+
+# Append-only event log for one job. Subscribers replay from any position
+# (Last-Event-ID) and then wait for new events, so late subscribers and
+# reconnects see the same sequence as early ones.
+class JobEventChannel:
+    def __init__(self, job_id: str) -> None:
+        self.job_id = job_id
+        self._events: list[tuple[str, Any]] = []
+        self._closed = False
+        self._changed = asyncio.Event()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def publish(self, event: str, data: Any) -> None:
+        if self._closed:
+            return
+        self._events.append((event, to_jsonable(data)))
+        if event in TERMINAL_EVENTS:
+            self._closed = True
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def subscribe(
+        self, last_event_id: int = -1, heartbeat_seconds: float = 15.0
+    ) -> AsyncIterator[Optional[tuple[int, str, Any]]]:
+        # Yields (event_id, event, data), or None when a heartbeat is due.
+        index = last_event_id + 1
+        while True:
+            while index < len(self._events):
+                event, data = self._events[index]
+                yield index, event, data
+                index += 1
+            if self._closed:
+                return
+            changed = self._changed
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield None
+
+
+_channels: dict[str, JobEventChannel] = {}
+_retention_seconds = env_float("DISCOVERY_EVENT_RETENTION_SECONDS", 120.0)
+
+
+def open_channel(job_id: str) -> JobEventChannel:
+    channel = _channels.get(job_id)
+    if channel is None:
+        channel = JobEventChannel(job_id)
+        _channels[job_id] = channel
+    return channel
+
+
+def get_channel(job_id: str) -> Optional[JobEventChannel]:
+    return _channels.get(job_id)
+
+
+def close_channel(job_id: str) -> None:
+    # Keep finished channels around briefly for reconnecting subscribers;
+    # after that the stored job is the source of truth.
+    def _drop() -> None:
+        _channels.pop(job_id, None)
+
+    asyncio.get_running_loop().call_later(_retention_seconds, _drop)
+
+
+def format_sse(event_id: Optional[int], event: str, data: Any) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {dumps(data)}")
+    return "\n".join(lines) + "\n\n"
@@ -0,0 +1,188 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from tools.env import env_float, env_int
+
+logger = logging.getLogger(__name__)
+
+JobT = TypeVar("JobT", bound=BaseModel)
+
+_FINISHED_STATUSES = {"completed", "failed"}
+
+
+def _is_finished(job: BaseModel) -> bool:
+    status = getattr(job, "status", None)
+    return getattr(status, "value", status) in _FINISHED_STATUSES
+
+
+class JobStore(ABC, Generic[JobT]):
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[JobT]: ...
+
+    @abstractmethod
+    def put(self, job: JobT) -> None: ...
+
+    @abstractmethod
+    def purge_expired(self) -> int: ...
+
+    @abstractmethod
+    def stats(self) -> dict[str, int]: ...
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryJobStore(JobStore[JobT]):
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._jobs: dict[str, tuple[float, JobT]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, job_id: str) -> Optional[JobT]:
+        with self._lock:
+            entry = self._jobs.get(job_id)
+            return entry[1] if entry else None
+
+    def put(self, job: JobT) -> None:
+        with self._lock:
+            self._jobs[job.job_id] = (time.time(), job)
+
+    def purge_expired(self) -> int:
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            expired = [
+                job_id
+                for job_id, (updated, job) in self._jobs.items()
+                if updated < cutoff and _is_finished(job)
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+        return len(expired)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"memory_jobs": len(self._jobs)}
+
+
+# Queued/running jobs stay pinned in memory because they are mutated in place.
+# Finished jobs are written to SQLite and only the most recently used ones are
+# kept in an LRU, so memory stays bounded regardless of uptime. Lookups are
+# dict hits or a primary-key read.
+class SQLiteJobStore(JobStore[JobT]):
+    def __init__(
+        self,
+        model_cls: type[JobT],
+        path: str,
+        max_cached: int = 256,
+        ttl_seconds: float = 7 * 24 * 60 * 60,
+    ) -> None:
+        self.model_cls = model_cls
+        self.path = path
+        self.max_cached = max_cached
+        self.ttl_seconds = ttl_seconds
+        self._active: dict[str, JobT] = {}
+        self._recent: OrderedDict[str, JobT] = OrderedDict()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "job_id TEXT PRIMARY KEY, payload TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_updated_at ON jobs (updated_at)"
+        )
+        logger.info("Opened SQLite job store at '%s'.", path)
+
+    def _remember(self, job: JobT) -> None:
+        self._recent[job.job_id] = job
+        self._recent.move_to_end(job.job_id)
+        while len(self._recent) > self.max_cached:
+            self._recent.popitem(last=False)
+
+    def get(self, job_id: str) -> Optional[JobT]:
+        with self._lock:
+            job = self._active.get(job_id)
+            if job is not None:
+                return job
+            job = self._recent.get(job_id)
+            if job is not None:
+                self._recent.move_to_end(job_id)
+                return job
+            row = self._conn.execute(
+                "SELECT payload FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            job = self.model_cls.model_validate_json(row[0])
+            self._remember(job)
+            return job
+
+    def put(self, job: JobT) -> None:
+        with self._lock:
+            if not _is_finished(job):
+                self._active[job.job_id] = job
+                return
+            self._active.pop(job.job_id, None)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs (job_id, payload, updated_at) VALUES (?, ?, ?)",
+                (job.job_id, job.model_dump_json(), time.time()),
+            )
+            self._remember(job)
+
+    def purge_expired(self) -> int:
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            expired_ids = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT job_id FROM jobs WHERE updated_at < ?", (cutoff,)
+                ).fetchall()
+            ]
+            self._conn.execute("DELETE FROM jobs WHERE updated_at < ?", (cutoff,))
+            for job_id in expired_ids:
+                self._recent.pop(job_id, None)
+        if expired_ids:
+            logger.info("Purged %d expired jobs from the job store.", len(expired_ids))
+        return len(expired_ids)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            stored = self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+            return {
+                "active_jobs": len(self._active),
+                "cached_jobs": len(self._recent),
+                "stored_jobs": int(stored),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_job_store(model_cls: type[JobT]) -> JobStore[JobT]:
+    backend = os.getenv("JOB_STORE_BACKEND", "sqlite").strip().lower()
+    ttl_seconds = env_float("JOB_TTL_SECONDS", 7 * 24 * 60 * 60)
+    if backend == "memory":
+        return MemoryJobStore(ttl_seconds=ttl_seconds)
+    if backend != "sqlite":
+        logger.warning("Unknown JOB_STORE_BACKEND='%s'; using sqlite.", backend)
+    return SQLiteJobStore(
+        model_cls,
+        path=os.getenv("JOB_STORE_PATH", ".cache/jobs.sqlite3"),
+        max_cached=env_int("JOB_STORE_MAX_CACHED", 256),
+        ttl_seconds=ttl_seconds,
+    )
@@ -0,0 +1,217 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from tools.env import env_float, env_int
+
+logger = logging.getLogger(__name__)
+
+# Highest priority first. Within a class, clients are served round-robin so a
+# single caller submitting many jobs cannot starve everyone else.
+PRIORITY_CLASSES = ("high", "normal", "low")
+
+
+@dataclass
+class QueuedJob:
+    job_id: str
+    client_id: str
+    priority: str
+    enqueued_at: float
+
+
+class QueueFullError(Exception):
+    def __init__(self, message: str, retry_after_seconds: float) -> None:
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+class JobScheduler:
+    def __init__(
+        self,
+        run_job: Callable[[str], Awaitable[None]],
+        worker_count: int = 4,
+        max_queue_depth: int = 100,
+        max_queued_per_client: int = 20,
+        initial_runtime_estimate_seconds: float = 30.0,
+    ) -> None:
+        self.run_job = run_job
+        self.worker_count = max(1, worker_count)
+        self.max_queue_depth = max(1, max_queue_depth)
+        self.max_queued_per_client = max(1, max_queued_per_client)
+        self._queues: dict[str, OrderedDict[str, deque[QueuedJob]]] = {
+            priority: OrderedDict() for priority in PRIORITY_CLASSES
+        }
+        self._queued: dict[str, QueuedJob] = {}
+        self._client_depth: dict[str, int] = {}
+        self._running = 0
+        self._available: Optional[asyncio.Semaphore] = None
+        self._workers: list[asyncio.Task] = []
+        # EWMA of job runtimes, used for queue ETAs and Retry-After.
+        self._avg_runtime_seconds = initial_runtime_estimate_seconds
+        self._completed = 0
+        self._rejected = 0
+
+    def _ensure_workers(self) -> None:
+        if self._workers:
+            return
+        self._available = asyncio.Semaphore(0)
+        self._workers = [
+            asyncio.create_task(self._worker_loop(index))
+            for index in range(self.worker_count)
+        ]
+        logger.info("Started %d discovery workers.", self.worker_count)
+
+    async def stop(self) -> None:
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    def _retry_after_seconds(self) -> float:
+        waves = len(self._queued) / self.worker_count
+        return max(1.0, waves * self._avg_runtime_seconds)
+
+    def check_admission(self, client_id: str) -> None:
+        if len(self._queued) >= self.max_queue_depth:
+            self._rejected += 1
+            raise QueueFullError(
+                "Discovery queue is full; retry later.", self._retry_after_seconds()
+            )
+        if self._client_depth.get(client_id, 0) >= self.max_queued_per_client:
+            self._rejected += 1
+            raise QueueFullError(
+                "Too many queued jobs for this client; retry later.",
+                self._retry_after_seconds(),
+            )
+
+    def submit(self, job_id: str, client_id: str, priority: str = "normal") -> int:
+        # Callers run check_admission first, under the same lock that guards
+        # job registration, so this never exceeds the configured bounds.
+        if priority not in self._queues:
+            priority = "normal"
+        self._ensure_workers()
+        entry = QueuedJob(job_id, client_id, priority, time.monotonic())
+        self._queues[priority].setdefault(client_id, deque()).append(entry)
+        self._queued[job_id] = entry
+        self._client_depth[client_id] = self._client_depth.get(client_id, 0) + 1
+        self._available.release()
+        return self.queue_position(job_id) or 1
+
+    def promote(self, job_id: str, priority: str) -> Optional[int]:
+        # Moves a queued job up to `priority` (never down), e.g. when a
+        # higher-priority request is coalesced onto it. Returns its new queue
+        # position, or None if it is no longer queued.
+        entry = self._queued.get(job_id)
+        if entry is None:
+            return None
+        rank = PRIORITY_CLASSES.index
+        if priority in self._queues and rank(priority) < rank(entry.priority):
+            clients = self._queues[entry.priority]
+            jobs = clients[entry.client_id]
+            jobs.remove(entry)
+            if not jobs:
+                del clients[entry.client_id]
+            logger.info(
+                "Promoting job_id='%s' from '%s' to '%s' priority.",
+                job_id,
+                entry.priority,
+                priority,
+            )
+            entry.priority = priority
+            self._queues[priority].setdefault(entry.client_id, deque()).append(entry)
+        return self.queue_position(job_id)
+
+    def _pop_next(self) -> Optional[QueuedJob]:
+        for priority in PRIORITY_CLASSES:
+            clients = self._queues[priority]
+            if not clients:
+                continue
+            client_id, jobs = next(iter(clients.items()))
+            entry = jobs.popleft()
+            if jobs:
+                clients.move_to_end(client_id)
+            else:
+                del clients[client_id]
+            del self._queued[entry.job_id]
+            remaining = self._client_depth[entry.client_id] - 1
+            if remaining:
+                self._client_depth[entry.client_id] = remaining
+            else:
+                del self._client_depth[entry.client_id]
+            return entry
+        return None
+
+    def _dispatch_order(self) -> list[str]:
+        # Replays _pop_next over a snapshot of the queues.
+        order = []
+        for priority in PRIORITY_CLASSES:
+            pending = [list(jobs) for jobs in self._queues[priority].values()]
+            while pending:
+                for jobs in pending:
+                    order.append(jobs.pop(0).job_id)
+                pending = [jobs for jobs in pending if jobs]
+        return order
+
+    def queue_position(self, job_id: str) -> Optional[int]:
+        if job_id not in self._queued:
+            return None
+        return self._dispatch_order().index(job_id) + 1
+
+    def estimated_start_seconds(self, position: int) -> float:
+        idle_workers = max(0, self.worker_count - self._running)
+        if position <= idle_workers:
+            return 0.0
+        waves = (position - idle_workers - 1) // self.worker_count + 1
+        return waves * self._avg_runtime_seconds
+
+    async def _worker_loop(self, index: int) -> None:
+        while True:
+            await self._available.acquire()
+            entry = self._pop_next()
+            if entry is None:
+                continue
+            self._running += 1
+            started_at = time.monotonic()
+            logger.info(
+                "Worker %d starting job_id='%s' after %.2fs in queue.",
+                index,
+                entry.job_id,
+                started_at - entry.enqueued_at,
+            )
+            try:
+                await self.run_job(entry.job_id)
+            except Exception:
+                logger.exception("Worker %d failed job_id='%s'.", index, entry.job_id)
+            finally:
+                self._running -= 1
+                runtime = time.monotonic() - started_at
+                self._avg_runtime_seconds = 0.8 * self._avg_runtime_seconds + 0.2 * runtime
+                self._completed += 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "workers": self.worker_count,
+            "running": self._running,
+            "queued": len(self._queued),
+            "queued_by_priority": {
+                priority: sum(len(jobs) for jobs in clients.values())
+                for priority, clients in self._queues.items()
+            },
+            "max_queue_depth": self.max_queue_depth,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "avg_runtime_seconds": round(self._avg_runtime_seconds, 3),
+        }
+
+
+def create_job_scheduler(run_job: Callable[[str], Awaitable[None]]) -> JobScheduler:
+    return JobScheduler(
+        run_job,
+        worker_count=env_int("DISCOVERY_WORKERS", 4, minimum=1),
+        max_queue_depth=env_int("DISCOVERY_MAX_QUEUE_DEPTH", 100),
+        max_queued_per_client=env_int("DISCOVERY_MAX_QUEUED_PER_CLIENT", 20),
+        initial_runtime_estimate_seconds=env_float("DISCOVERY_RUNTIME_ESTIMATE_SECONDS", 30.0),
+    )
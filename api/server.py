@@ -1,18 +1,85 @@
 import asyncio
 import json
 import logging
+import time
 import uuid
-from datetime import datetime, timezone
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Optional
+from typing import Annotated, Any, AsyncIterator, Callable, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from prometheus_client import CONTENT_TYPE_LATEST, Gauge, generate_latest
 from pydantic import BaseModel, Field
 
-from workflows.discovery_vetting_graph import build_discovery_vetting_graph
+import config  # noqa: F401  (loads .env before the modules below read settings)
+from api.events import JobEventChannel, close_channel, format_sse, get_channel, open_channel
+from api.job_store import create_job_store
+from api.scheduler import QueueFullError, create_job_scheduler
+from schema.models import RankedContractor, SynthesisResult
+from tools.blob_store import blob_store
+from tools.env import env_float, env_int
+from tools.metrics import JobTimings, record_timings
+from workflows.batch_runner import BatchProgress, run_discovery_batch
+from workflows.discovery_vetting_graph import (
+    get_discovery_vetting_graph,
+    graph_build_stats,
+    was_throttled,
+)
+from workflows.enrichment_memo import EnrichmentMemo
+from workflows.state import initial_agent_state
+from workflows.vetting_records import vetting_records
 
 logger = logging.getLogger(__name__)
-app = FastAPI(title="Home Improvement Agent API", version="0.1.0")
+
+
+_job_purge_interval_seconds = env_float("JOB_STORE_PURGE_INTERVAL_SECONDS", 300.0)
+
+
+def _purge_blobs() -> int:
+    # Pages behind fresh vetting records are kept even past the blob TTL, so
+    # VETTING_MAX_AGE_GOOGLE/BBB may be longer than BLOB_STORE_TTL_SECONDS.
+    return blob_store.purge_expired(keep=vetting_records.fresh_blob_digests())
+
+
+async def _purge_jobs_periodically() -> None:
+    while True:
+        await asyncio.sleep(_job_purge_interval_seconds)
+        try:
+            await asyncio.to_thread(_job_store.purge_expired)
+        except Exception:
+            logger.exception("Job store purge failed.")
+        try:
+            # Walks the blob directory, so it runs off the event loop.
+            await asyncio.to_thread(_purge_blobs)
+        except Exception:
+            logger.exception("Blob store purge failed.")
+        try:
+            await asyncio.to_thread(vetting_records.purge_expired)
+        except Exception:
+            logger.exception("Vetting record purge failed.")
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Uvicorn only configures its own loggers; without this the application's
+    # INFO logs are dropped.
+    logging.basicConfig(level=logging.INFO)
+    # Compile the default graph before accepting traffic so the first job
+    # does not pay for it.
+    get_discovery_vetting_graph()
+    purge_task = asyncio.create_task(_purge_jobs_periodically())
+    try:
+        yield
+    finally:
+        purge_task.cancel()
+        await _scheduler.stop()
+        _job_store.close()
+
+
+app = FastAPI(title="Home Improvement Agent API", version="0.1.0", lifespan=lifespan)
 
 
 class JobStatus(str, Enum):
@@ -22,19 +89,32 @@ class JobStatus(str, Enum):
     failed = "failed"
 
 
+class JobPriority(str, Enum):
+    high = "high"
+    normal = "normal"
+    low = "low"
+
+
 class DiscoveryJobRequest(BaseModel):
     service_type: str = Field(..., min_length=1)
     zip_code: str = Field(..., min_length=3)
     target_contractor_count: int = Field(default=5, ge=1, le=20)
     selected_contractor_index: int = Field(default=0, ge=0)
+    vet_all_candidates: bool = False
+    priority: JobPriority = JobPriority.normal
 
 
 class DiscoveryResult(BaseModel):
-    consolidated_summary: Optional[dict[str, Any]] = None
+    consolidated_summary: Optional[SynthesisResult] = None
+    candidate_summaries: list[SynthesisResult] = Field(default_factory=list)
+    # Best first; see tools.ranking.
+    ranked_candidates: list[RankedContractor] = Field(default_factory=list)
     flags: list[str] = Field(default_factory=list)
     selected_contractor_name: Optional[str] = None
     selected_contractor_index: Optional[int] = None
     yelp_candidate_count: int = 0
+    # Seconds spent per graph node and per upstream API for this run.
+    timings: Optional[dict[str, Any]] = None
 
 
 class DiscoveryJobResponse(BaseModel):
@@ -45,56 +125,151 @@ class DiscoveryJobResponse(BaseModel):
     request: DiscoveryJobRequest
     result: Optional[DiscoveryResult] = None
     error: Optional[str] = None
+    shared_from_job_id: Optional[str] = Field(
+        default=None,
+        description="Job whose pipeline run produced this job's result, if shared.",
+    )
+    queue_position: Optional[int] = None
+    estimated_start_at: Optional[str] = None
 
 
 class DiscoveryJobCreated(BaseModel):
     job_id: str
     status: JobStatus
+    shared_from_job_id: Optional[str] = None
+    queue_position: Optional[int] = None
 
 
-_jobs: dict[str, DiscoveryJobResponse] = {}
+class DiscoveryBatchItem(BaseModel):
+    service_type: str = Field(..., min_length=1)
+    zip_code: str = Field(..., min_length=3)
+
+
+class DiscoveryBatchRequest(BaseModel):
+    items: list[DiscoveryBatchItem] = Field(default_factory=list)
+    # Item constraints match DiscoveryBatchItem, so bad values are rejected
+    # with a 422 here rather than when the items are expanded.
+    service_types: list[Annotated[str, Field(min_length=1)]] = Field(
+        default_factory=list,
+        description="Combined with zip_codes into one item per (service, ZIP) pair.",
+    )
+    zip_codes: list[Annotated[str, Field(min_length=3)]] = Field(default_factory=list)
+    target_contractor_count: int = Field(default=5, ge=1, le=20)
+    vet_all_candidates: bool = False
+    priority: JobPriority = JobPriority.normal
+
+    def expanded_items(self) -> list[DiscoveryBatchItem]:
+        items = list(self.items)
+        items.extend(
+            DiscoveryBatchItem(service_type=service_type, zip_code=zip_code)
+            for service_type in self.service_types
+            for zip_code in self.zip_codes
+        )
+        return items
+
+
+class DiscoveryBatchItemStatus(BaseModel):
+    index: int
+    service_type: str
+    zip_code: str
+    status: JobStatus = JobStatus.queued
+    result: Optional[DiscoveryResult] = None
+    error: Optional[str] = None
+    duration_seconds: Optional[float] = None
+
+
+class DiscoveryBatchResponse(BaseModel):
+    batch_id: str
+    status: JobStatus
+    created_at: str
+    updated_at: str
+    target_contractor_count: int
+    vet_all_candidates: bool
+    items: list[DiscoveryBatchItemStatus] = Field(default_factory=list)
+    stats: dict[str, Any] = Field(default_factory=dict)
+    error: Optional[str] = None
+    queue_position: Optional[int] = None
+    estimated_start_at: Optional[str] = None
+
+
+class DiscoveryBatchCreated(BaseModel):
+    batch_id: str
+    status: JobStatus
+    item_count: int
+    queue_position: Optional[int] = None
+
+
+_job_store = create_job_store(DiscoveryJobResponse)
 _jobs_lock = asyncio.Lock()
 
+# Identical requests are coalesced: while a leader job runs, followers wait on
+# its future, and completed results are reused within the freshness window.
+_inflight_leaders: dict[str, str] = {}
+_leader_futures: dict[str, asyncio.Future] = {}
+_recent_results: dict[str, tuple[float, str]] = {}
+_result_reuse_seconds = env_float("DISCOVERY_RESULT_REUSE_SECONDS", 300.0)
+
 
 def _utcnow_iso() -> str:
     return datetime.now(tz=timezone.utc).isoformat()
 
 
-def _build_initial_state(payload: DiscoveryJobRequest) -> dict[str, Any]:
-    return {
-        "service_type": payload.service_type.strip() or "home improvement",
-        "target_contractor_count": payload.target_contractor_count,
-        "contractor_name": None,
-        "selected_contractor_index": payload.selected_contractor_index,
-        "zip_code": payload.zip_code.strip(),
-        "yelp_candidates": [],
-        "contractor_data": None,
-        "yelp_url": None,
-        "google_url": None,
-        "bbb_url": None,
-        "raw_yelp_data": None,
-        "raw_google_data": None,
-        "raw_bbb_data": None,
-        "raw_website_data": None,
-        "raw_synthesis_data": None,
-        "flags": [],
-    }
+def _request_key(payload: DiscoveryJobRequest) -> str:
+    # Priority only affects scheduling, so it does not split coalescing; a
+    # higher-priority follower promotes its queued leader instead.
+    normalized = payload.model_dump(exclude={"priority"})
+    normalized["service_type"] = payload.service_type.strip().lower()
+    normalized["zip_code"] = payload.zip_code.strip()
+    return json.dumps(normalized, sort_keys=True)
+
+
+def _fresh_result_job_id(request_key: str) -> Optional[str]:
+    if _result_reuse_seconds <= 0:
+        return None
+    now = time.monotonic()
+    if len(_recent_results) > 1024:
+        for key, (completed_at, _) in list(_recent_results.items()):
+            if now - completed_at > _result_reuse_seconds:
+                del _recent_results[key]
+    recent = _recent_results.get(request_key)
+    if recent is None:
+        return None
+    completed_at, job_id = recent
+    source_job = _job_store.get(job_id)
+    if (
+        now - completed_at > _result_reuse_seconds
+        or source_job is None
+        or source_job.status != JobStatus.completed
+    ):
+        _recent_results.pop(request_key, None)
+        return None
+    return job_id
+
+
+def _update_job(job_id: str, **changes: Any) -> DiscoveryJobResponse:
+    job = _job_store.get(job_id)
+    for field_name, value in changes.items():
+        setattr(job, field_name, value)
+    job.updated_at = _utcnow_iso()
+    _job_store.put(job)
+    return job
 
 
-def _run_discovery(payload: DiscoveryJobRequest) -> DiscoveryResult:
-    graph = build_discovery_vetting_graph()
-    final_state = graph.invoke(_build_initial_state(payload))
+def _build_initial_state(payload: DiscoveryJobRequest) -> dict[str, Any]:
+    return initial_agent_state(
+        payload.service_type,
+        payload.zip_code,
+        target_contractor_count=payload.target_contractor_count,
+        selected_contractor_index=payload.selected_contractor_index,
+        vet_all_candidates=payload.vet_all_candidates,
+    )
 
-    consolidated_summary = None
-    raw_synthesis = (final_state.get("raw_synthesis_data") or "").strip()
-    if raw_synthesis:
-        try:
-            consolidated_summary = json.loads(raw_synthesis)
-        except Exception:
-            logger.warning("Synthesis payload was not valid JSON for API response.")
 
+def _discovery_result(final_state: dict[str, Any]) -> DiscoveryResult:
     return DiscoveryResult(
-        consolidated_summary=consolidated_summary,
+        consolidated_summary=final_state.get("synthesis"),
+        candidate_summaries=list(final_state.get("candidate_summaries") or []),
+        ranked_candidates=list(final_state.get("ranked_candidates") or []),
         flags=list(final_state.get("flags") or []),
         selected_contractor_name=final_state.get("contractor_name"),
         selected_contractor_index=final_state.get("selected_contractor_index"),
@@ -102,35 +277,230 @@ def _run_discovery(payload: DiscoveryJobRequest) -> DiscoveryResult:
     )
 
 
-async def _execute_job(job_id: str, payload: DiscoveryJobRequest) -> None:
+async def _run_discovery(
+    payload: DiscoveryJobRequest,
+    on_node_update: Optional[Callable[[str, Any], None]] = None,
+) -> DiscoveryResult:
+    graph = get_discovery_vetting_graph()
+    final_state: dict[str, Any] = {}
+    with record_timings(JobTimings()) as timings:
+        async for mode, chunk in graph.astream(
+            _build_initial_state(payload), stream_mode=["updates", "values"]
+        ):
+            if mode == "values":
+                final_state = chunk
+            elif on_node_update is not None:
+                for node_name, update in chunk.items():
+                    on_node_update(node_name, update)
+    result = _discovery_result(final_state)
+    result.timings = timings.snapshot()
+    return result
+
+
+async def _execute_job(
+    job_id: str, request_key: str, payload: DiscoveryJobRequest
+) -> None:
+    channel = open_channel(job_id)
     async with _jobs_lock:
-        job = _jobs[job_id]
-        job.status = JobStatus.running
-        job.updated_at = _utcnow_iso()
+        _update_job(job_id, status=JobStatus.running)
+        future = _leader_futures[job_id]
+    channel.publish("status", {"job_id": job_id, "status": JobStatus.running})
+
+    def _publish_node_update(node_name: str, update: Any) -> None:
+        channel.publish("node", {"node": node_name, "update": update})
 
     try:
-        result = await asyncio.to_thread(_run_discovery, payload)
+        result = await _run_discovery(payload, on_node_update=_publish_node_update)
         async with _jobs_lock:
-            job = _jobs[job_id]
-            job.status = JobStatus.completed
-            job.result = result
-            job.updated_at = _utcnow_iso()
+            _update_job(job_id, status=JobStatus.completed, result=result)
+            # A throttled run is missing data only for now; the next identical
+            # request runs the pipeline again instead of reusing it.
+            if not was_throttled(result.flags):
+                _recent_results[request_key] = (time.monotonic(), job_id)
+            future.set_result(result)
+        channel.publish("completed", {"job_id": job_id, "result": result})
     except Exception as exc:
         logger.exception("Discovery job failed for job_id='%s'.", job_id)
         async with _jobs_lock:
-            job = _jobs[job_id]
-            job.status = JobStatus.failed
-            job.error = str(exc)
-            job.updated_at = _utcnow_iso()
+            _update_job(job_id, status=JobStatus.failed, error=str(exc))
+            future.set_exception(exc)
+            # Mark the exception as retrieved in case no follower attached.
+            future.exception()
+        channel.publish("failed", {"job_id": job_id, "error": str(exc)})
+    finally:
+        async with _jobs_lock:
+            if _inflight_leaders.get(request_key) == job_id:
+                del _inflight_leaders[request_key]
+            _leader_futures.pop(job_id, None)
+        close_channel(job_id)
+
+
+async def _follow_job(job_id: str, leader_future: asyncio.Future) -> None:
+    try:
+        result = await asyncio.shield(leader_future)
+        async with _jobs_lock:
+            _update_job(job_id, status=JobStatus.completed, result=result)
+    except Exception as exc:
+        async with _jobs_lock:
+            _update_job(job_id, status=JobStatus.failed, error=str(exc))
+
+
+# Batches are kept in memory only; finished ones beyond the retention limit
+# are dropped oldest first.
+_batches: OrderedDict[str, DiscoveryBatchResponse] = OrderedDict()
+_batch_progress: dict[str, BatchProgress] = {}
+_max_batch_items = env_int("DISCOVERY_BATCH_MAX_ITEMS", 500)
+_max_batches_retained = env_int("DISCOVERY_MAX_BATCHES_RETAINED", 100)
+
+
+def _retire_old_batches() -> None:
+    finished = [
+        batch_id
+        for batch_id, batch in _batches.items()
+        if batch.status in (JobStatus.completed, JobStatus.failed)
+    ]
+    for batch_id in finished[: max(0, len(finished) - _max_batches_retained)]:
+        del _batches[batch_id]
+
+
+async def _execute_batch(batch_id: str) -> None:
+    batch = _batches[batch_id]
+    progress = BatchProgress(len(batch.items), EnrichmentMemo())
+    _batch_progress[batch_id] = progress
+    batch.status = JobStatus.running
+    batch.updated_at = _utcnow_iso()
+
+    def _mark_started(index: int) -> None:
+        batch.items[index].status = JobStatus.running
+
+    items = [
+        {
+            "service_type": item.service_type,
+            "zip_code": item.zip_code,
+            "target_contractor_count": batch.target_contractor_count,
+            "vet_all_candidates": batch.vet_all_candidates,
+        }
+        for item in batch.items
+    ]
+    try:
+        async for outcome in run_discovery_batch(
+            items, progress=progress, on_item_started=_mark_started
+        ):
+            item_status = batch.items[outcome["index"]]
+            item_status.duration_seconds = round(outcome["duration_seconds"], 3)
+            if outcome["status"] == "completed":
+                item_status.status = JobStatus.completed
+                item_status.result = _discovery_result(outcome["final_state"])
+                item_status.result.timings = outcome.get("timings")
+            else:
+                item_status.status = JobStatus.failed
+                item_status.error = outcome["error"]
+            batch.updated_at = _utcnow_iso()
+        batch.status = JobStatus.completed
+    except Exception as exc:
+        logger.exception("Discovery batch failed for batch_id='%s'.", batch_id)
+        batch.status = JobStatus.failed
+        batch.error = str(exc)
+    finally:
+        batch.stats = progress.snapshot()
+        batch.updated_at = _utcnow_iso()
+        _batch_progress.pop(batch_id, None)
+        _retire_old_batches()
+
+
+async def _run_queued_job(job_id: str) -> None:
+    if job_id in _batches:
+        await _execute_batch(job_id)
+        return
+    async with _jobs_lock:
+        job = _job_store.get(job_id)
+    if job is None:
+        logger.warning("Queued job_id='%s' no longer exists; skipping.", job_id)
+        return
+    await _execute_job(job_id, _request_key(job.request), job.request)
+
+
+_scheduler = create_job_scheduler(_run_queued_job)
+
+Gauge("discovery_jobs_queued", "Discovery jobs waiting for a worker.").set_function(
+    lambda: _scheduler.stats()["queued"]
+)
+Gauge("discovery_jobs_running", "Discovery jobs currently running.").set_function(
+    lambda: _scheduler.stats()["running"]
+)
+
+
+def _client_id(request: Request) -> str:
+    client_id = request.headers.get("x-client-id", "").strip()
+    if client_id:
+        return client_id
+    return request.client.host if request.client else "anonymous"
+
+
+def _queue_estimate(queued_id: str) -> dict[str, Any]:
+    position = _scheduler.queue_position(queued_id)
+    if position is None:
+        return {}
+    start_in = _scheduler.estimated_start_seconds(position)
+    estimated_start_at = datetime.now(tz=timezone.utc) + timedelta(seconds=start_in)
+    return {
+        "queue_position": position,
+        "estimated_start_at": estimated_start_at.isoformat(),
+    }
+
+
+def _with_queue_estimate(job: DiscoveryJobResponse) -> DiscoveryJobResponse:
+    if job.status != JobStatus.queued:
+        return job
+    # Followers wait on their leader, so they inherit its status and place in
+    # the queue.
+    if job.shared_from_job_id:
+        leader = _job_store.get(job.shared_from_job_id)
+        if leader is not None and leader.status == JobStatus.running:
+            return job.model_copy(update={"status": JobStatus.running})
+    estimate = _queue_estimate(job.shared_from_job_id or job.job_id)
+    return job.model_copy(update=estimate) if estimate else job
 
 
 @app.get("/health")
-async def health() -> dict[str, str]:
-    return {"status": "ok"}
+async def health() -> dict[str, Any]:
+    return {
+        "status": "ok",
+        "graphs": graph_build_stats(),
+        "job_store": _job_store.stats(),
+        "blob_store": blob_store.stats(),
+        "vetting_records": vetting_records.stats(),
+        "scheduler": _scheduler.stats(),
+    }
+
+
+@app.get("/metrics")
+async def metrics() -> Response:
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+# Raw scraped pages referenced by results (BlobRef.digest). Blobs are content
+# addressed, so a digest always maps to the same bytes. A plain def, so the
+# file read and gunzip run in the threadpool rather than on the event loop.
+@app.get("/blobs/{digest}")
+def get_blob(digest: str) -> Response:
+    content = blob_store.get(digest)
+    if content is None:
+        raise HTTPException(status_code=404, detail="Blob not found")
+    return Response(
+        content=content,
+        media_type="text/markdown; charset=utf-8",
+        headers={
+            "Cache-Control": "public, max-age=31536000, immutable",
+            "ETag": f'"{digest}"',
+        },
+    )
 
 
 @app.post("/discovery/jobs", response_model=DiscoveryJobCreated)
-async def create_discovery_job(payload: DiscoveryJobRequest) -> DiscoveryJobCreated:
+async def create_discovery_job(
+    payload: DiscoveryJobRequest, request: Request
+) -> DiscoveryJobCreated:
     job_id = str(uuid.uuid4())
     now = _utcnow_iso()
     job = DiscoveryJobResponse(
@@ -141,17 +511,211 @@ async def create_discovery_job(payload: DiscoveryJobRequest) -> DiscoveryJobCrea
         request=payload,
     )
 
-    async with _jobs_lock:
-        _jobs[job_id] = job
+    request_key = _request_key(payload)
 
-    asyncio.create_task(_execute_job(job_id, payload))
-    return DiscoveryJobCreated(job_id=job_id, status=JobStatus.queued)
+    async with _jobs_lock:
+        fresh_job_id = _fresh_result_job_id(request_key)
+        if fresh_job_id is not None:
+            job.status = JobStatus.completed
+            job.result = _job_store.get(fresh_job_id).result
+            job.shared_from_job_id = fresh_job_id
+            _job_store.put(job)
+            logger.info(
+                "Reusing result of job_id='%s' for job_id='%s'.", fresh_job_id, job_id
+            )
+            return DiscoveryJobCreated(
+                job_id=job_id,
+                status=JobStatus.completed,
+                shared_from_job_id=fresh_job_id,
+            )
+
+        queue_position = None
+        leader_job_id = _inflight_leaders.get(request_key)
+        if leader_job_id is not None:
+            job.shared_from_job_id = leader_job_id
+            leader_future = _leader_futures[leader_job_id]
+            _job_store.put(job)
+            # The follower waits on the leader, so a still-queued leader is
+            # moved up to the follower's priority class if that is higher.
+            queue_position = _scheduler.promote(leader_job_id, payload.priority.value)
+        else:
+            client_id = _client_id(request)
+            try:
+                _scheduler.check_admission(client_id)
+            except QueueFullError as exc:
+                logger.warning(
+                    "Rejecting discovery job from client='%s': %s", client_id, exc
+                )
+                raise HTTPException(
+                    status_code=429,
+                    detail=str(exc),
+                    headers={"Retry-After": str(int(exc.retry_after_seconds))},
+                )
+            _inflight_leaders[request_key] = job_id
+            _leader_futures[job_id] = asyncio.get_running_loop().create_future()
+            _job_store.put(job)
+            queue_position = _scheduler.submit(job_id, client_id, payload.priority.value)
+            open_channel(job_id).publish(
+                "status",
+                {
+                    "job_id": job_id,
+                    "status": JobStatus.queued,
+                    "queue_position": queue_position,
+                },
+            )
+
+    if leader_job_id is not None:
+        logger.info(
+            "Attaching job_id='%s' to in-flight job_id='%s'.", job_id, leader_job_id
+        )
+        asyncio.create_task(_follow_job(job_id, leader_future))
+    return DiscoveryJobCreated(
+        job_id=job_id,
+        status=JobStatus.queued,
+        shared_from_job_id=leader_job_id,
+        queue_position=queue_position,
+    )
 
 
 @app.get("/discovery/jobs/{job_id}", response_model=DiscoveryJobResponse)
 async def get_discovery_job(job_id: str) -> DiscoveryJobResponse:
     async with _jobs_lock:
-        job = _jobs.get(job_id)
+        job = _job_store.get(job_id)
         if job is None:
             raise HTTPException(status_code=404, detail="Job not found")
-        return job
+        return _with_queue_estimate(job)
+
+
+def _last_event_id(request: Request) -> int:
+    raw_value = request.headers.get("last-event-id", "").strip()
+    try:
+        return int(raw_value)
+    except ValueError:
+        return -1
+
+
+async def _job_event_stream(
+    job: DiscoveryJobResponse,
+    channel: Optional[JobEventChannel],
+    last_event_id: int,
+    request: Request,
+) -> AsyncIterator[str]:
+    if channel is None:
+        # No live channel (result reused or channel already retired), so
+        # report the stored outcome as a single event.
+        if job.status == JobStatus.completed:
+            yield format_sse(
+                0, "completed", {"job_id": job.job_id, "result": job.result.model_dump()}
+            )
+        elif job.status == JobStatus.failed:
+            yield format_sse(0, "failed", {"job_id": job.job_id, "error": job.error})
+        else:
+            yield format_sse(0, "status", {"job_id": job.job_id, "status": job.status.value})
+        return
+
+    async for item in channel.subscribe(last_event_id):
+        if await request.is_disconnected():
+            return
+        if item is None:
+            yield ": keep-alive\n\n"
+        else:
+            yield format_sse(*item)
+
+
+@app.get("/discovery/jobs/{job_id}/events")
+async def stream_discovery_job_events(job_id: str, request: Request) -> StreamingResponse:
+    async with _jobs_lock:
+        job = _job_store.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+    # Followers share their leader's pipeline run, and therefore its events.
+    channel = get_channel(job_id)
+    if channel is None and job.shared_from_job_id:
+        channel = get_channel(job.shared_from_job_id)
+    return StreamingResponse(
+        _job_event_stream(job, channel, _last_event_id(request), request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/discovery/batches", response_model=DiscoveryBatchCreated)
+async def create_discovery_batch(
+    payload: DiscoveryBatchRequest, request: Request
+) -> DiscoveryBatchCreated:
+    items = payload.expanded_items()
+    if not items:
+        raise HTTPException(
+            status_code=422, detail="Batch needs items or service_types x zip_codes."
+        )
+    if len(items) > _max_batch_items:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Batch has {len(items)} items; the limit is {_max_batch_items}.",
+        )
+
+    batch_id = str(uuid.uuid4())
+    now = _utcnow_iso()
+    batch = DiscoveryBatchResponse(
+        batch_id=batch_id,
+        status=JobStatus.queued,
+        created_at=now,
+        updated_at=now,
+        target_contractor_count=payload.target_contractor_count,
+        vet_all_candidates=payload.vet_all_candidates,
+        items=[
+            DiscoveryBatchItemStatus(
+                index=index,
+                service_type=item.service_type.strip(),
+                zip_code=item.zip_code.strip(),
+            )
+            for index, item in enumerate(items)
+        ],
+    )
+
+    # A batch occupies one scheduler slot and runs its items with
+    # DISCOVERY_BATCH_PARALLEL_ITEMS concurrency inside that slot.
+    client_id = _client_id(request)
+    async with _jobs_lock:
+        try:
+            _scheduler.check_admission(client_id)
+        except QueueFullError as exc:
+            logger.warning(
+                "Rejecting discovery batch from client='%s': %s", client_id, exc
+            )
+            raise HTTPException(
+                status_code=429,
+                detail=str(exc),
+                headers={"Retry-After": str(int(exc.retry_after_seconds))},
+            )
+        _batches[batch_id] = batch
+        queue_position = _scheduler.submit(batch_id, client_id, payload.priority.value)
+
+    logger.info("Queued discovery batch_id='%s' with %d items.", batch_id, len(items))
+    return DiscoveryBatchCreated(
+        batch_id=batch_id,
+        status=JobStatus.queued,
+        item_count=len(items),
+        queue_position=queue_position,
+    )
+
+
+@app.get("/discovery/batches/{batch_id}", response_model=DiscoveryBatchResponse)
+async def get_discovery_batch(
+    batch_id: str, include_results: bool = True
+) -> DiscoveryBatchResponse:
+    batch = _batches.get(batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+
+    update: dict[str, Any] = {}
+    progress = _batch_progress.get(batch_id)
+    if progress is not None:
+        update["stats"] = progress.snapshot()
+    if batch.status == JobStatus.queued:
+        update.update(_queue_estimate(batch_id))
+    if not include_results:
+        update["items"] = [
+            item.model_copy(update={"result": None}) for item in batch.items
+        ]
+    return batch.model_copy(update=update) if update else batch
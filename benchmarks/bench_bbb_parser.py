@@ -0,0 +1,109 @@
+"""Benchmark the rule-based BBB parser on synthetic BBB result blocks.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_bbb_parser [--blocks 2000]
+
+Generates BBB search-result and profile-style blocks with known grade,
+accreditation and complaint counts in a few phrasings, then reports how many
+fields tools.bbb_parser recovers exactly for the named contractor, parse time
+per block, and how many BBB tokens are still sent to the summarization model.
+"""
+
+import argparse
+import random
+import time
+
+from tools.bbb_parser import parse_bbb_markdown
+from tools.text_compressor import estimate_tokens
+
+GRADES = ["A+", "A", "A-", "B+", "B", "B-", "C", "D", "F", "NR"]
+FIELDS = ("rating", "accredited", "complaints_last_3_years", "complaints_last_12_months")
+
+
+def build_block(rng: random.Random, index: int) -> tuple[str, dict]:
+    slug = f"contractor-{index}"
+    url = f"https://www.bbb.org/us/tx/austin/profile/roofing-contractors/{slug}-0825-{index}"
+    expected = {
+        "rating": rng.choice(GRADES),
+        "accredited": rng.random() < 0.6,
+        "complaints_last_3_years": rng.randint(0, 40),
+        "complaints_last_12_months": rng.randint(0, 10),
+    }
+    lines = [f"## [Contractor {index} LLC]({url})", "Roofing Contractors"]
+    lines.append(
+        rng.choice(["BBB Rating: {}", "BBB Rating {}", "BBB rating is {}"]).format(
+            expected["rating"]
+        )
+    )
+    if expected["accredited"]:
+        lines.append(
+            rng.choice(
+                [
+                    "![BBB Accredited Business](https://www.bbb.org/seal.png)",
+                    "Accredited Business",
+                    f"BBB Accredited Since: {rng.randint(1, 12)}/{rng.randint(1995, 2023)}",
+                ]
+            )
+        )
+    else:
+        lines.append(rng.choice(["This business is not BBB accredited.", "Not accredited"]))
+    if rng.random() < 0.5:
+        lines.append(
+            f"{expected['complaints_last_3_years']} complaints closed in last 3 years"
+        )
+        lines.append(
+            f"{expected['complaints_last_12_months']} complaints closed in last 12 months"
+        )
+    else:
+        lines.append(
+            f"Total Complaints in the last 3 years: {expected['complaints_last_3_years']}"
+        )
+        lines.append(
+            f"Complaints in the last 12 months: {expected['complaints_last_12_months']}"
+        )
+    lines.append(f"({rng.randint(200, 999)}) 555-{rng.randint(1000, 9999)}")
+    lines.append(f"{rng.randint(100, 9999)} Main St, Austin, TX 78701")
+    lines.append(
+        "Customer Reviews: customers mention "
+        + rng.choice(["slow callbacks", "clean job sites", "billing disputes", "fair quotes"])
+        + "."
+    )
+    lines.append(f"[More info]({url})")
+    return "\n".join(lines), expected
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--blocks", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    samples = [build_block(rng, index) for index in range(args.blocks)]
+
+    correct = dict.fromkeys(FIELDS, 0)
+    raw_tokens = free_tokens = 0
+    started = time.perf_counter()
+    parsed = [
+        parse_bbb_markdown(block, f"Contractor {index}")
+        for index, (block, _) in enumerate(samples)
+    ]
+    elapsed = time.perf_counter() - started
+
+    for (block, expected), (profile, free_text) in zip(samples, parsed):
+        raw_tokens += estimate_tokens(block)
+        free_tokens += estimate_tokens(free_text)
+        for field in FIELDS:
+            if profile is not None and getattr(profile, field) == expected[field]:
+                correct[field] += 1
+
+    print(f"blocks: {args.blocks}")
+    for field in FIELDS:
+        print(f"  {field:<28} {correct[field]:>6}/{args.blocks}")
+    print(f"parse time: {elapsed / args.blocks * 1e6:.1f} us/block")
+    print(f"BBB tokens to the model: {raw_tokens} raw -> {free_tokens} after parsing")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark Google listing field extraction on synthetic Maps listing blocks.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_google_fields [--blocks 2000]
+
+Generates listing blocks with known rating, review count, category, phone
+and address in the formats Maps markdown uses ("4.6(123)", "4.6 (1.2K)",
+"No reviews", hours and phone on one line or separate lines), followed by
+review snippets. Reports exact-field accuracy of tools.google_listing, mean
+confidence, parse time per block and Google tokens left for the model.
+"""
+
+import argparse
+import random
+import time
+
+from tools.google_listing import parse_google_listing
+from tools.text_compressor import estimate_tokens
+
+STREETS = ["Main St", "Oak Ave", "Maple Dr", "Pine Rd", "Cedar Ln", "Elm Blvd"]
+CATEGORIES = ["Roofing contractor", "Plumber", "Electrician", "General contractor"]
+REVIEWS = [
+    '"They replaced our roof in two days and cleaned up everything."',
+    '"Quote was fair but scheduling took three weeks."',
+    '"Great communication, would hire again."',
+    '"Crew left nails in the driveway."',
+]
+FIELDS = ("rating", "review_count", "category", "phone", "address")
+
+
+def _format_count(count: int) -> str:
+    return f"{count / 1000:.1f}K" if count >= 1000 else f"{count:,}"
+
+
+def build_block(rng: random.Random, index: int) -> tuple[str, dict]:
+    expected = {
+        "rating": round(rng.uniform(1.0, 5.0), 1),
+        "review_count": rng.choice([rng.randint(1, 999), rng.randint(1, 9) * 1000 + 100]),
+        "category": rng.choice(CATEGORIES),
+        "phone": f"({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+        "address": f"{rng.randint(10, 9999)} {rng.choice(STREETS)}",
+    }
+    if expected["review_count"] >= 1000:
+        expected["review_count"] = int(round(expected["review_count"] / 100) * 100)
+    count = _format_count(expected["review_count"])
+    lines = [f"[Contractor {index}](https://www.google.com/maps/place/Contractor+{index}/data=!{index})"]
+    lines.append(rng.choice([f"{expected['rating']}({count})", f"{expected['rating']} ({count})"]))
+    lines.append(f"{expected['category']} · {expected['address']}")
+    if rng.random() < 0.5:
+        lines.append(f"Open · Closes {rng.randint(4, 9)} PM · {expected['phone']}")
+    else:
+        lines.append("Closed · Opens 8 AM Mon")
+        lines.append(expected["phone"])
+    lines.extend(rng.sample(REVIEWS, rng.randint(1, len(REVIEWS))))
+    return "\n".join(lines), expected
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--blocks", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    samples = [build_block(rng, index) for index in range(args.blocks)]
+
+    started = time.perf_counter()
+    parsed = [parse_google_listing(block) for block, _ in samples]
+    elapsed = time.perf_counter() - started
+
+    correct = dict.fromkeys(FIELDS, 0)
+    confidence = raw_tokens = free_tokens = 0.0
+    for (block, expected), (listing, free_text) in zip(samples, parsed):
+        raw_tokens += estimate_tokens(block)
+        free_tokens += estimate_tokens(free_text)
+        confidence += listing.confidence
+        for field in FIELDS:
+            if getattr(listing, field) == expected[field]:
+                correct[field] += 1
+
+    print(f"blocks: {args.blocks}")
+    for field in FIELDS:
+        print(f"  {field:<14} {correct[field]:>6}/{args.blocks}")
+    print(f"mean confidence: {confidence / args.blocks:.2f}")
+    print(f"parse time: {elapsed / args.blocks * 1e6:.1f} us/block")
+    print(f"Google tokens to the model: {raw_tokens:.0f} raw -> {free_tokens:.0f} after parsing")
+
+
+if __name__ == "__main__":
+    main()
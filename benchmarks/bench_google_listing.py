@@ -0,0 +1,223 @@
+"""Benchmark the Google Maps listing matcher on synthetic result pages.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_google_listing [--listings 2000] [--queries 50]
+
+The original substring scorer is kept here as the reference. Both are timed
+on the same page and scored on how often they pick the intended listing:
+exact names, near-miss names ("A.C.M.E. Roofing LLC" vs "Acme Roofing"),
+phone only, and businesses that are not on the page, where the right answer
+is no match.
+"""
+
+import argparse
+import os
+import random
+import re
+import time
+
+os.environ.setdefault("FIRECRAWL_API_KEY", "benchmark")
+
+from tools.firecrawl_tool import (  # noqa: E402
+    GOOGLE_LISTING_MAX_LINES,
+    _is_google_listing_start,
+    _split_result_blocks,
+)
+from tools.matching import TrigramIndex  # noqa: E402
+
+STREETS = ["Main St", "Oak Ave", "Maple Dr", "Pine Rd", "Cedar Ln", "Elm Blvd"]
+TRADES = ["Roofing", "Plumbing", "Electric", "Landscaping", "HVAC", "Painting"]
+WORDS = ["Acme", "Summit", "Blue Sky", "O'Neil & Sons", "Peak", "Río", "Hometown", "A+"]
+QUERY_KINDS = (
+    "name+phone+address",
+    "exact name",
+    "near-miss name",
+    "phone only",
+    "not on page",
+)
+
+
+def _reference_normalize_text(text: str) -> str:
+    return re.sub(r"\s+", " ", re.sub(r"[^a-z0-9 ]+", " ", (text or "").lower())).strip()
+
+
+def _reference_digits_only(text: str) -> str:
+    return re.sub(r"\D+", "", text or "")
+
+
+def reference_extract_google_listing_block(
+    raw_content: str,
+    contractor_name: str,
+    expected_phone: str | None = None,
+    expected_address: str | None = None,
+) -> str:
+    lines = [line.strip() for line in raw_content.splitlines()]
+    listing_starts = [
+        idx
+        for idx, line in enumerate(lines)
+        if line.startswith("[")
+        and "(https://www.google.com/maps/place/" in line
+    ]
+    if not listing_starts:
+        return ""
+
+    normalized_name = _reference_normalize_text(contractor_name)
+    phone_digits = _reference_digits_only(expected_phone or "")
+    address_tokens = [
+        token
+        for token in _reference_normalize_text(expected_address or "").split()
+        if len(token) >= 4
+    ]
+
+    best_score = -1
+    best_block = ""
+    for start in listing_starts:
+        end = min(start + 14, len(lines))
+        block_lines = [line for line in lines[start:end] if line]
+        if not block_lines:
+            continue
+        block_text = "\n".join(block_lines)
+        normalized_block = _reference_normalize_text(block_text)
+        score = 0
+        if normalized_name and normalized_name in normalized_block:
+            score += 3
+        if phone_digits and phone_digits in _reference_digits_only(block_text):
+            score += 2
+        if address_tokens and any(token in normalized_block for token in address_tokens):
+            score += 1
+
+        if score > best_score:
+            best_score = score
+            best_block = block_text
+
+    return best_block if best_score > 0 else ""
+
+
+def current_extract_google_listing_block(
+    raw_content: str,
+    contractor_name: str,
+    expected_phone: str | None = None,
+    expected_address: str | None = None,
+) -> str:
+    # The Google path of tools.firecrawl_tool._filter_google_content, minus
+    # logging and the raw-content fallback for pages without listings.
+    listings = _split_result_blocks(
+        raw_content, _is_google_listing_start, GOOGLE_LISTING_MAX_LINES
+    )
+    match = TrigramIndex(listings).best_match(
+        contractor_name, phone=expected_phone, address=expected_address
+    )
+    return match.text if match else ""
+
+
+def _business(rng: random.Random, idx: int) -> dict[str, str]:
+    return {
+        "name": f"{rng.choice(WORDS)} {rng.choice(TRADES)} {idx}",
+        "phone": f"({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+        "address": f"{rng.randint(1, 9999)} {rng.choice(STREETS)}, Springfield",
+    }
+
+
+def build_results_page(rng: random.Random, listing_count: int) -> tuple[str, list[dict]]:
+    businesses = [_business(rng, idx) for idx in range(listing_count)]
+    lines = ["# Results", "", "Sponsored", ""]
+    for business in businesses:
+        slug = business["name"].replace(" ", "+")
+        lines.append(
+            f"[{business['name']}](https://www.google.com/maps/place/{slug}/data=!4m7)"
+        )
+        # Listings vary in length so windows straddle neighbouring blocks.
+        for _ in range(rng.randint(0, 3)):
+            lines.append("")
+        lines.append(f"{rng.randint(30, 50) / 10} ({rng.randint(1, 900)})")
+        lines.append(f"{rng.choice(TRADES)} contractor · {business['address']}")
+        lines.append(f"Open · Closes 5 PM · {business['phone']}")
+        lines.append("   Website   Directions   ")
+        for _ in range(rng.randint(2, 8)):
+            lines.append(f'"{rng.choice(WORDS)} did great work on our {rng.choice(TRADES).lower()}"')
+    return "\n".join(lines), businesses
+
+
+def _near_miss(name: str) -> str:
+    # "Acme Roofing 12" -> "A.C.M.E. Roofing 12 LLC"
+    first, _, rest = name.partition(" ")
+    if first.isalpha() and len(first) <= 4:
+        first = ".".join(first.upper()) + "."
+    return f"{first} {rest} LLC"
+
+
+def build_queries(rng: random.Random, businesses: list[dict], query_count: int) -> list[tuple]:
+    # (kind, expected title or None, name, phone, address)
+    queries = []
+    for query_idx in range(query_count):
+        business = rng.choice(businesses)
+        title = f"[{business['name']}]"
+        kind = QUERY_KINDS[query_idx % len(QUERY_KINDS)]
+        if kind == "name+phone+address":
+            queries.append((kind, title, business["name"], business["phone"], business["address"]))
+        elif kind == "exact name":
+            queries.append((kind, title, business["name"], None, None))
+        elif kind == "near-miss name":
+            queries.append((kind, title, _near_miss(business["name"]), None, None))
+        elif kind == "phone only":
+            queries.append((kind, title, "Unknown Contractor", business["phone"], None))
+        else:
+            queries.append((kind, None, "Nobody Here", "555-0000", "1 Nowhere Pl"))
+    return queries
+
+
+def _is_correct(block: str, expected_title: str | None) -> bool:
+    if expected_title is None:
+        return block == ""
+    return block.startswith(expected_title + "(")
+
+
+def _evaluate(fn, page: str, queries, repeat: int) -> tuple[float, dict[str, list[int]]]:
+    best = float("inf")
+    correct: dict[str, list[int]] = {}
+    for _ in range(repeat):
+        correct = {kind: [0, 0] for kind in QUERY_KINDS}
+        started = time.perf_counter()
+        for kind, expected_title, name, phone, address in queries:
+            block = fn(page, name, expected_phone=phone, expected_address=address)
+            correct[kind][0] += _is_correct(block, expected_title)
+            correct[kind][1] += 1
+        best = min(best, time.perf_counter() - started)
+    return best, correct
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--listings", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    page, businesses = build_results_page(rng, args.listings)
+    queries = build_queries(rng, businesses, args.queries)
+
+    reference_seconds, reference_correct = _evaluate(
+        reference_extract_google_listing_block, page, queries, args.repeat
+    )
+    current_seconds, current_correct = _evaluate(
+        current_extract_google_listing_block, page, queries, args.repeat
+    )
+    print(
+        f"page: {args.listings} listings, {len(page.splitlines())} lines, "
+        f"{len(page) / 1024:.0f} KiB, {len(queries)} queries"
+    )
+    print(f"reference: {reference_seconds / len(queries) * 1000:.2f} ms/query")
+    print(f"current:   {current_seconds / len(queries) * 1000:.2f} ms/query")
+    print(f"speedup:   {reference_seconds / current_seconds:.1f}x")
+    print("correct listing (reference / current):")
+    for kind in QUERY_KINDS:
+        reference_hits, total = reference_correct[kind]
+        current_hits, _ = current_correct[kind]
+        print(f"  {kind:<20} {reference_hits:>4}/{total:<4} {current_hits:>4}/{total}")
+
+
+if __name__ == "__main__":
+    main()
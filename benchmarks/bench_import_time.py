@@ -0,0 +1,87 @@
+"""Cold import time of the package entry points.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_import_time [--repeat 5] [--budget-ms 400]
+
+Each target is imported in a fresh interpreter, so nothing is shared between
+measurements; the best of --repeat runs is reported. With --budget-ms the
+script exits non-zero when a light target (anything but the API server and
+the graph) goes over budget, so it can guard against an SDK creeping back
+into a top-level import.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+# (label, code run in the child interpreter, counts against --budget-ms)
+TARGETS = [
+    ("tools", "import tools", True),
+    ("tools.matching", "import tools.matching", True),
+    ("tools.firecrawl_tool", "import tools.firecrawl_tool", True),
+    ("tools.llm_tool", "import tools.llm_tool", True),
+    ("schema", "import schema", True),
+    ("workflows", "import workflows", True),
+    ("workflows graph", "import workflows.discovery_vetting_graph", False),
+    ("api.server", "import api.server", False),
+]
+
+
+def _child_env() -> dict[str, str]:
+    env = dict(os.environ)
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (repo_root, env.get("PYTHONPATH")) if path
+    )
+    env.setdefault("FIRECRAWL_API_KEY", "benchmark")
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    return env
+
+
+def _measure(code: str, env: dict[str, str]) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+    return time.perf_counter() - started
+
+
+def _heavy_modules(code: str, env: dict[str, str]) -> list[str]:
+    probe = (
+        f"{code}\nimport sys\n"
+        "print(' '.join(m for m in ('firecrawl', 'openai', 'langgraph', 'fastapi')"
+        " if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe], env=env, check=True, capture_output=True, text=True
+    )
+    return result.stdout.split()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, help="fail if a light target exceeds this")
+    args = parser.parse_args()
+
+    env = _child_env()
+    baseline = min(_measure("pass", env) for _ in range(args.repeat))
+    over_budget = []
+    print(f"bare interpreter: {baseline * 1000:.1f} ms")
+    print(f"{'target':<24} {'ms':>8} {'over python':>12}  heavy SDKs loaded")
+    for label, code, budgeted in TARGETS:
+        best = min(_measure(code, env) for _ in range(args.repeat))
+        extra_ms = (best - baseline) * 1000
+        heavy = ", ".join(_heavy_modules(code, env)) or "-"
+        print(f"{label:<24} {best * 1000:>8.1f} {extra_ms:>12.1f}  {heavy}")
+        if budgeted and args.budget_ms is not None and extra_ms > args.budget_ms:
+            over_budget.append(label)
+
+    if over_budget:
+        print(f"over the {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
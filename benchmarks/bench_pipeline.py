@@ -0,0 +1,303 @@
+"""End-to-end pipeline benchmark against the fake Firecrawl and OpenAI clients.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_pipeline [--invocations 40] [--concurrency 8]
+        [--vet-all] [--api-jobs 40] [--output run.json] [--compare base.json]
+
+Measures graph invocations per second, per-node latency percentiles, API job
+throughput under concurrent POSTs, and peak RSS. Upstream latency, error
+rate and payload size come from benchmarks.fakes and are fixed by the
+command-line options and seed, so two runs with the same options on
+different commits are comparable: --output saves a run, and --compare prints
+the change against a saved one.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime
+
+# Caches would turn repeated runs into cache benchmarks, and the default rate
+# limits would cap throughput at the upstream quotas; both are set before the
+# tool modules read them.
+os.environ.setdefault("FIRECRAWL_API_KEY", "benchmark")
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("SCRAPE_CACHE_DISABLED", "1")
+os.environ.setdefault("LLM_CACHE_DISABLED", "1")
+os.environ.setdefault("VETTING_RECORDS_DISABLED", "1")
+os.environ.setdefault("JOB_STORE_BACKEND", "memory")
+os.environ.setdefault("BLOB_STORE_PATH", tempfile.mkdtemp(prefix="bench-blobs-"))
+os.environ.setdefault("RATE_LIMIT_BACKOFF_SECONDS", "0.05")
+
+import httpx  # noqa: E402
+
+from benchmarks.fakes import FakeConfig, install_fakes  # noqa: E402
+
+# Lower is better for these; everything else compared is a throughput.
+LOWER_IS_BETTER = ("latency", "rss", "seconds", "bytes")
+
+
+def _percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def at(fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    return {
+        "p50_ms": round(at(0.50) * 1000, 2),
+        "p90_ms": round(at(0.90) * 1000, 2),
+        "p99_ms": round(at(0.99) * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2),
+        "count": len(ordered),
+    }
+
+
+def _peak_rss_mib() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def _timestamp_seconds(event: dict) -> float:
+    return datetime.fromisoformat(event["timestamp"]).timestamp()
+
+
+async def bench_graph(args) -> dict:
+    from workflows.discovery_vetting_graph import get_discovery_vetting_graph
+    from workflows.state import initial_agent_state
+
+    graph = get_discovery_vetting_graph()
+    node_seconds: dict[str, list[float]] = defaultdict(list)
+    invocation_seconds: list[float] = []
+    failures = 0
+    slots = asyncio.Semaphore(args.concurrency)
+
+    async def invoke(index: int) -> None:
+        nonlocal failures
+        state = initial_agent_state(
+            args.service_type,
+            str(10000 + index),
+            vet_all_candidates=args.vet_all,
+        )
+        task_started: dict[str, float] = {}
+        async with slots:
+            started = time.perf_counter()
+            try:
+                # Debug events carry a timestamp when each node task is
+                # scheduled and when it finishes.
+                async for event in graph.astream(state, stream_mode="debug"):
+                    payload = event.get("payload") or {}
+                    if event.get("type") == "task":
+                        task_started[payload["id"]] = _timestamp_seconds(event)
+                    elif event.get("type") == "task_result":
+                        begun = task_started.pop(payload["id"], None)
+                        if begun is not None:
+                            node_seconds[payload["name"]].append(
+                                _timestamp_seconds(event) - begun
+                            )
+            except Exception:
+                failures += 1
+            invocation_seconds.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(invoke(index) for index in range(args.invocations)))
+    elapsed = time.perf_counter() - started
+    return {
+        "invocations": args.invocations,
+        "failed_invocations": failures,
+        "elapsed_seconds": round(elapsed, 3),
+        "invocations_per_second": round(args.invocations / elapsed, 3),
+        "invocation_latency": _percentiles(invocation_seconds),
+        "node_latency": {
+            name: _percentiles(values) for name, values in sorted(node_seconds.items())
+        },
+        "peak_rss_mib": _peak_rss_mib(),
+    }
+
+
+async def bench_api(args) -> dict:
+    from api import server
+
+    transport = httpx.ASGITransport(app=server.app)
+    post_seconds: list[float] = []
+
+    async def post(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        started = time.perf_counter()
+        response = await client.post(
+            "/discovery/jobs",
+            json={
+                "service_type": args.service_type,
+                "zip_code": str(20000 + index),
+                "vet_all_candidates": args.vet_all,
+            },
+            headers={"X-Client-Id": f"bench-{index % args.api_clients}"},
+        )
+        post_seconds.append(time.perf_counter() - started)
+        return response
+
+    async with server.app.router.lifespan_context(server.app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            started = time.perf_counter()
+            responses = await asyncio.gather(
+                *(post(client, index) for index in range(args.api_jobs))
+            )
+            pending = {
+                response.json()["job_id"]
+                for response in responses
+                if response.status_code == 200
+            }
+            rejected = sum(1 for response in responses if response.status_code == 429)
+            accepted = len(pending)
+            statuses: dict[str, int] = defaultdict(int)
+            result_bytes: list[float] = []
+            while pending:
+                await asyncio.sleep(0.05)
+                for job_id in list(pending):
+                    response = await client.get(f"/discovery/jobs/{job_id}")
+                    job = response.json()
+                    if job["status"] in {"completed", "failed"}:
+                        statuses[job["status"]] += 1
+                        result_bytes.append(len(response.content))
+                        pending.discard(job_id)
+            elapsed = time.perf_counter() - started
+
+    return {
+        "jobs": args.api_jobs,
+        "accepted": accepted,
+        "rejected": rejected,
+        "completed": statuses["completed"],
+        "failed": statuses["failed"],
+        "elapsed_seconds": round(elapsed, 3),
+        "jobs_per_second": round(accepted / elapsed, 3) if elapsed > 0 else 0.0,
+        "post_latency": _percentiles(post_seconds),
+        "mean_job_response_bytes": round(sum(result_bytes) / len(result_bytes))
+        if result_bytes
+        else 0,
+        "peak_rss_mib": _peak_rss_mib(),
+    }
+
+
+def _flatten(results: dict, prefix: str = "") -> dict[str, float]:
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def print_comparison(current: dict, baseline: dict) -> None:
+    if current.get("config") != baseline.get("config"):
+        print("warning: runs used different options; deltas are not comparable")
+    print(f"\ncompared with {baseline.get('revision', '?')}:")
+    base = _flatten(baseline.get("results", {}))
+    for name, value in _flatten(current["results"]).items():
+        if name not in base or name.endswith("count") or not base[name]:
+            continue
+        change = (value - base[name]) / base[name] * 100
+        worse = change > 0 if any(part in name for part in LOWER_IS_BETTER) else change < 0
+        marker = "  (worse)" if worse and abs(change) >= 5 else ""
+        print(f"  {name:<48} {base[name]:>10} -> {value:<10} {change:+6.1f}%{marker}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--invocations", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--vet-all", action="store_true")
+    parser.add_argument("--service-type", default="roofing")
+    parser.add_argument("--api-jobs", type=int, default=40, help="0 skips the API phase")
+    parser.add_argument("--api-clients", type=int, default=4)
+    parser.add_argument("--firecrawl-latency-ms", type=float, default=50.0)
+    parser.add_argument("--openai-latency-ms", type=float, default=400.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--payload-scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--real-limits",
+        action="store_true",
+        help="keep the configured rate limits instead of lifting them",
+    )
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--compare", help="JSON from an earlier --output run")
+    args = parser.parse_args()
+
+    if not args.real_limits:
+        for api in ("SCRAPE", "EXTRACT", "OPENAI"):
+            os.environ.setdefault(f"RATE_LIMIT_{api}_RPS", "100000")
+            os.environ.setdefault(f"RATE_LIMIT_{api}_MAX_IN_FLIGHT", "100000")
+
+    def fake_config(latency_ms: float) -> FakeConfig:
+        return FakeConfig(
+            latency_ms=latency_ms,
+            error_rate=args.error_rate,
+            payload_scale=args.payload_scale,
+            seed=args.seed,
+        )
+
+    logging.basicConfig(level=args.log_level)
+    logging.getLogger().setLevel(args.log_level)
+    fakes = install_fakes(
+        firecrawl=fake_config(args.firecrawl_latency_ms),
+        openai=fake_config(args.openai_latency_ms),
+    )
+
+    results = {"graph": asyncio.run(bench_graph(args))}
+    if args.api_jobs:
+        results["api"] = asyncio.run(bench_api(args))
+    results["upstream_calls"] = {
+        "firecrawl": fakes["async_firecrawl"].stats(),
+        "openai": fakes["async_openai"].stats(),
+    }
+    results["peak_rss_mib"] = _peak_rss_mib()
+
+    config = {
+        key: value
+        for key, value in vars(args).items()
+        if key not in {"output", "compare"}
+    }
+    run = {
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "config": config,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(run, handle, indent=2)
+    print(json.dumps(run, indent=2))
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            print_comparison(run, json.load(handle))
+
+
+if __name__ == "__main__":
+    main()
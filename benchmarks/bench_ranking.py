@@ -0,0 +1,91 @@
+"""Benchmark candidate ranking on synthetic vetted contractors.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_ranking [--candidates 1 10 100 1000 5000]
+
+Builds SynthesisResult objects with random Yelp/Google ratings and counts,
+BBB grades, sentiment and flags, then times tools.ranking: feature matrix
+construction, vectorized scoring, and rank_candidates building every
+RankedContractor or only the top 20.
+"""
+
+import argparse
+import random
+import time
+
+from schema.models import ReviewSummary, SynthesisResult, VettedContractor
+from tools.ranking import build_feature_matrix, rank_candidates, score_matrix
+
+GRADES = ["A+", "A", "A-", "B+", "B", "C", "D", "F", "NR", None]
+SENTIMENTS = ["Positive", "Mixed", "Negative", "Unknown"]
+
+
+def build_summaries(rng: random.Random, count: int) -> list[SynthesisResult]:
+    summaries = []
+    for index in range(count):
+        google_known = rng.random() < 0.8
+        contractor = VettedContractor(
+            name=f"Contractor {index}",
+            address=f"{index} Main St",
+            phone=None,
+            website=None,
+            yelp_rating=round(rng.uniform(1.0, 5.0), 1),
+            yelp_review_count=rng.randint(1, 800),
+            google_rating=round(rng.uniform(1.0, 5.0), 1) if google_known else None,
+            google_review_count=rng.randint(0, 2000) if google_known else None,
+            bbb_rating=rng.choice(GRADES),
+            bbb_accredited=rng.choice([True, False, None]),
+            license_number="LIC-1" if rng.random() < 0.4 else None,
+            years_in_business=rng.choice([None, rng.randint(1, 40)]),
+            review_summary=ReviewSummary(overall_sentiment=rng.choice(SENTIMENTS)),
+            red_flags=["BBB rating is D."] if rng.random() < 0.1 else [],
+        )
+        summaries.append(
+            SynthesisResult(
+                contractor_name=contractor.name,
+                selected_contractor_index=index,
+                review_summary=contractor.review_summary,
+                contractor=contractor,
+                flags=["Website scrape failed."] if rng.random() < 0.2 else [],
+            )
+        )
+    return summaries
+
+
+def _best_seconds(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, nargs="+", default=[1, 10, 100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(
+        f"{'candidates':>10} {'features ms':>12} {'scoring ms':>11} "
+        f"{'rank all ms':>12} {'top 20 ms':>10}"
+    )
+    for count in args.candidates:
+        summaries = build_summaries(rng, count)
+        matrix = build_feature_matrix(summaries)
+        features = _best_seconds(lambda: build_feature_matrix(summaries), args.repeat)
+        scoring = _best_seconds(lambda: score_matrix(matrix), args.repeat)
+        ranking = _best_seconds(lambda: rank_candidates(summaries), args.repeat)
+        top = _best_seconds(lambda: rank_candidates(summaries, limit=20), args.repeat)
+        print(
+            f"{count:>10} {features * 1000:>12.3f} {scoring * 1000:>11.3f} "
+            f"{ranking * 1000:>12.3f} {top * 1000:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
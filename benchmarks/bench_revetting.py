@@ -0,0 +1,87 @@
+"""Benchmark repeat vetting with per-contractor vetting records.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_revetting [--zip-codes 10] [--passes 3]
+
+Vets every Yelp candidate in a set of ZIP codes several times against the
+fake Firecrawl and OpenAI clients, with the scrape and LLM caches disabled
+so only workflows.vetting_records avoids upstream work. The first pass
+fetches everything; later passes should only repeat the Yelp search. A final
+pass with the Google max age set to zero shows a single stale source being
+refetched while the summary is reused if the Google reviews did not change.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+os.environ.setdefault("FIRECRAWL_API_KEY", "benchmark")
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("SCRAPE_CACHE_DISABLED", "1")
+os.environ.setdefault("LLM_CACHE_DISABLED", "1")
+os.environ.setdefault("RATE_LIMIT_BACKOFF_SECONDS", "0.05")
+# Upstream quotas would dominate the first pass; only call counts matter here.
+for _api in ("SCRAPE", "EXTRACT", "OPENAI"):
+    os.environ.setdefault(f"RATE_LIMIT_{_api}_RPS", "100000")
+    os.environ.setdefault(f"RATE_LIMIT_{_api}_MAX_IN_FLIGHT", "100000")
+_workdir = tempfile.mkdtemp(prefix="bench-revetting-")
+os.environ.setdefault("BLOB_STORE_PATH", os.path.join(_workdir, "blobs"))
+os.environ.setdefault("VETTING_RECORDS_PATH", os.path.join(_workdir, "records.sqlite3"))
+
+from benchmarks.fakes import FakeConfig, install_fakes  # noqa: E402
+
+
+def _calls(fakes: dict) -> tuple[int, int]:
+    return fakes["async_firecrawl"].calls, fakes["async_openai"].stats()["calls"]
+
+
+async def run_pass(graph, service_type: str, zip_codes: list[str]) -> int:
+    from workflows.state import initial_agent_state
+
+    results = await asyncio.gather(
+        *(
+            graph.ainvoke(initial_agent_state(service_type, zip_code, vet_all_candidates=True))
+            for zip_code in zip_codes
+        )
+    )
+    return sum(len(result.get("candidate_summaries") or []) for result in results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--zip-codes", type=int, default=10)
+    parser.add_argument("--passes", type=int, default=3)
+    parser.add_argument("--service-type", default="roofing")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    fakes = install_fakes(
+        firecrawl=FakeConfig(latency_ms=args.latency_ms),
+        openai=FakeConfig(latency_ms=args.latency_ms * 4),
+    )
+    from workflows.discovery_vetting_graph import get_discovery_vetting_graph
+    from workflows.vetting_records import vetting_records
+
+    graph = get_discovery_vetting_graph()
+    zip_codes = [str(78700 + index) for index in range(args.zip_codes)]
+    labels = [f"pass {number}" for number in range(1, args.passes + 1)]
+    labels.append("google stale")
+
+    print(f"{'run':<14} {'vetted':>7} {'seconds':>8} {'firecrawl':>10} {'openai':>7}")
+    for label in labels:
+        if label == "google stale":
+            vetting_records.max_age_seconds["google"] = 0
+        before = _calls(fakes)
+        started = time.perf_counter()
+        vetted = asyncio.run(run_pass(graph, args.service_type, zip_codes))
+        elapsed = time.perf_counter() - started
+        firecrawl, openai = (after - prior for after, prior in zip(_calls(fakes), before))
+        print(f"{label:<14} {vetted:>7} {elapsed:>8.2f} {firecrawl:>10} {openai:>7}")
+    print(f"records: {vetting_records.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Benchmark review-input compression on synthetic Google and BBB pages.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_text_compressor [--reviews 120] [--budget 2500]
+
+Compares the old synthesis input (concatenate, then cut at 12000 chars) with
+tools.text_compressor: estimated prompt tokens, how many distinct review
+sentences and BBB facts reach the model, and compression time.
+"""
+
+import argparse
+import random
+import time
+
+from tools.text_compressor import compress_sources, estimate_tokens
+
+REFERENCE_MAX_CHARS = 12000
+
+NAV = [
+    "[Sign in](https://accounts.google.com/ServiceLogin)",
+    "![Google](https://www.google.com/images/branding/logo.png)",
+    "* [Maps](https://maps.google.com) * [Images](https://images.google.com)",
+    "[Directions](https://www.google.com/maps/dir/) [Save](#) [Share](#)",
+    "## Menu",
+    "Privacy · Terms · Send feedback",
+]
+PRAISE = [
+    "The crew was professional and cleaned up after the job.",
+    "Fair price and the quote matched the final invoice.",
+    "Highly recommend them, great communication from start to finish.",
+    "They repaired the leak in one visit and the work still looks great.",
+]
+COMPLAINTS = [
+    "They were late twice and never called to explain the delay.",
+    "Poor communication and the estimate doubled halfway through.",
+    "Unprofessional crew left damage on the driveway.",
+]
+BBB_FACTS = [
+    "BBB Rating: A+.",
+    "Accredited Business since 2012.",
+    "Years in Business: 14.",
+    "3 complaints closed in last 3 years.",
+    "1 complaint closed in last 12 months.",
+    "Customer Reviews: 4.2 stars from 37 reviews.",
+]
+
+
+def build_google_page(rng: random.Random, reviews: int) -> tuple[str, list[str]]:
+    lines = list(NAV)
+    sentences = []
+    for index in range(reviews):
+        template = rng.choice(PRAISE + COMPLAINTS)
+        sentence = f"{template[:-1]} (review {index})."
+        sentences.append(sentence)
+        stars = rng.randint(1, 5)
+        lines.append(f"![Avatar](https://lh3.googleusercontent.com/a/{index}=s40)")
+        lines.append(f"**Reviewer {index}** · {stars} stars · {rng.randint(1, 11)} months ago")
+        lines.append(sentence)
+        if index % 5 == 0:
+            # Scraped pages repeat review snippets ("Mentioned in reviews").
+            lines.append(sentence)
+        lines.append("[Like](#) [Share](#)")
+    lines.extend(NAV)
+    return "\n".join(lines), sentences
+
+
+def build_bbb_page() -> str:
+    lines = list(NAV)
+    lines.append("# ABC Roofing, LLC")
+    lines.extend(BBB_FACTS)
+    lines.extend(NAV)
+    return "\n".join(lines)
+
+
+def reference_review_input(google: str, bbb: str) -> str:
+    text = "\n\n".join(
+        [f"Google review content: {google}", f"BBB content: {bbb}"]
+    ).strip()
+    return text[:REFERENCE_MAX_CHARS]
+
+
+def _coverage(text: str, sentences: list[str]) -> int:
+    return sum(1 for sentence in sentences if sentence[:-1] in text)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reviews", type=int, default=120)
+    parser.add_argument("--budget", type=int, default=2500)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    google, sentences = build_google_page(rng, args.reviews)
+    bbb = build_bbb_page()
+
+    reference = reference_review_input(google, bbb)
+    best = float("inf")
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        current = compress_sources(
+            [("Google review content", google), ("BBB content", bbb)],
+            token_budget=args.budget,
+        )
+        best = min(best, time.perf_counter() - started)
+
+    raw_tokens = estimate_tokens(google) + estimate_tokens(bbb)
+    print(f"raw pages: {raw_tokens} tokens, {len(google) + len(bbb)} chars")
+    print("                 tokens  reviews  bbb facts")
+    for label, text in (("reference", reference), ("current", current)):
+        print(
+            f"  {label:<12} {estimate_tokens(text):>8} "
+            f"{_coverage(text, sentences):>4}/{len(sentences):<4}"
+            f"{_coverage(text, BBB_FACTS):>4}/{len(BBB_FACTS)}"
+        )
+    print(f"compression time: {best * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
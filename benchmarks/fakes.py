@@ -0,0 +1,319 @@
+"""Deterministic stand-ins for the Firecrawl and OpenAI clients.
+
+install_fakes() swaps them into tools.firecrawl_tool and tools.llm_tool, so
+the graph and the API run end to end without network access or API credits.
+Payloads are generated from the request (URL, prompt), and latency, errors
+and payload size are set per service with FakeConfig. Randomness is seeded
+by (seed, request, attempt), so a run is reproducible regardless of how
+concurrent calls interleave.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from urllib.parse import parse_qs, unquote_plus, urlparse
+
+TRADES = ["Roofing", "Plumbing", "Electric", "Landscaping", "HVAC", "Painting"]
+NAME_WORDS = ["Acme", "Summit", "Blue Sky", "Peak", "Hometown", "Cedar", "Keystone"]
+STREETS = ["Main St", "Oak Ave", "Maple Dr", "Pine Rd", "Cedar Ln", "Elm Blvd"]
+REVIEW_SENTENCES = [
+    "The crew was professional and cleaned up after the job.",
+    "Fair price and the quote matched the final invoice.",
+    "Highly recommend them, great communication from start to finish.",
+    "They were late twice and never called to explain the delay.",
+    "Poor communication and the estimate doubled halfway through.",
+]
+
+
+@dataclass
+class FakeConfig:
+    latency_ms: float = 50.0
+    # Uniform spread around latency_ms, as a fraction of it.
+    jitter: float = 0.3
+    error_rate: float = 0.0
+    # Share of errors that are 429s (retried by the rate limiter) rather
+    # than hard failures.
+    throttle_share: float = 0.5
+    # Multiplies page sizes: listings per Google page, reviews per listing,
+    # contractors per Yelp search.
+    payload_scale: float = 1.0
+    seed: int = 7
+
+
+class FakeAPIError(Exception):
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"fake upstream error {status_code}")
+        self.status_code = status_code
+
+
+class _FakeService:
+    def __init__(self, config: FakeConfig) -> None:
+        self.config = config
+        self.calls = 0
+        self.errors = 0
+        self._attempts: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _rng(self, request_key: str) -> random.Random:
+        with self._lock:
+            self.calls += 1
+            attempt = self._attempts.get(request_key, 0)
+            self._attempts[request_key] = attempt + 1
+        digest = hashlib.sha256(
+            f"{self.config.seed}|{request_key}|{attempt}".encode("utf-8")
+        ).digest()
+        return random.Random(int.from_bytes(digest[:8], "big"))
+
+    def _latency_seconds(self, rng: random.Random) -> float:
+        spread = self.config.jitter * rng.uniform(-1.0, 1.0)
+        return max(0.0, self.config.latency_ms * (1.0 + spread)) / 1000.0
+
+    def _maybe_fail(self, rng: random.Random) -> None:
+        if rng.random() < self.config.error_rate:
+            with self._lock:
+                self.errors += 1
+            raise FakeAPIError(429 if rng.random() < self.config.throttle_share else 500)
+
+    def stats(self) -> dict[str, int]:
+        return {"calls": self.calls, "errors": self.errors}
+
+
+def _seeded(seed: int, *parts: str) -> random.Random:
+    digest = hashlib.sha256("|".join([str(seed), *parts]).encode("utf-8")).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+def _phone(rng: random.Random) -> str:
+    return f"(512) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}"
+
+
+# Yelp extraction, Google Maps pages, BBB search pages and contractor-site
+# extraction, generated from the request. Contractor names returned by Yelp
+# are remembered so later Google/BBB lookups find them on the page.
+class FakeFirecrawlApp(_FakeService):
+    def __init__(self, config: FakeConfig) -> None:
+        super().__init__(config)
+        self._contractors: dict[str, dict] = {}
+
+    def _yelp_contractors(self, url: str) -> dict:
+        query = parse_qs(urlparse(url).query)
+        service = (query.get("find_desc") or ["home improvement"])[0]
+        zip_code = (query.get("find_loc") or [""])[0]
+        rng = _seeded(self.config.seed, "yelp", url)
+        count = max(1, round(5 * self.config.payload_scale))
+        contractors = []
+        for index in range(count):
+            name = f"{rng.choice(NAME_WORDS)} {service.title()} {zip_code}-{index}"
+            contractor = {
+                "name": name,
+                "rating": round(rng.uniform(3.0, 5.0), 1),
+                "reviews_count": rng.randint(5, 900),
+                "yelp_profile_url": (
+                    f"https://www.yelp.com/biz/{re.sub(r'[^a-z0-9]+', '-', name.lower())}"
+                ),
+                "website": f"https://www.{re.sub(r'[^a-z0-9]+', '', name.lower())}.example",
+                "phone": _phone(rng),
+                "address": f"{rng.randint(100, 9999)} {rng.choice(STREETS)}, Austin, TX {zip_code}",
+            }
+            with self._lock:
+                self._contractors[name] = contractor
+            contractors.append(contractor)
+        return {"contractors": contractors}
+
+    def _known_contractor(self, query: str) -> dict:
+        with self._lock:
+            known = list(self._contractors.values())
+        for contractor in known:
+            if query.startswith(contractor["name"]):
+                return contractor
+        return {"name": query, "phone": None, "address": None}
+
+    def _google_page(self, url: str) -> str:
+        query = unquote_plus(urlparse(url).path.rsplit("/", 1)[-1])
+        target = self._known_contractor(query)
+        rng = _seeded(self.config.seed, "google", url)
+        listings = max(1, round(20 * self.config.payload_scale))
+        reviews = max(1, round(3 * self.config.payload_scale))
+        target_position = rng.randrange(listings)
+        lines = ["# Results", "[Sign in](https://accounts.google.com/)"]
+        for position in range(listings):
+            if position == target_position:
+                name = target["name"]
+                phone = target.get("phone") or _phone(rng)
+                address = target.get("address") or f"{rng.randint(100, 9999)} Main St"
+            else:
+                name = f"{rng.choice(NAME_WORDS)} {rng.choice(TRADES)} {position}"
+                phone, address = _phone(rng), f"{rng.randint(100, 9999)} {rng.choice(STREETS)}"
+            slug = name.replace(" ", "+")
+            lines.append(f"[{name}](https://www.google.com/maps/place/{slug}/data=!{position})")
+            lines.append(f"{round(rng.uniform(3.0, 5.0), 1)}({rng.randint(5, 500)})")
+            lines.append(f"Contractor · {address}")
+            lines.append(f"Open · Closes 5 PM · {phone}")
+            for _ in range(reviews):
+                lines.append(f'"{rng.choice(REVIEW_SENTENCES)}"')
+        return "\n".join(lines)
+
+    def _bbb_page(self, url: str) -> str:
+        query = (parse_qs(urlparse(url).query).get("find_text") or [""])[0]
+        target = self._known_contractor(query)
+        rng = _seeded(self.config.seed, "bbb", url)
+        slug = re.sub(r"[^a-z0-9]+", "-", target["name"].lower()).strip("-")
+        profile = f"https://www.bbb.org/us/tx/austin/profile/contractors/{slug}-0825-1"
+        lines = ["# Search results"]
+        for position in range(max(1, round(5 * self.config.payload_scale))):
+            if position:
+                other = f"other-business-{position}"
+                lines.append(
+                    f"## [Other Business {position}]"
+                    f"(https://www.bbb.org/us/tx/austin/profile/contractors/{other}-0825-{position})"
+                )
+                lines.append("BBB Rating: B")
+                continue
+            lines.append(f"## [{target['name']}]({profile})")
+            lines.append(f"BBB Rating: {rng.choice(['A+', 'A', 'B+'])}")
+            lines.append("Accredited Business" if rng.random() < 0.6 else "Not accredited")
+            lines.append(f"{target.get('phone') or _phone(rng)}")
+            lines.append(f"{target.get('address') or 'Austin, TX'}")
+            lines.append(f"[More info]({profile})")
+        return "\n".join(lines)
+
+    def _scrape_payload(self, url: str) -> dict:
+        if "google.com/maps" in url:
+            return {"markdown": self._google_page(url)}
+        if "bbb.org" in url:
+            return {"markdown": self._bbb_page(url)}
+        return {"markdown": f"# {url}\n" + " ".join(REVIEW_SENTENCES)}
+
+    def _extract_payload(self, url: str) -> SimpleNamespace:
+        if "yelp.com" in url:
+            data = self._yelp_contractors(url)
+        else:
+            rng = _seeded(self.config.seed, "website", url)
+            data = {
+                "source_url": url,
+                "services_offered": rng.sample(TRADES, 3),
+                "license_number": f"TX-{rng.randint(10000, 99999)}",
+                "years_in_business": rng.randint(1, 40),
+            }
+        return SimpleNamespace(success=True, data=data, error=None)
+
+    def scrape(self, url: str, **_: object) -> dict:
+        rng = self._rng(f"scrape|{url}")
+        time.sleep(self._latency_seconds(rng))
+        self._maybe_fail(rng)
+        return self._scrape_payload(url)
+
+    def extract(self, urls: list[str], **_: object) -> SimpleNamespace:
+        rng = self._rng(f"extract|{urls[0]}")
+        time.sleep(self._latency_seconds(rng))
+        self._maybe_fail(rng)
+        return self._extract_payload(urls[0])
+
+
+class FakeAsyncFirecrawlApp(FakeFirecrawlApp):
+    async def scrape(self, url: str, **_: object) -> dict:
+        rng = self._rng(f"scrape|{url}")
+        await asyncio.sleep(self._latency_seconds(rng))
+        self._maybe_fail(rng)
+        return self._scrape_payload(url)
+
+    async def extract(self, urls: list[str], **_: object) -> SimpleNamespace:
+        rng = self._rng(f"extract|{urls[0]}")
+        await asyncio.sleep(self._latency_seconds(rng))
+        self._maybe_fail(rng)
+        return self._extract_payload(urls[0])
+
+
+def _completion(content: dict) -> SimpleNamespace:
+    message = SimpleNamespace(content=json.dumps(content))
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+# Answers review_summary and review_summary_batch requests. Latency grows
+# with input size, roughly like a real completion.
+class _FakeCompletions(_FakeService):
+    def _latency_for(self, request: dict, rng: random.Random) -> float:
+        chars = sum(len(message["content"]) for message in request["messages"])
+        return self._latency_seconds(rng) * (1.0 + chars / 20000.0)
+
+    def _payload(self, request: dict) -> SimpleNamespace:
+        content = request["messages"][-1]["content"]
+        rng = _seeded(self.config.seed, "openai", content)
+        schema_name = request["response_format"]["json_schema"]["name"]
+
+        def summary() -> dict:
+            return {
+                "positive_themes": ["professional crew"] if rng.random() < 0.7 else [],
+                "negative_themes": ["communication"] if rng.random() < 0.4 else [],
+                "overall_sentiment": rng.choice(["Positive", "Mixed", "Negative"]),
+            }
+
+        if schema_name == "review_summary_batch":
+            keys = re.findall(r"^Contractor (\S+):$", content, flags=re.MULTILINE)
+            return _completion(
+                {"summaries": [{"key": key, "summary": summary()} for key in keys]}
+            )
+        return _completion(summary())
+
+    def _request_key(self, request: dict) -> str:
+        return "chat|" + hashlib.sha256(
+            request["messages"][-1]["content"].encode("utf-8")
+        ).hexdigest()
+
+    def create(self, **request: object) -> SimpleNamespace:
+        rng = self._rng(self._request_key(request))
+        time.sleep(self._latency_for(request, rng))
+        self._maybe_fail(rng)
+        return self._payload(request)
+
+
+class _FakeAsyncCompletions(_FakeCompletions):
+    async def create(self, **request: object) -> SimpleNamespace:
+        rng = self._rng(self._request_key(request))
+        await asyncio.sleep(self._latency_for(request, rng))
+        self._maybe_fail(rng)
+        return self._payload(request)
+
+
+class FakeOpenAI:
+    def __init__(self, config: FakeConfig) -> None:
+        self.chat = SimpleNamespace(completions=_FakeCompletions(config))
+
+    def stats(self) -> dict[str, int]:
+        return self.chat.completions.stats()
+
+
+class FakeAsyncOpenAI(FakeOpenAI):
+    def __init__(self, config: FakeConfig) -> None:
+        self.chat = SimpleNamespace(completions=_FakeAsyncCompletions(config))
+
+
+def install_fakes(
+    firecrawl: FakeConfig | None = None, openai: FakeConfig | None = None
+) -> dict[str, object]:
+    # Import here so callers can set cache/limiter env vars before the tool
+    # modules read them.
+    import tools.firecrawl_tool as firecrawl_tool
+    import tools.llm_tool as llm_tool
+
+    firecrawl = firecrawl or FakeConfig()
+    openai = openai or FakeConfig(latency_ms=400.0)
+    fakes = {
+        "firecrawl": FakeFirecrawlApp(firecrawl),
+        "async_firecrawl": FakeAsyncFirecrawlApp(firecrawl),
+        "openai": FakeOpenAI(openai),
+        "async_openai": FakeAsyncOpenAI(openai),
+    }
+    # Both Firecrawl fakes share the Yelp contractors they have handed out.
+    fakes["async_firecrawl"]._contractors = fakes["firecrawl"]._contractors
+    firecrawl_tool._fc_app = fakes["firecrawl"]
+    firecrawl_tool._afc_app = fakes["async_firecrawl"]
+    llm_tool.openai_client = fakes["openai"]
+    llm_tool.async_openai_client = fakes["async_openai"]
+    return fakes
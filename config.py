@@ -0,0 +1,6 @@
+from dotenv import load_dotenv
+
+# Imported first by the API entry point: settings in the tool modules are
+# read from the environment at import time, so .env has to be loaded before
+# any of them.
+load_dotenv()
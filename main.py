@@ -1,16 +1,98 @@
+import argparse
+import asyncio
+import csv
 import json
 import logging
+import sys
+from typing import Any
 
-from workflows.discovery_vetting_graph import build_discovery_vetting_graph
+from dotenv import load_dotenv
 
+from schema.serialization import dumps
+
+TRUE_VALUES = {"1", "true", "yes", "y"}
+
+
+def _read_batch_items(csv_path: str) -> list[dict[str, Any]]:
+    # Expects service_type and zip_code columns; target_contractor_count and
+    # vet_all_candidates are optional per row.
+    logger = logging.getLogger(__name__)
+    items = []
+    with open(csv_path, newline="", encoding="utf-8") as csv_file:
+        for row_number, row in enumerate(csv.DictReader(csv_file), start=2):
+            target_input = (row.get("target_contractor_count") or "").strip()
+            target_count = 5
+            if target_input:
+                try:
+                    target_count = int(target_input)
+                except ValueError:
+                    logger.warning(
+                        "Invalid target count '%s' on row %d. Defaulting to 5.",
+                        target_input,
+                        row_number,
+                    )
+            items.append(
+                {
+                    "service_type": (row.get("service_type") or "").strip(),
+                    "zip_code": (row.get("zip_code") or "").strip(),
+                    "target_contractor_count": target_count,
+                    "vet_all_candidates": (row.get("vet_all_candidates") or "")
+                    .strip()
+                    .lower()
+                    in TRUE_VALUES,
+                }
+            )
+    return items
+
+
+def _batch_record(item: dict[str, Any], outcome: dict[str, Any]) -> dict[str, Any]:
+    record = {
+        "index": outcome["index"],
+        "service_type": item["service_type"],
+        "zip_code": item["zip_code"],
+        "status": outcome["status"],
+        "duration_seconds": round(outcome["duration_seconds"], 3),
+    }
+    if outcome["status"] != "completed":
+        record["error"] = outcome.get("error")
+        return record
+
+    final_state = outcome["final_state"]
+    record["consolidated_summary"] = final_state.get("synthesis")
+    record["candidate_summaries"] = final_state.get("candidate_summaries") or []
+    record["ranked_candidates"] = final_state.get("ranked_candidates") or []
+    record["flags"] = final_state.get("flags") or []
+    return record
+
+
+async def _run_batch(csv_path: str, output_path: str | None) -> dict[str, Any]:
+    from workflows.batch_runner import BatchProgress, run_discovery_batch
+    from workflows.enrichment_memo import EnrichmentMemo
+
+    items = _read_batch_items(csv_path)
+    progress = BatchProgress(len(items), EnrichmentMemo())
+    output = open(output_path, "w", encoding="utf-8") if output_path else sys.stdout
+    try:
+        async for outcome in run_discovery_batch(items, progress=progress):
+            record = _batch_record(items[outcome["index"]], outcome)
+            output.write(dumps(record) + "\n")
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return progress.snapshot()
+
+
+def run_interactive() -> None:
+    from workflows.discovery_vetting_graph import get_discovery_vetting_graph
+    from workflows.state import initial_agent_state
 
-def main() -> None:
-    logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
 
     service_type = input("Service type (e.g., plumbing, electrical): ").strip()
     zip_code = input("ZIP code: ").strip()
     target_input = input("Target contractor count [default: 5]: ").strip()
+    vet_all_input = input("Vet all candidates? [y/N]: ").strip().lower()
 
     target_count = 5
     if target_input:
@@ -19,42 +101,62 @@ def main() -> None:
         except ValueError:
             logger.warning("Invalid target count '%s'. Defaulting to 5.", target_input)
 
-    graph = build_discovery_vetting_graph()
-    initial_state = {
-        "service_type": service_type or "home improvement",
-        "target_contractor_count": target_count,
-        "contractor_name": None,
-        "selected_contractor_index": 0,
-        "zip_code": zip_code,
-        "yelp_candidates": [],
-        "contractor_data": None,
-        "yelp_url": None,
-        "google_url": None,
-        "bbb_url": None,
-        "raw_yelp_data": None,
-        "raw_google_data": None,
-        "raw_bbb_data": None,
-        "raw_website_data": None,
-        "raw_synthesis_data": None,
-        "flags": [],
-    }
-    final_state = graph.invoke(initial_state)
+    graph = get_discovery_vetting_graph()
+    initial_state = initial_agent_state(
+        service_type,
+        zip_code,
+        target_contractor_count=target_count,
+        vet_all_candidates=vet_all_input in {"y", "yes"},
+    )
+    final_state = asyncio.run(graph.ainvoke(initial_state))
 
     print("\n=== Consolidated Summary ===")
-    synthesis = final_state.get("raw_synthesis_data")
+    synthesis = final_state.get("synthesis")
     if synthesis:
-        try:
-            print(json.dumps(json.loads(synthesis), indent=2))
-        except Exception:
-            print(synthesis)
+        print(dumps(synthesis, indent=2))
+    elif final_state.get("candidate_summaries"):
+        print(dumps(final_state["candidate_summaries"], indent=2))
     else:
         print("No synthesis output generated.")
 
+    if len(final_state.get("ranked_candidates") or []) > 1:
+        print("\n=== Ranking ===")
+        for ranked in final_state["ranked_candidates"]:
+            print(f"{ranked.rank}. {ranked.contractor_name} (score {ranked.score:.3f})")
+
     if final_state.get("flags"):
         print("\n=== Flags ===")
         for flag in final_state["flags"]:
             print(f"- {flag}")
 
 
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    # Load .env before the workflow modules are imported: several of them
+    # read their settings at import time. Importing them lazily also keeps
+    # --help fast.
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Contractor discovery and vetting.")
+    parser.add_argument(
+        "--batch",
+        metavar="CSV",
+        help="Run one discovery per row (service_type, zip_code) instead of prompting.",
+    )
+    parser.add_argument(
+        "--output",
+        metavar="JSONL",
+        help="Where batch results are streamed, one JSON line per item (default: stdout).",
+    )
+    args = parser.parse_args()
+
+    if not args.batch:
+        run_interactive()
+        return
+
+    stats = asyncio.run(_run_batch(args.batch, args.output))
+    print(json.dumps(stats), file=sys.stderr)
+
+
 if __name__ == "__main__":
     main()
@@ -1,17 +1,38 @@
 from .models import (
+    BBBProfile,
+    BlobRef,
     Contractor,
     ContractorList,
     ContractorSearchResult,
     ContractorWebsiteInfo,
+    GoogleListing,
+    KeyedReviewSummary,
+    RankedContractor,
     ReviewSummary,
+    ReviewSummaryBatch,
+    SourceRecord,
+    SynthesisResult,
     VettedContractor,
+    YelpSource,
 )
+from .serialization import dumps, to_jsonable
 
 __all__ = [
+    "BBBProfile",
+    "BlobRef",
     "Contractor",
     "ContractorList",
     "ContractorSearchResult",
     "ContractorWebsiteInfo",
+    "GoogleListing",
+    "KeyedReviewSummary",
+    "RankedContractor",
     "ReviewSummary",
+    "ReviewSummaryBatch",
+    "SourceRecord",
+    "SynthesisResult",
     "VettedContractor",
+    "YelpSource",
+    "dumps",
+    "to_jsonable",
 ]
@@ -2,7 +2,6 @@ import logging
 from pydantic import BaseModel, Field
 from typing import List, Optional
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Structured Data Model
@@ -46,6 +45,43 @@ class ReviewSummary(BaseModel):
     negative_themes: List[str] = Field(default_factory=list, description="Key negative themes from reviews.")
     overall_sentiment: str = Field(description="Overall sentiment (e.g., 'Positive', 'Mixed', 'Negative').")
 
+class KeyedReviewSummary(BaseModel):
+    key: str = Field(description="The contractor key given in the request.")
+    summary: ReviewSummary
+
+
+class ReviewSummaryBatch(BaseModel):
+    summaries: List[KeyedReviewSummary] = Field(
+        default_factory=list, description="One summary per contractor key."
+    )
+
+# Facts read from BBB markdown by tools.bbb_parser. Fields the page does not
+# state are None.
+class BBBProfile(BaseModel):
+    business_name: Optional[str] = None
+    profile_url: Optional[str] = None
+    rating: Optional[str] = Field(default=None, description="Letter grade (A+ to F, or NR).")
+    accredited: Optional[bool] = None
+    accredited_since: Optional[str] = None
+    years_in_business: Optional[int] = None
+    complaints_last_3_years: Optional[int] = None
+    complaints_last_12_months: Optional[int] = None
+
+
+# Fields read from a Google Maps listing block by tools.google_listing.
+class GoogleListing(BaseModel):
+    name: Optional[str] = None
+    place_url: Optional[str] = None
+    rating: Optional[float] = None
+    review_count: Optional[int] = None
+    category: Optional[str] = None
+    phone: Optional[str] = None
+    address: Optional[str] = None
+    confidence: float = Field(
+        default=0.0, description="0-1, from which listing fields were found."
+    )
+
+
 class VettedContractor(BaseModel):
     name: str
     address: str
@@ -56,7 +92,7 @@ class VettedContractor(BaseModel):
     google_rating: Optional[float]
     google_review_count: Optional[int]
     bbb_rating: Optional[str] = Field(description="Better Business Bureau rating (e.g., 'A+', 'B-').")
-    bbb_accredited: bool
+    bbb_accredited: Optional[bool] = Field(description="None when BBB does not say either way.")
     services_offered: List[str] = Field(
         default_factory=list,
         description="Specific services offered by the contractor.",
@@ -65,3 +101,55 @@ class VettedContractor(BaseModel):
     years_in_business: Optional[int]
     review_summary: Optional[ReviewSummary]
     red_flags: List[str] = Field(default_factory=list, description="Identified issues requiring human review.")
+    bbb_profile: Optional[BBBProfile] = None
+    google_listing: Optional[GoogleListing] = None
+
+
+# One entry of the candidate ranking (tools.ranking). `contributions` holds
+# weight * scaled feature value per feature; they sum to `score`.
+class RankedContractor(BaseModel):
+    rank: int
+    contractor_name: Optional[str] = None
+    selected_contractor_index: Optional[int] = None
+    score: float
+    contributions: dict[str, float] = Field(default_factory=dict)
+
+
+# Reference to raw content kept in the blob store (tools.blob_store). The
+# content is served by GET /blobs/{digest}.
+class BlobRef(BaseModel):
+    digest: str = Field(description="SHA-256 of the UTF-8 content.")
+    size_bytes: int
+
+
+# One source of a contractor's vetting record (workflows.vetting_records).
+# `payload` is the stored value as JSON: a BlobRef for Google/BBB, the
+# ContractorWebsiteInfo or ReviewSummary otherwise. `input_hash` identifies
+# what the value was derived from (website URL, summarized review text).
+class SourceRecord(BaseModel):
+    source: str
+    fetched_at: float = Field(description="Unix time the source was last fetched.")
+    content_hash: str
+    input_hash: Optional[str] = None
+    payload: str
+
+
+class YelpSource(BaseModel):
+    source_url: Optional[str] = None
+    candidate: Optional[Contractor] = None
+
+
+# Consolidated output for one vetted candidate. Carried in graph state as a
+# model and only serialized at the API/CLI edge.
+class SynthesisResult(BaseModel):
+    contractor_name: Optional[str] = None
+    selected_contractor_index: Optional[int] = None
+    service_type: Optional[str] = None
+    zip_code: Optional[str] = None
+    yelp: YelpSource = Field(default_factory=YelpSource)
+    google_reviews_blob: Optional[BlobRef] = None
+    bbb_blob: Optional[BlobRef] = None
+    website_analysis: Optional[ContractorWebsiteInfo] = None
+    review_summary: ReviewSummary
+    contractor: Optional[VettedContractor] = None
+    flags: List[str] = Field(default_factory=list)
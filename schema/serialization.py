@@ -0,0 +1,14 @@
+from typing import Any, Optional
+
+from pydantic_core import to_json, to_jsonable_python
+
+
+# JSON encoding for the API/CLI edge. pydantic-core serializes models nested in
+# plain dicts and lists in one pass, without a model_dump() copy first; values
+# it does not know fall back to str().
+def dumps(value: Any, indent: Optional[int] = None) -> str:
+    return to_json(value, indent=indent, fallback=str).decode("utf-8")
+
+
+def to_jsonable(value: Any) -> Any:
+    return to_jsonable_python(value, fallback=str)
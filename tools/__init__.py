@@ -1,15 +1,32 @@
-from .firecrawl_tool import (
-    analyze_contractor_website,
-    get_bbb_info,
-    get_google_reviews,
-    search_contractors,
-)
-from .llm_tool import summarize_reviews
-
-__all__ = [
-    "search_contractors",
-    "get_google_reviews",
-    "get_bbb_info",
-    "analyze_contractor_website",
-    "summarize_reviews",
-]
+import importlib
+
+# Public names and the submodule that defines them. Submodules are imported
+# on first access, so importing one tool (or the package) does not pull in
+# every SDK.
+_EXPORTS = {
+    "search_contractors": "firecrawl_tool",
+    "get_google_reviews": "firecrawl_tool",
+    "get_bbb_info": "firecrawl_tool",
+    "analyze_contractor_website": "firecrawl_tool",
+    "summarize_reviews": "llm_tool",
+    "asearch_contractors": "firecrawl_tool",
+    "aget_google_reviews": "firecrawl_tool",
+    "aget_bbb_info": "firecrawl_tool",
+    "aanalyze_contractor_website": "firecrawl_tool",
+    "asummarize_reviews": "llm_tool",
+    "asummarize_reviews_batch": "llm_tool",
+    "asummarize_reviews_coalesced": "llm_tool",
+    "summarize_reviews_offline": "summary_batch",
+    "LocalSummaryBatchBackend": "summary_batch",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
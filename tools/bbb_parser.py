@@ -0,0 +1,148 @@
+import re
+from typing import Optional
+
+from schema.models import BBBProfile
+from tools.matching import TrigramIndex
+
+# Case-sensitive even inside IGNORECASE patterns, so "rating is a concern"
+# does not read as an A.
+_GRADE = r"(?-i:A\+|A-|A|B\+|B-|B|C\+|C-|C|D\+|D-|D|F|NR)"
+
+# Facts are only read from the start of a line (or of a "·"/"|" separated
+# segment), never from inside review prose. At a given position "not
+# accredited" is tried before "Accredited Business".
+_FACT_RE = re.compile(
+    r"(?:(?P<rating>BBB\s+Rating(?:\s*(?:&|and)\s*Accreditation)?\s*(?:is\s+|of\s+)?:?\s*"
+    rf"(?P<grade>{_GRADE})(?![\w+-]))"
+    r"|(?P<not_accredited>(?:this\s+business\s+is\s+)?(?:not|non)[\s-]+(?:a\s+)?"
+    r"(?:BBB\s+)?accredited\b(?:\s+business)?)"
+    r"|(?P<accredited_since>(?:BBB\s+)?Accredited\s+Since\s*:?\s*"
+    r"(?P<since>\d{1,2}/\d{1,2}/\d{4}|\d{1,2}/\d{4}|\d{4}))"
+    r"|(?P<accredited>(?:BBB\s+)?Accredited\s+Business\b)"
+    r"|(?P<years>Years\s+in\s+Business\s*:?\s*(?P<years_value>\d{1,3})\b)"
+    r"|(?P<complaints>(?P<count>\d[\d,]*)\s+(?:total\s+)?complaints?\s+(?:closed\s+)?"
+    r"in\s+(?:the\s+)?last\s+(?P<period>3\s+years|12\s+months))"
+    r"|(?P<complaints_labelled>(?:total\s+)?complaints?\s+(?:closed\s+)?in\s+(?:the\s+)?"
+    r"last\s+(?P<labelled_period>3\s+years|12\s+months)\s*:\s*(?P<labelled_count>\d[\d,]*)))",
+    re.IGNORECASE,
+)
+# "BBB Rating & Accreditation" on its own line, with the grade on the next.
+_RATING_HEADING_RE = re.compile(
+    r"^BBB\s+Rating(?:\s*(?:&|and)\s*Accreditation)?\s*:?$", re.IGNORECASE
+)
+_GRADE_LINE_RE = re.compile(rf"^(?P<grade>{_GRADE})$")
+_PROFILE_LINK_RE = re.compile(
+    r"\[([^\]]*)\]\((https?://(?:www\.)?bbb\.org/us/[^)\s]*?/profile/[^)\s]+)\)"
+)
+_LINK_ONLY_RE = re.compile(r"^(?:#+\s*)?(?:!?\[[^\]]*\]\([^)]*\)[\s|·•-]*)+$")
+# Markdown decoration in front of a fact: headings, bullets, quotes, image alt.
+_LINE_PREFIX_RE = re.compile(r"^(?:[#>*|•\s-]+|!?\[)*")
+_LINK_TARGET_RE = re.compile(r"\]?\([^)]*\)")
+_SEGMENT_RE = re.compile(r"\s*[·|•]\s*")
+_WORD_RE = re.compile(r"[A-Za-z]{2,}")
+# A segment that goes on for longer than this after the fact is prose that
+# happens to start like one ("Accredited business owner never called back").
+MAX_TRAILING_WORDS = 2
+
+
+def _count(value: str) -> int:
+    return int(value.replace(",", ""))
+
+
+def _read_fact(segment: str, fields: dict) -> bool:
+    text = _LINE_PREFIX_RE.sub("", segment)
+    match = _FACT_RE.match(text)
+    if match is None:
+        return False
+    trailing = _LINK_TARGET_RE.sub(" ", text[match.end() :])
+    if len(_WORD_RE.findall(trailing)) > MAX_TRAILING_WORDS:
+        return False
+
+    # lastgroup is the outer (alternative) group, which closes last.
+    kind = match.lastgroup
+    if kind == "rating":
+        fields.setdefault("rating", match.group("grade"))
+    elif kind == "not_accredited":
+        fields.setdefault("accredited", False)
+    elif kind == "accredited_since":
+        fields.setdefault("accredited", True)
+        fields.setdefault("accredited_since", match.group("since"))
+    elif kind == "accredited":
+        fields.setdefault("accredited", True)
+    elif kind == "years":
+        fields.setdefault("years_in_business", int(match.group("years_value")))
+    else:
+        labelled = kind == "complaints_labelled"
+        period = match.group("labelled_period" if labelled else "period")
+        count = _count(match.group("labelled_count" if labelled else "count"))
+        key = "complaints_last_3_years" if period.startswith("3") else "complaints_last_12_months"
+        fields.setdefault(key, count)
+    return True
+
+
+def _belongs_to(
+    markdown: str,
+    links: list[tuple[str, str]],
+    contractor_name: Optional[str],
+    expected_phone: Optional[str],
+) -> bool:
+    # Facts describe the contractor only if the markdown is about a single
+    # business: a matched result block or a profile page. A whole search page
+    # links several profiles and its first grade may be anyone's.
+    if len({url for _, url in links}) > 1:
+        return False
+    if not links or not contractor_name:
+        return True
+    index = TrigramIndex([(links[0][0], markdown)])
+    return index.best_match(contractor_name, phone=expected_phone) is not None
+
+
+# Rule-based reading of a BBB search result block or profile page: letter
+# grade, accreditation, complaint counts and the profile link. Returns the
+# profile (None when the markdown states none of these, or is not about
+# `contractor_name`) and the lines left after dropping fact, link-only and
+# phone-only lines, which is all the LLM still needs to see.
+def parse_bbb_markdown(
+    markdown: str,
+    contractor_name: Optional[str] = None,
+    expected_phone: Optional[str] = None,
+) -> tuple[Optional[BBBProfile], str]:
+    if not markdown:
+        return None, ""
+
+    fields: dict = {}
+    remaining = []
+    expect_grade = False
+    for line in markdown.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if expect_grade:
+            expect_grade = False
+            grade = _GRADE_LINE_RE.match(line)
+            if grade:
+                fields.setdefault("rating", grade.group("grade"))
+                continue
+        if _RATING_HEADING_RE.match(_LINE_PREFIX_RE.sub("", line)):
+            expect_grade = True
+            continue
+        # Image alt text counts ("![BBB Accredited Business](seal.png)"),
+        # so facts are read before link-only lines are dropped.
+        segments = [segment for segment in _SEGMENT_RE.split(line) if segment]
+        kept = [segment for segment in segments if not _read_fact(segment, fields)]
+        text = line if len(kept) == len(segments) else " · ".join(kept)
+        if text and not _LINK_ONLY_RE.match(text) and _WORD_RE.search(text):
+            remaining.append(text)
+
+    links = [
+        (name.strip().strip("#").strip(), url)
+        for name, url in _PROFILE_LINK_RE.findall(markdown)
+    ]
+    if not _belongs_to(markdown, links, contractor_name, expected_phone):
+        return None, "\n".join(remaining)
+    if links:
+        fields["business_name"] = links[0][0] or None
+        fields["profile_url"] = links[0][1]
+
+    profile = BBBProfile(**fields) if fields else None
+    return profile, "\n".join(remaining)
@@ -0,0 +1,131 @@
+import gzip
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from typing import Any, Collection, Optional
+
+from schema.models import BlobRef
+from tools.env import env_float
+
+logger = logging.getLogger(__name__)
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+_COMPRESSED_SUFFIX = ".gz"
+
+
+# Content-addressed storage for large raw payloads (scraped page markdown), so
+# graph state and job results carry a BlobRef instead of the text. Each blob
+# is a file named by the SHA-256 of its content, gzip-compressed if enabled;
+# identical pages are stored once. Writes go to a temp file and are renamed
+# into place, so concurrent writers of the same blob are safe. Storing a blob
+# again refreshes its mtime, which is what purge_expired goes by.
+class BlobStore:
+    def __init__(
+        self,
+        root: str,
+        compress: bool = True,
+        ttl_seconds: float = 7 * 24 * 60 * 60,
+    ) -> None:
+        self.root = root
+        self.compress = compress
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._counters = {"stores": 0, "deduplicated": 0, "bytes_in": 0, "bytes_written": 0}
+
+    def _path(self, digest: str, compressed: bool) -> str:
+        name = digest + (_COMPRESSED_SUFFIX if compressed else "")
+        return os.path.join(self.root, digest[:2], name)
+
+    def _find(self, digest: str) -> Optional[str]:
+        # Either encoding may be on disk if BLOB_STORE_COMPRESS was changed.
+        for compressed in (self.compress, not self.compress):
+            path = self._path(digest, compressed)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def put(self, content: str) -> BlobRef:
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        ref = BlobRef(digest=digest, size_bytes=len(data))
+        existing = self._find(digest)
+        if existing is not None:
+            os.utime(existing)
+            with self._lock:
+                self._counters["deduplicated"] += 1
+            return ref
+
+        payload = gzip.compress(data, compresslevel=6, mtime=0) if self.compress else data
+        path = self._path(digest, self.compress)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, "wb") as blob_file:
+            blob_file.write(payload)
+        os.replace(temp_path, path)
+        with self._lock:
+            self._counters["stores"] += 1
+            self._counters["bytes_in"] += len(data)
+            self._counters["bytes_written"] += len(payload)
+        return ref
+
+    def get(self, digest: str) -> Optional[str]:
+        if not _DIGEST_RE.match(digest or ""):
+            return None
+        path = self._find(digest)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as blob_file:
+                payload = blob_file.read()
+        except FileNotFoundError:
+            # Purged between the lookup and the read.
+            return None
+        if path.endswith(_COMPRESSED_SUFFIX):
+            payload = gzip.decompress(payload)
+        return payload.decode("utf-8")
+
+    def purge_expired(self, keep: Collection[str] = ()) -> int:
+        # `keep` holds digests still referenced elsewhere (fresh vetting
+        # records); those blobs survive regardless of age.
+        if not os.path.isdir(self.root):
+            return 0
+        cutoff = time.time() - self.ttl_seconds
+        removed = 0
+        for shard in os.scandir(self.root):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.removesuffix(_COMPRESSED_SUFFIX) in keep:
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                        removed += 1
+                except FileNotFoundError:
+                    continue
+        if removed:
+            logger.info("Purged %d expired blobs from '%s'.", removed, self.root)
+        return removed
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "path": self.root,
+                "compress": self.compress,
+                **self._counters,
+            }
+
+
+# Stored job results reference blobs, so blobs must outlive the jobs: the
+# default TTL is the job store's (JOB_TTL_SECONDS).
+blob_store = BlobStore(
+    root=os.getenv("BLOB_STORE_PATH", ".cache/blobs"),
+    compress=os.getenv("BLOB_STORE_COMPRESS", "1").strip().lower() in {"1", "true", "yes"},
+    ttl_seconds=env_float(
+        "BLOB_STORE_TTL_SECONDS", env_float("JOB_TTL_SECONDS", 7 * 24 * 60 * 60)
+    ),
+)
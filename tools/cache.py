@@ -0,0 +1,225 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any
+
+from tools.metrics import CACHE_LOOKUPS
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(*parts: Any) -> str:
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# SQLite-backed key/value cache with per-entry TTLs and LRU size eviction.
+# Entries are grouped by namespace (e.g. a scrape source) for per-namespace
+# hit/miss counters and invalidation. Values must be JSON-serializable.
+# With memory_entries > 0, recently used values are also kept decoded in an
+# in-process LRU so repeat lookups skip SQLite and JSON decoding.
+class PersistentCache:
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        enabled: bool = True,
+        memory_entries: int = 0,
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.memory_entries = memory_entries
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._total_bytes = 0
+        self._memory: OrderedDict[str, tuple[str, float, Any]] = OrderedDict()
+        self._counters: dict[str, dict[str, int]] = defaultdict(
+            lambda: {
+                "hits": 0,
+                "memory_hits": 0,
+                "misses": 0,
+                "expired": 0,
+                "stores": 0,
+                "evictions": 0,
+            }
+        )
+
+    def _remember(self, namespace: str, key: str, expires_at: float, value: Any) -> None:
+        if self.memory_entries <= 0:
+            return
+        self._memory[key] = (namespace, expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, namespace TEXT NOT NULL, value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_entries_last_access "
+                "ON cache_entries (last_access)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_entries_namespace "
+                "ON cache_entries (namespace)"
+            )
+            row = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()
+            self._total_bytes = int(row[0])
+            self._conn = conn
+            logger.info(
+                "Opened persistent cache at '%s' (%d bytes in use).",
+                self.path,
+                self._total_bytes,
+            )
+        return self._conn
+
+    def get(self, namespace: str, key: str) -> Any | None:
+        if not self.enabled:
+            return None
+        now = time.time()
+        try:
+            with self._lock:
+                remembered = self._memory.get(key)
+                if remembered is not None:
+                    if remembered[1] > now:
+                        self._memory.move_to_end(key)
+                        self._counters[namespace]["hits"] += 1
+                        self._counters[namespace]["memory_hits"] += 1
+                        CACHE_LOOKUPS.labels(namespace, "hit").inc()
+                        return remembered[2]
+                    del self._memory[key]
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT value, size, expires_at FROM cache_entries WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    self._counters[namespace]["misses"] += 1
+                    CACHE_LOOKUPS.labels(namespace, "miss").inc()
+                    return None
+                value, size, expires_at = row
+                if expires_at <= now:
+                    conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                    self._total_bytes -= size
+                    self._counters[namespace]["expired"] += 1
+                    self._counters[namespace]["misses"] += 1
+                    CACHE_LOOKUPS.labels(namespace, "miss").inc()
+                    return None
+                conn.execute(
+                    "UPDATE cache_entries SET last_access = ? WHERE key = ?", (now, key)
+                )
+                self._counters[namespace]["hits"] += 1
+                CACHE_LOOKUPS.labels(namespace, "hit").inc()
+                decoded = json.loads(value)
+                self._remember(namespace, key, expires_at, decoded)
+            return decoded
+        except Exception:
+            logger.exception("Cache lookup failed for namespace='%s'.", namespace)
+            return None
+
+    def set(self, namespace: str, key: str, value: Any, ttl_seconds: float) -> None:
+        if not self.enabled or ttl_seconds <= 0:
+            return
+        now = time.time()
+        try:
+            encoded = json.dumps(value, separators=(",", ":"), default=str)
+            size = len(encoded.encode("utf-8"))
+            if size > self.max_bytes:
+                logger.warning(
+                    "Skipping cache store for namespace='%s'; entry of %d bytes exceeds cache size.",
+                    namespace,
+                    size,
+                )
+                return
+            with self._lock:
+                conn = self._connection()
+                previous = conn.execute(
+                    "SELECT size FROM cache_entries WHERE key = ?", (key,)
+                ).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries "
+                    "(key, namespace, value, size, expires_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, namespace, encoded, size, now + ttl_seconds, now),
+                )
+                self._total_bytes += size - (previous[0] if previous else 0)
+                self._counters[namespace]["stores"] += 1
+                self._remember(namespace, key, now + ttl_seconds, value)
+                if self._total_bytes > self.max_bytes:
+                    self._evict(conn)
+        except Exception:
+            logger.exception("Cache store failed for namespace='%s'.", namespace)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        # Expired entries go first, then least recently used ones until the
+        # cache is back under 90% of its budget.
+        conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),))
+        row = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()
+        self._total_bytes = int(row[0])
+        target_bytes = int(self.max_bytes * 0.9)
+        while self._total_bytes > target_bytes:
+            rows = conn.execute(
+                "SELECT key, namespace, size FROM cache_entries ORDER BY last_access LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+            for key, namespace, size in rows:
+                conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                self._memory.pop(key, None)
+                self._total_bytes -= size
+                self._counters[namespace]["evictions"] += 1
+                if self._total_bytes <= target_bytes:
+                    break
+        logger.info("Cache eviction complete; %d bytes in use.", self._total_bytes)
+
+    def invalidate(self, namespace: str | None = None) -> int:
+        if not self.enabled:
+            return 0
+        with self._lock:
+            conn = self._connection()
+            if namespace is None:
+                self._memory.clear()
+                cursor = conn.execute("DELETE FROM cache_entries")
+            else:
+                for key in [
+                    key
+                    for key, (entry_namespace, _, _) in self._memory.items()
+                    if entry_namespace == namespace
+                ]:
+                    del self._memory[key]
+                cursor = conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ?", (namespace,)
+                )
+            row = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()
+            self._total_bytes = int(row[0])
+            return cursor.rowcount
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "path": self.path,
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "memory_entries": len(self._memory),
+                "namespaces": {
+                    namespace: dict(counters)
+                    for namespace, counters in self._counters.items()
+                },
+            }
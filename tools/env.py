@@ -0,0 +1,34 @@
+import logging
+import os
+from typing import Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+NumberT = TypeVar("NumberT", int, float)
+
+
+def _env_number(
+    name: str, default: NumberT, parse: Callable[[str], NumberT], minimum: Optional[NumberT]
+) -> NumberT:
+    raw_value = os.getenv(name, "").strip()
+    if not raw_value:
+        return default
+    try:
+        value = parse(raw_value)
+    except ValueError:
+        value = None
+    if value is None or (minimum is not None and value < minimum):
+        logger.warning("Invalid %s='%s'; using default %s.", name, raw_value, default)
+        return default
+    return value
+
+
+# Numeric settings from the environment. A malformed value, or one below
+# `minimum`, falls back to the default with a warning instead of failing the
+# import of the module that reads it.
+def env_float(name: str, default: float, minimum: Optional[float] = None) -> float:
+    return _env_number(name, default, float, minimum)
+
+
+def env_int(name: str, default: int, minimum: Optional[int] = None) -> int:
+    return _env_number(name, default, int, minimum)
@@ -1,23 +1,110 @@
+import asyncio
 import logging
 import os
 import re
+import threading
 from urllib.parse import quote_plus, urlparse
 
-from dotenv import load_dotenv
-from firecrawl import FirecrawlApp
-
 from schema.models import (
     Contractor,
     ContractorList,
     ContractorSearchResult,
     ContractorWebsiteInfo,
 )
+from tools.cache import PersistentCache, make_cache_key
+from tools.env import env_int
+from tools.matching import MatchResult, TrigramIndex, normalize_text
+from tools.metrics import atimed_call, observe_payload, timed_call
+from tools.rate_limiter import (
+    AdaptiveLimiter,
+    RateLimitExhaustedError,
+    acall_with_limiter,
+    call_with_limiter,
+    get_limiter,
+)
 
 logger = logging.getLogger(__name__)
 
-load_dotenv()
-fc_app = FirecrawlApp(api_key=os.getenv("FIRECRAWL_API_KEY"))
-logger.info("FirecrawlApp initialized successfully for discovery tools.")
+# Clients are built on first use: the SDK import and client setup are a large
+# share of process start-up, and many processes (CLI --help, API workers
+# before their first job) never call Firecrawl.
+_fc_app = None
+_afc_app = None
+_clients_lock = threading.Lock()
+
+
+def get_firecrawl_app():
+    global _fc_app
+    if _fc_app is None:
+        with _clients_lock:
+            if _fc_app is None:
+                from dotenv import load_dotenv
+                from firecrawl import FirecrawlApp
+
+                load_dotenv()
+                _fc_app = FirecrawlApp(api_key=os.getenv("FIRECRAWL_API_KEY"))
+                logger.info("FirecrawlApp initialized for discovery tools.")
+    return _fc_app
+
+
+def get_async_firecrawl_app():
+    global _afc_app
+    if _afc_app is None:
+        with _clients_lock:
+            if _afc_app is None:
+                from dotenv import load_dotenv
+                from firecrawl import AsyncFirecrawlApp
+
+                load_dotenv()
+                app = AsyncFirecrawlApp(api_key=os.getenv("FIRECRAWL_API_KEY"))
+                _use_pooled_async_transport(
+                    app, env_int("FIRECRAWL_MAX_CONNECTIONS", 100)
+                )
+                _afc_app = app
+                logger.info("AsyncFirecrawlApp initialized for discovery tools.")
+    return _afc_app
+
+
+def _use_pooled_async_transport(app, max_connections: int) -> None:
+    import httpx
+
+    # The SDK's async HTTP client disables keep-alive, so every call pays for
+    # a fresh TLS handshake. Swap in one shared keep-alive pool instead.
+    http_client = getattr(getattr(app, "_v2_client", None), "async_http_client", None)
+    current = getattr(http_client, "_client", None)
+    if not isinstance(current, httpx.AsyncClient):
+        logger.warning(
+            "Firecrawl async client layout not recognized; using SDK connection handling."
+        )
+        return
+    http_client._client = httpx.AsyncClient(
+        base_url=current.base_url,
+        headers=current.headers,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=30.0,
+        ),
+    )
+
+# Default TTLs per source, overridable with SCRAPE_CACHE_TTL_<SOURCE> (seconds).
+# Yelp search results move quickly; BBB profiles and contractor sites rarely do.
+SCRAPE_CACHE_TTLS = {
+    "yelp_search": 15 * 60,
+    "google_maps": 6 * 60 * 60,
+    "bbb": 7 * 24 * 60 * 60,
+    "website": 3 * 24 * 60 * 60,
+}
+
+scrape_cache = PersistentCache(
+    path=os.getenv("SCRAPE_CACHE_PATH", ".cache/scrape_cache.sqlite3"),
+    max_bytes=env_int("SCRAPE_CACHE_MAX_MB", 256) * 1024 * 1024,
+    enabled=os.getenv("SCRAPE_CACHE_DISABLED", "").strip().lower() not in {"1", "true", "yes"},
+)
+
+
+def _cache_ttl(source: str) -> int:
+    return env_int(f"SCRAPE_CACHE_TTL_{source.upper()}", SCRAPE_CACHE_TTLS.get(source, 60 * 60))
 
 
 def _extract_content(scrape_result) -> str:
@@ -38,6 +125,139 @@ def _extract_content(scrape_result) -> str:
     )
 
 
+_KNOWN_UPSTREAMS = ("yelp.com", "google.com", "bbb.org")
+
+
+def _upstream_name(url: str) -> str:
+    host = (urlparse(url).netloc or "").lower()
+    return next(
+        (
+            domain
+            for domain in _KNOWN_UPSTREAMS
+            if host == domain or host.endswith(f".{domain}")
+        ),
+        "contractor-sites",
+    )
+
+
+def _upstream_limiter(api: str, url: str) -> AdaptiveLimiter:
+    # Yelp, Google and BBB each get their own limiter; contractor websites
+    # share one so a batch of different domains is still coordinated.
+    return get_limiter(api, _upstream_name(url))
+
+
+def _scrape_cache_key(url: str, formats: list[str]) -> str:
+    return make_cache_key("scrape", url, formats, True)
+
+
+def _extract_cache_key(url: str, prompt: str, schema: dict) -> str:
+    return make_cache_key("extract", [url], prompt, schema)
+
+
+def _extract_response_data(response) -> tuple[bool, object, str | None]:
+    if not response.success:
+        return False, None, getattr(response, "error", "unknown error")
+    data = response.data
+    if hasattr(data, "model_dump"):
+        data = data.model_dump()
+    return True, data, None
+
+
+def _scrape_markdown(url: str, source: str) -> str:
+    formats = ["markdown"]
+    cache_key = _scrape_cache_key(url, formats)
+    cached = scrape_cache.get(source, cache_key)
+    if cached is not None:
+        logger.info("Scrape cache hit for source='%s' url='%s'.", source, url)
+        return cached
+
+    scraped_data = call_with_limiter(
+        _upstream_limiter("scrape", url),
+        timed_call("scrape", _upstream_name(url), get_firecrawl_app().scrape),
+        url,
+        formats=formats,
+        only_main_content=True,
+    )
+    content = _extract_content(scraped_data)
+    observe_payload(source, content)
+    if content:
+        scrape_cache.set(source, cache_key, content, _cache_ttl(source))
+    return content
+
+
+async def _ascrape_markdown(url: str, source: str) -> str:
+    formats = ["markdown"]
+    cache_key = _scrape_cache_key(url, formats)
+    # SQLite lookup (and, on set, eviction) run in a worker thread.
+    cached = await asyncio.to_thread(scrape_cache.get, source, cache_key)
+    if cached is not None:
+        logger.info("Scrape cache hit for source='%s' url='%s'.", source, url)
+        return cached
+
+    scraped_data = await acall_with_limiter(
+        _upstream_limiter("scrape", url),
+        atimed_call("scrape", _upstream_name(url), get_async_firecrawl_app().scrape),
+        url,
+        formats=formats,
+        only_main_content=True,
+    )
+    content = _extract_content(scraped_data)
+    observe_payload(source, content)
+    if content:
+        await asyncio.to_thread(
+            scrape_cache.set, source, cache_key, content, _cache_ttl(source)
+        )
+    return content
+
+
+def _extract_structured(
+    url: str, prompt: str, schema: dict, source: str
+) -> tuple[bool, object, str | None]:
+    cache_key = _extract_cache_key(url, prompt, schema)
+    cached = scrape_cache.get(source, cache_key)
+    if cached is not None:
+        logger.info("Extract cache hit for source='%s' url='%s'.", source, url)
+        return True, cached, None
+
+    response = call_with_limiter(
+        _upstream_limiter("extract", url),
+        timed_call("extract", _upstream_name(url), get_firecrawl_app().extract),
+        urls=[url],
+        prompt=prompt,
+        schema=schema,
+    )
+    success, data, error = _extract_response_data(response)
+    observe_payload(source, data if success else None)
+    if success:
+        scrape_cache.set(source, cache_key, data, _cache_ttl(source))
+    return success, data, error
+
+
+async def _aextract_structured(
+    url: str, prompt: str, schema: dict, source: str
+) -> tuple[bool, object, str | None]:
+    cache_key = _extract_cache_key(url, prompt, schema)
+    cached = await asyncio.to_thread(scrape_cache.get, source, cache_key)
+    if cached is not None:
+        logger.info("Extract cache hit for source='%s' url='%s'.", source, url)
+        return True, cached, None
+
+    response = await acall_with_limiter(
+        _upstream_limiter("extract", url),
+        atimed_call("extract", _upstream_name(url), get_async_firecrawl_app().extract),
+        urls=[url],
+        prompt=prompt,
+        schema=schema,
+    )
+    success, data, error = _extract_response_data(response)
+    observe_payload(source, data if success else None)
+    if success:
+        await asyncio.to_thread(
+            scrape_cache.set, source, cache_key, data, _cache_ttl(source)
+        )
+    return success, data, error
+
+
 def _build_yelp_search_url(service: str, zip_code: str) -> str:
     return (
         f"https://www.yelp.com/search?find_desc={quote_plus(service)}"
@@ -71,60 +291,140 @@ def _normalize_contractor_urls(contractor: Contractor) -> Contractor:
     )
 
 
-def _normalize_text(text: str) -> str:
-    return re.sub(r"\s+", " ", re.sub(r"[^a-z0-9 ]+", " ", (text or "").lower())).strip()
+GOOGLE_LISTING_MARKER = "(https://www.google.com/maps/place/"
+GOOGLE_LISTING_MAX_LINES = 14
+BBB_PROFILE_MARKER = "https://www.bbb.org/us/"
+BBB_RESULT_MAX_LINES = 20
 
 
-def _digits_only(text: str) -> str:
-    return re.sub(r"\D+", "", text or "")
+_MARKDOWN_LINK_RE = re.compile(r"\[([^\]]*)\]\((\S+?)\)")
 
 
-def _extract_google_listing_block(
-    raw_content: str,
+def _is_google_listing_start(line: str) -> bool:
+    return line.startswith("[") and GOOGLE_LISTING_MARKER in line
+
+
+def _is_bbb_result_start(line: str) -> bool:
+    return (
+        line.startswith(("[", "#"))
+        and BBB_PROFILE_MARKER in line
+        and "/profile/" in line
+    )
+
+
+def _split_result_blocks(
+    raw_content: str, is_block_start, max_lines: int
+) -> list[tuple[str, str]]:
+    # (title, block text) per result: a block runs from its start line (a
+    # markdown link) to the next one, capped at max_lines, and is titled with
+    # the link text. Repeated links to the same target ("More info") stay
+    # inside the block they belong to.
+    lines = [line.strip() for line in raw_content.splitlines()]
+    starts = []
+    titles = []
+    previous_target = None
+    for idx, line in enumerate(lines):
+        if "](" not in line or not is_block_start(line):
+            continue
+        link = _MARKDOWN_LINK_RE.search(line)
+        title, target = (link.group(1), link.group(2)) if link else (line, line)
+        if target != previous_target:
+            starts.append(idx)
+            titles.append(title)
+        previous_target = target
+    blocks = []
+    for position, start in enumerate(starts):
+        next_start = starts[position + 1] if position + 1 < len(starts) else len(lines)
+        end = min(start + max_lines, next_start)
+        block_lines = [line for line in lines[start:end] if line]
+        blocks.append((titles[position], "\n".join(block_lines)))
+    return blocks
+
+
+def _match_result_block(
+    blocks: list[tuple[str, str]],
     contractor_name: str,
-    expected_phone: str | None = None,
-    expected_address: str | None = None,
+    expected_phone: str | None,
+    expected_address: str | None,
+    source: str,
+) -> MatchResult | None:
+    match = TrigramIndex(blocks).best_match(
+        contractor_name, phone=expected_phone, address=expected_address
+    )
+    if match is None:
+        logger.warning(
+            "None of %d %s results matched contractor='%s'.",
+            len(blocks),
+            source,
+            contractor_name,
+        )
+        return None
+    logger.info(
+        "Matched %s result %d/%d for contractor='%s' "
+        "(score=%.2f, name=%.2f, phone=%s, address=%.2f).",
+        source,
+        match.index + 1,
+        len(blocks),
+        contractor_name,
+        match.score,
+        match.name_score,
+        match.phone_match,
+        match.address_score,
+    )
+    return match
+
+
+def _build_google_maps_url(
+    contractor_name: str, zip_code: str, service_type: str | None
+) -> tuple[str, str]:
+    clean_service = (service_type or "").strip()
+    query_parts = [contractor_name, zip_code]
+    if clean_service and normalize_text(clean_service) not in normalize_text(
+        contractor_name
+    ):
+        query_parts.append(clean_service)
+    google_maps_query = " ".join(part for part in query_parts if part)
+    google_maps_url = "https://www.google.com/maps/search/" f"{quote_plus(google_maps_query)}"
+    return google_maps_url, clean_service
+
+
+def _filter_google_content(
+    content: str,
+    contractor_name: str,
+    zip_code: str,
+    expected_phone: str | None,
+    expected_address: str | None,
 ) -> str:
-    lines = [line.strip() for line in raw_content.splitlines()]
-    listing_starts = [
-        idx
-        for idx, line in enumerate(lines)
-        if line.startswith("[")
-        and "(https://www.google.com/maps/place/" in line
-    ]
-    if not listing_starts:
+    if not content:
+        logger.warning(
+            "No review content returned from Google Maps scrape for '%s' (%s).",
+            contractor_name,
+            zip_code,
+        )
         return ""
 
-    normalized_name = _normalize_text(contractor_name)
-    phone_digits = _digits_only(expected_phone or "")
-    address_tokens = [
-        token
-        for token in _normalize_text(expected_address or "").split()
-        if len(token) >= 4
-    ]
-
-    best_score = -1
-    best_block = ""
-    for start in listing_starts:
-        end = min(start + 14, len(lines))
-        block_lines = [line for line in lines[start:end] if line]
-        if not block_lines:
-            continue
-        block_text = "\n".join(block_lines)
-        normalized_block = _normalize_text(block_text)
-        score = 0
-        if normalized_name and normalized_name in normalized_block:
-            score += 3
-        if phone_digits and phone_digits in _digits_only(block_text):
-            score += 2
-        if address_tokens and any(token in normalized_block for token in address_tokens):
-            score += 1
+    listings = _split_result_blocks(
+        content, _is_google_listing_start, GOOGLE_LISTING_MAX_LINES
+    )
+    if listings:
+        # A results list that contains no matching listing is about other
+        # businesses, so none of it is passed on.
+        match = _match_result_block(
+            listings, contractor_name, expected_phone, expected_address, "Google"
+        )
+        return match.text if match else ""
 
-        if score > best_score:
-            best_score = score
-            best_block = block_text
+    logger.info(
+        "No Google listing blocks found for '%s'; using page content as-is.",
+        contractor_name,
+    )
 
-    return best_block if best_score > 0 else ""
+    logger.info(
+        "Successfully fetched Google review content for '%s' (%s).",
+        contractor_name,
+        zip_code,
+    )
+    return content
 
 
 def get_google_reviews(
@@ -138,14 +438,9 @@ def get_google_reviews(
         logger.warning("Missing contractor_name or zip_code for Google review lookup.")
         return ""
 
-    clean_service = (service_type or "").strip()
-    query_parts = [contractor_name, zip_code]
-    if clean_service and _normalize_text(clean_service) not in _normalize_text(
-        contractor_name
-    ):
-        query_parts.append(clean_service)
-    google_maps_query = " ".join(part for part in query_parts if part)
-    google_maps_url = "https://www.google.com/maps/search/" f"{quote_plus(google_maps_query)}"
+    google_maps_url, clean_service = _build_google_maps_url(
+        contractor_name, zip_code, service_type
+    )
     logger.info(
         "Fetching Google reviews content for contractor='%s', service='%s', zip='%s'",
         contractor_name,
@@ -155,44 +450,49 @@ def get_google_reviews(
     logger.debug("Google Maps search URL: %s", google_maps_url)
 
     try:
-        scraped_data = fc_app.scrape(
-            google_maps_url,
-            formats=["markdown"],
-            only_main_content=True,
+        content = _scrape_markdown(google_maps_url, "google_maps")
+        return _filter_google_content(
+            content, contractor_name, zip_code, expected_phone, expected_address
         )
-        content = _extract_content(scraped_data)
-        if not content:
-            logger.warning(
-                "No review content returned from Google Maps scrape for '%s' (%s).",
-                contractor_name,
-                zip_code,
-            )
-            return ""
-
-        filtered_content = _extract_google_listing_block(
-            content,
+    except Exception:
+        logger.exception(
+            "Failed to fetch Google reviews for contractor='%s', zip='%s'.",
             contractor_name,
-            expected_phone=expected_phone,
-            expected_address=expected_address,
+            zip_code,
         )
-        if filtered_content:
-            logger.info(
-                "Filtered Google content to likely matching listing for '%s'.",
-                contractor_name,
-            )
-            return filtered_content
+        return ""
 
-        logger.warning(
-            "Could not confidently isolate matching Google listing for '%s'; using raw content.",
-            contractor_name,
-        )
 
-        logger.info(
-            "Successfully fetched Google review content for '%s' (%s).",
-            contractor_name,
-            zip_code,
+async def aget_google_reviews(
+    contractor_name: str,
+    zip_code: str,
+    service_type: str | None = None,
+    expected_phone: str | None = None,
+    expected_address: str | None = None,
+) -> str:
+    if not contractor_name or not zip_code:
+        logger.warning("Missing contractor_name or zip_code for Google review lookup.")
+        return ""
+
+    google_maps_url, clean_service = _build_google_maps_url(
+        contractor_name, zip_code, service_type
+    )
+    logger.info(
+        "Fetching Google reviews content for contractor='%s', service='%s', zip='%s'",
+        contractor_name,
+        clean_service,
+        zip_code,
+    )
+    logger.debug("Google Maps search URL: %s", google_maps_url)
+
+    try:
+        content = await _ascrape_markdown(google_maps_url, "google_maps")
+        return _filter_google_content(
+            content, contractor_name, zip_code, expected_phone, expected_address
         )
-        return content
+    except RateLimitExhaustedError:
+        # Left to the caller, which flags it as throttled rather than empty.
+        raise
     except Exception:
         logger.exception(
             "Failed to fetch Google reviews for contractor='%s', zip='%s'.",
@@ -202,20 +502,62 @@ def get_google_reviews(
         return ""
 
 
-def get_bbb_info(
-    contractor_name: str, zip_code: str, service_type: str | None = None
-) -> str:
-    if not contractor_name or not zip_code:
-        logger.warning("Missing contractor_name or zip_code for BBB lookup.")
-        return ""
-
+def _build_bbb_search_url(
+    contractor_name: str, zip_code: str, service_type: str | None
+) -> tuple[str, str]:
     clean_service = (service_type or "home improvement").strip()
     search_url = (
         "https://www.bbb.org/search"
         f"?find_country=USA&find_latlng=&find_loc={quote_plus(zip_code)}"
         f"&find_text={quote_plus(contractor_name)}+{quote_plus(clean_service)}"
     )
+    return search_url, clean_service
 
+
+def _check_bbb_content(
+    content: str,
+    contractor_name: str,
+    zip_code: str,
+    expected_phone: str | None = None,
+    expected_address: str | None = None,
+) -> str:
+    if not content:
+        logger.warning(
+            "No BBB content returned for contractor='%s', zip='%s'.",
+            contractor_name,
+            zip_code,
+        )
+        return ""
+
+    results = _split_result_blocks(content, _is_bbb_result_start, BBB_RESULT_MAX_LINES)
+    if results:
+        match = _match_result_block(
+            results, contractor_name, expected_phone, expected_address, "BBB"
+        )
+        return match.text if match else ""
+
+    logger.info(
+        "Successfully fetched BBB content for contractor='%s', zip='%s'.",
+        contractor_name,
+        zip_code,
+    )
+    return content
+
+
+def get_bbb_info(
+    contractor_name: str,
+    zip_code: str,
+    service_type: str | None = None,
+    expected_phone: str | None = None,
+    expected_address: str | None = None,
+) -> str:
+    if not contractor_name or not zip_code:
+        logger.warning("Missing contractor_name or zip_code for BBB lookup.")
+        return ""
+
+    search_url, clean_service = _build_bbb_search_url(
+        contractor_name, zip_code, service_type
+    )
     logger.info(
         "Fetching BBB info for contractor='%s', service='%s', zip='%s'",
         contractor_name,
@@ -225,26 +567,49 @@ def get_bbb_info(
     logger.debug("BBB search URL: %s", search_url)
 
     try:
-        search_results = fc_app.scrape(
-            search_url,
-            formats=["markdown"],
-            only_main_content=True,
+        content = _scrape_markdown(search_url, "bbb")
+        return _check_bbb_content(
+            content, contractor_name, zip_code, expected_phone, expected_address
         )
-        content = _extract_content(search_results)
-        if not content:
-            logger.warning(
-                "No BBB content returned for contractor='%s', zip='%s'.",
-                contractor_name,
-                zip_code,
-            )
-            return ""
-
-        logger.info(
-            "Successfully fetched BBB content for contractor='%s', zip='%s'.",
+    except Exception:
+        logger.exception(
+            "Failed to fetch BBB info for contractor='%s', zip='%s'.",
             contractor_name,
             zip_code,
         )
-        return content
+        return ""
+
+
+async def aget_bbb_info(
+    contractor_name: str,
+    zip_code: str,
+    service_type: str | None = None,
+    expected_phone: str | None = None,
+    expected_address: str | None = None,
+) -> str:
+    if not contractor_name or not zip_code:
+        logger.warning("Missing contractor_name or zip_code for BBB lookup.")
+        return ""
+
+    search_url, clean_service = _build_bbb_search_url(
+        contractor_name, zip_code, service_type
+    )
+    logger.info(
+        "Fetching BBB info for contractor='%s', service='%s', zip='%s'",
+        contractor_name,
+        clean_service,
+        zip_code,
+    )
+    logger.debug("BBB search URL: %s", search_url)
+
+    try:
+        content = await _ascrape_markdown(search_url, "bbb")
+        return _check_bbb_content(
+            content, contractor_name, zip_code, expected_phone, expected_address
+        )
+    except RateLimitExhaustedError:
+        # Left to the caller, which flags it as throttled rather than empty.
+        raise
     except Exception:
         logger.exception(
             "Failed to fetch BBB info for contractor='%s', zip='%s'.",
@@ -254,39 +619,67 @@ def get_bbb_info(
         return ""
 
 
+def _contractor_search_prompt(service: str) -> str:
+    return (
+        f"Find the top 5 {service} companies with their ratings, review counts, "
+        "website URL, phone number, and address where available."
+    )
+
+
+def _build_contractor_search_result(
+    url: str,
+    service: str,
+    zip_code: str,
+    success: bool,
+    raw_data: object,
+    error: str | None,
+) -> ContractorSearchResult:
+    if success:
+        validated = ContractorList.model_validate(raw_data)
+        normalized_contractors = [
+            _normalize_contractor_urls(contractor)
+            for contractor in validated.contractors
+        ]
+        return ContractorSearchResult(
+            source_url=url,
+            service_type=service,
+            zip_code=zip_code,
+            contractors=normalized_contractors,
+        )
+
+    logger.warning(
+        "Contractor extraction failed for service='%s', zip='%s': %s",
+        service,
+        zip_code,
+        error,
+    )
+    return ContractorSearchResult(
+        source_url=url,
+        service_type=service,
+        zip_code=zip_code,
+        contractors=[],
+    )
+
+
 def search_contractors(service: str, zip_code: str) -> ContractorSearchResult:
     logger.info("Searching for service='%s' in zip='%s'.", service, zip_code)
     url = _build_yelp_search_url(service, zip_code)
 
     try:
-        response = fc_app.extract(
-            urls=[url],
-            prompt=(
-                f"Find the top 5 {service} companies with their ratings, review counts, "
-                "website URL, phone number, and address where available."
-            ),
+        success, raw_data, error = _extract_structured(
+            url,
+            prompt=_contractor_search_prompt(service),
             schema=ContractorList.model_json_schema(),
+            source="yelp_search",
         )
-
-        if response.success:
-            raw_data = response.data
-            validated = ContractorList.model_validate(raw_data)
-            normalized_contractors = [
-                _normalize_contractor_urls(contractor)
-                for contractor in validated.contractors
-            ]
-            return ContractorSearchResult(
-                source_url=url,
-                service_type=service,
-                zip_code=zip_code,
-                contractors=normalized_contractors,
-            )
-
-        logger.warning(
-            "Contractor extraction failed for service='%s', zip='%s': %s",
+        return _build_contractor_search_result(
+            url, service, zip_code, success, raw_data, error
+        )
+    except Exception:
+        logger.exception(
+            "Failed to search contractors for service='%s', zip='%s'.",
             service,
             zip_code,
-            getattr(response, "error", "unknown error"),
         )
         return ContractorSearchResult(
             source_url=url,
@@ -294,6 +687,25 @@ def search_contractors(service: str, zip_code: str) -> ContractorSearchResult:
             zip_code=zip_code,
             contractors=[],
         )
+
+
+async def asearch_contractors(service: str, zip_code: str) -> ContractorSearchResult:
+    logger.info("Searching for service='%s' in zip='%s'.", service, zip_code)
+    url = _build_yelp_search_url(service, zip_code)
+
+    try:
+        success, raw_data, error = await _aextract_structured(
+            url,
+            prompt=_contractor_search_prompt(service),
+            schema=ContractorList.model_json_schema(),
+            source="yelp_search",
+        )
+        return _build_contractor_search_result(
+            url, service, zip_code, success, raw_data, error
+        )
+    except RateLimitExhaustedError:
+        # Left to the caller, which flags it as throttled rather than empty.
+        raise
     except Exception:
         logger.exception(
             "Failed to search contractors for service='%s', zip='%s'.",
@@ -308,6 +720,32 @@ def search_contractors(service: str, zip_code: str) -> ContractorSearchResult:
         )
 
 
+def _website_analysis_prompt(service_type: str) -> str:
+    return (
+        f"Extract services offered relevant to {service_type}, contractor "
+        "license number, and years in business. Return structured output only."
+    )
+
+
+def _build_website_info(
+    clean_url: str, success: bool, raw_data: object, error: str | None
+) -> ContractorWebsiteInfo:
+    if not success:
+        logger.warning(
+            "Website analysis extraction failed for url='%s': %s",
+            clean_url,
+            error,
+        )
+        return ContractorWebsiteInfo(source_url=clean_url)
+
+    parsed = ContractorWebsiteInfo.model_validate(raw_data)
+    if not parsed.source_url:
+        parsed.source_url = clean_url
+
+    logger.info("Completed contractor website analysis for url='%s'.", clean_url)
+    return parsed
+
+
 def analyze_contractor_website(
     website_url: str, service_type: str | None = None
 ) -> ContractorWebsiteInfo:
@@ -323,29 +761,43 @@ def analyze_contractor_website(
         return ContractorWebsiteInfo()
 
     try:
-        response = fc_app.extract(
-            urls=[clean_url],
-            prompt=(
-                f"Extract services offered relevant to {clean_service}, contractor "
-                "license number, and years in business. Return structured output only."
-            ),
+        success, raw_data, error = _extract_structured(
+            clean_url,
+            prompt=_website_analysis_prompt(clean_service),
+            schema=ContractorWebsiteInfo.model_json_schema(),
+            source="website",
+        )
+        return _build_website_info(clean_url, success, raw_data, error)
+    except Exception:
+        logger.exception("Website analysis failed for url='%s'.", clean_url)
+        return ContractorWebsiteInfo(source_url=clean_url)
+
+
+async def aanalyze_contractor_website(
+    website_url: str, service_type: str | None = None
+) -> ContractorWebsiteInfo:
+    logger.info(
+        "Starting contractor website analysis for url='%s', service='%s'.",
+        website_url,
+        service_type,
+    )
+    clean_url = (website_url or "").strip()
+    clean_service = (service_type or "home improvement").strip()
+    if not clean_url:
+        logger.warning("Skipping website analysis because website_url is missing.")
+        return ContractorWebsiteInfo()
+
+    try:
+        success, raw_data, error = await _aextract_structured(
+            clean_url,
+            prompt=_website_analysis_prompt(clean_service),
             schema=ContractorWebsiteInfo.model_json_schema(),
+            source="website",
         )
-        if not response.success:
-            logger.warning(
-                "Website analysis extraction failed for url='%s': %s",
-                clean_url,
-                getattr(response, "error", "unknown error"),
-            )
-            return ContractorWebsiteInfo(source_url=clean_url)
-
-        raw_data = response.data
-        parsed = ContractorWebsiteInfo.model_validate(raw_data)
-        if not parsed.source_url:
-            parsed.source_url = clean_url
-
-        logger.info("Completed contractor website analysis for url='%s'.", clean_url)
-        return parsed
+        return _build_website_info(clean_url, success, raw_data, error)
+    except RateLimitExhaustedError:
+        # Left to the caller, which flags it as throttled rather than empty.
+        raise
     except Exception:
         logger.exception("Website analysis failed for url='%s'.", clean_url)
         return ContractorWebsiteInfo(source_url=clean_url)
@@ -0,0 +1,122 @@
+import re
+from typing import Optional
+
+from schema.models import GoogleListing
+
+_PLACE_LINK_RE = re.compile(r"^\[([^\]]+)\]\((https://www\.google\.com/maps/place/[^)\s]+)\)")
+# "4.6(123)", "4.6 (1,234)", "4.6 (1.2K)" and "4.6 stars 123 reviews".
+_COUNT = r"\d[\d,]*(?:\.\d+)?\s*[Kk]?"
+_RATING_RE = re.compile(
+    r"^(?P<rating>[1-5](?:[.,]\d)?)\s*(?:stars?\s*)?"
+    rf"(?:\((?P<count>{_COUNT})\)|(?P<reviews>{_COUNT})\s*reviews?\b)"
+)
+_NO_REVIEWS_RE = re.compile(r"^no reviews\b", re.IGNORECASE)
+_PHONE_RE = re.compile(r"(?:\+?1[\s.-]?)?\(?\b[2-9]\d{2}\)?[\s.-]?\d{3}[\s.-]?\d{4}\b")
+_HOURS_RE = re.compile(
+    r"^(?:open(?:s|\s+24\s+hours)?|closed|closes|temporarily closed)\b", re.IGNORECASE
+)
+_STREET_RE = re.compile(
+    r"^\d+[A-Za-z]?\s+[\w.' -]+?(?:\s(?:st|street|ave|avenue|rd|road|dr|drive|ln|lane|blvd|"
+    r"boulevard|way|ct|court|pl|place|pkwy|parkway|hwy|highway|cir|circle|trl|trail|ter)\b|,)",
+    re.IGNORECASE,
+)
+# The category/address line follows the title and rating; later "·" lines are
+# review metadata ("Local Guide · 12 reviews").
+HEADER_LINES = 4
+_SEPARATOR = "·"
+
+# How much each field adds to the confidence score. A listing with every field
+# scores 1.0; a rating line alone is not enough to trust the numbers.
+CONFIDENCE_WEIGHTS = {
+    "place_url": 0.2,
+    "rating": 0.25,
+    "review_count": 0.2,
+    "category": 0.1,
+    "phone": 0.15,
+    "address": 0.1,
+}
+
+
+def _review_count(raw: str) -> Optional[int]:
+    raw = raw.replace(" ", "").replace(",", "")
+    try:
+        if raw[-1:] in {"K", "k"}:
+            return int(float(raw[:-1]) * 1000)
+        return int(raw)
+    except ValueError:
+        return None
+
+
+# Reads a Google Maps listing block (as isolated by firecrawl_tool) line by
+# line: name and place URL from the title link, "4.6(123)" rating lines,
+# "Category · Address" lines, phone numbers and opening hours. Returns the
+# listing (None for empty input) and the lines that were not consumed, which
+# are the review snippets the summarizer still needs.
+def parse_google_listing(block: str) -> tuple[Optional[GoogleListing], str]:
+    if not block:
+        return None, ""
+
+    fields: dict = {}
+    remaining = []
+    position = -1
+    for line in block.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        position += 1
+
+        link = _PLACE_LINK_RE.match(line)
+        if link:
+            if "place_url" not in fields:
+                fields["name"] = link.group(1).strip()
+                fields["place_url"] = link.group(2)
+            continue
+
+        rating = _RATING_RE.match(line)
+        if rating and "rating" not in fields:
+            value = float(rating.group("rating").replace(",", "."))
+            count = _review_count(rating.group("count") or rating.group("reviews"))
+            if 1.0 <= value <= 5.0:
+                fields["rating"] = value
+                if count is not None:
+                    fields["review_count"] = count
+                continue
+        if _NO_REVIEWS_RE.match(line):
+            fields.setdefault("review_count", 0)
+            continue
+
+        consumed = False
+        phone = _PHONE_RE.search(line)
+        if phone and "phone" not in fields:
+            fields["phone"] = phone.group(0).strip()
+            # A number quoted inside a review keeps the review text.
+            consumed = len(_PHONE_RE.sub("", line).split()) <= 3
+
+        if _SEPARATOR in line:
+            parts = [part.strip() for part in line.split(_SEPARATOR) if part.strip()]
+            if parts and _HOURS_RE.match(parts[0]):
+                continue
+            for part in parts:
+                if _STREET_RE.match(part) and "address" not in fields:
+                    fields["address"] = part
+                    consumed = True
+            first = parts[0] if parts else ""
+            if (
+                "category" not in fields
+                and position < HEADER_LINES
+                and first
+                and not any(char.isdigit() for char in first)
+                and len(first) <= 60
+            ):
+                fields["category"] = first
+                consumed = True
+        elif _HOURS_RE.match(line):
+            continue
+
+        if not consumed:
+            remaining.append(line)
+
+    fields["confidence"] = round(
+        sum(weight for name, weight in CONFIDENCE_WEIGHTS.items() if name in fields), 2
+    )
+    return GoogleListing(**fields), "\n".join(remaining)
@@ -1,31 +1,154 @@
+import asyncio
+import hashlib
 import json
 import logging
 import os
+import re
+import threading
+import weakref
 
-from dotenv import load_dotenv
-from openai import OpenAI
-
-from schema.models import ReviewSummary
+from schema.models import ReviewSummary, ReviewSummaryBatch
+from tools.cache import PersistentCache, make_cache_key
+from tools.env import env_float, env_int
+from tools.metrics import atimed_call, observe_llm_usage, timed_call
+from tools.rate_limiter import (
+    RateLimitExhaustedError,
+    acall_with_limiter,
+    call_with_limiter,
+    get_limiter,
+)
 
 logger = logging.getLogger(__name__)
 
-load_dotenv()
-openai_api_key = os.getenv("OPENAI_API_KEY")
-openai_client = OpenAI(api_key=openai_api_key) if openai_api_key else None
+# Built on first use, like the Firecrawl clients: importing the OpenAI SDK
+# dominates the import time of this module. None while OPENAI_API_KEY is unset.
+openai_client = None
+async_openai_client = None
+_clients_lock = threading.Lock()
 
 
-def summarize_reviews(reviews_text: str) -> ReviewSummary:
-    logger.info("Starting review summarization.")
+def _openai_api_key() -> str | None:
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return os.getenv("OPENAI_API_KEY")
+
+
+def get_openai_client():
+    global openai_client
+    if openai_client is None:
+        with _clients_lock:
+            if openai_client is None:
+                api_key = _openai_api_key()
+                if not api_key:
+                    return None
+                from openai import OpenAI
+
+                openai_client = OpenAI(api_key=api_key)
+    return openai_client
+
+
+def get_async_openai_client():
+    global async_openai_client
+    if async_openai_client is None:
+        with _clients_lock:
+            if async_openai_client is None:
+                api_key = _openai_api_key()
+                if not api_key:
+                    return None
+                import httpx
+                from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+                max_connections = env_int("OPENAI_MAX_CONNECTIONS", 100)
+                async_openai_client = AsyncOpenAI(
+                    api_key=api_key,
+                    http_client=DefaultAsyncHttpxClient(
+                        limits=httpx.Limits(
+                            max_connections=max_connections,
+                            max_keepalive_connections=max_connections,
+                            keepalive_expiry=30.0,
+                        )
+                    ),
+                )
+    return async_openai_client
+
+SUMMARY_CACHE_NAMESPACE = "review_summary"
+# Bump when the prompt or post-processing changes in a way the JSON schema
+# does not capture; LLM_CACHE_VERSION allows the same from the environment.
+SUMMARY_SCHEMA_VERSION = "1"
+
+summary_cache = PersistentCache(
+    path=os.getenv("LLM_CACHE_PATH", ".cache/llm_cache.sqlite3"),
+    max_bytes=env_int("LLM_CACHE_MAX_MB", 64) * 1024 * 1024,
+    enabled=os.getenv("LLM_CACHE_DISABLED", "").strip().lower() not in {"1", "true", "yes"},
+    memory_entries=env_int("LLM_CACHE_MEMORY_ENTRIES", 1024),
+)
+_summary_cache_ttl = env_int("LLM_CACHE_TTL_SECONDS", 30 * 24 * 60 * 60)
+_summary_schema_fingerprint = make_cache_key(ReviewSummary.model_json_schema())
+
+
+def _summary_cache_key(request: dict) -> str:
+    normalized_text = re.sub(r"\s+", " ", request["messages"][-1]["content"]).strip()
+    return make_cache_key(
+        SUMMARY_SCHEMA_VERSION,
+        os.getenv("LLM_CACHE_VERSION", ""),
+        request["model"],
+        request["messages"][0]["content"],
+        _summary_schema_fingerprint,
+        hashlib.sha256(normalized_text.encode("utf-8")).hexdigest(),
+    )
+
+
+def summary_fingerprint() -> str:
+    # Changes with the model, prompt or schema, i.e. whenever a stored
+    # summary of the same reviews would no longer be what the model returns.
+    request = _summary_request("")
+    return make_cache_key(
+        SUMMARY_SCHEMA_VERSION,
+        os.getenv("LLM_CACHE_VERSION", ""),
+        request["model"],
+        request["messages"][0]["content"],
+        _summary_schema_fingerprint,
+    )
+
+
+def cached_summary(cache_key: str) -> ReviewSummary | None:
+    cached = summary_cache.get(SUMMARY_CACHE_NAMESPACE, cache_key)
+    if cached is None:
+        return None
+    logger.info("Review summary cache hit.")
+    return ReviewSummary.model_validate(cached)
+
+
+def _cached_summary(request: dict) -> tuple[str, ReviewSummary | None]:
+    cache_key = _summary_cache_key(request)
+    return cache_key, cached_summary(cache_key)
+
+
+def store_summary(cache_key: str, summary: ReviewSummary) -> None:
+    # Only real summaries are cached; "Unknown" is what failures, stubs and
+    # empty input produce, and must not be served for the next 30 days.
+    if summary.overall_sentiment == "Unknown":
+        return
+    summary_cache.set(
+        SUMMARY_CACHE_NAMESPACE, cache_key, summary.model_dump(), _summary_cache_ttl
+    )
+
+
+def invalidate_summary_cache() -> int:
+    removed = summary_cache.invalidate(SUMMARY_CACHE_NAMESPACE)
+    logger.info("Invalidated %d cached review summaries.", removed)
+    return removed
+
+
+def _prepare_review_text(reviews_text: str) -> str | None:
     clean_text = (reviews_text or "").strip()
     if not clean_text:
         logger.warning("Skipping review summarization because reviews_text is empty.")
-        return ReviewSummary(overall_sentiment="Unknown")
-    if openai_client is None:
-        logger.warning(
-            "Skipping review summarization because OPENAI_API_KEY is not configured."
-        )
-        return ReviewSummary(overall_sentiment="Unknown")
+        return None
 
+    # Last-resort guard: synthesis input is already cut to a token budget per
+    # source by tools.text_compressor.
     max_chars = 12000
     if len(clean_text) > max_chars:
         logger.warning(
@@ -34,33 +157,329 @@ def summarize_reviews(reviews_text: str) -> ReviewSummary:
             max_chars,
         )
         clean_text = clean_text[:max_chars]
+    return clean_text
 
-    try:
-        response = openai_client.chat.completions.create(
-            model=os.getenv("OPENAI_SUMMARY_MODEL", "gpt-4o-mini"),
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "Summarize customer reviews. Identify positive and negative themes "
-                        "and provide overall sentiment. Return JSON only."
-                    ),
-                },
-                {"role": "user", "content": f"Reviews: {clean_text}"},
-            ],
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "review_summary",
-                    "schema": ReviewSummary.model_json_schema(),
-                },
+
+def _summary_request(clean_text: str) -> dict:
+    return {
+        "model": os.getenv("OPENAI_SUMMARY_MODEL", "gpt-4o-mini"),
+        "messages": [
+            {
+                "role": "system",
+                "content": (
+                    "Summarize customer reviews. Identify positive and negative themes "
+                    "and provide overall sentiment. Return JSON only."
+                ),
             },
+            {"role": "user", "content": f"Reviews: {clean_text}"},
+        ],
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "review_summary",
+                "schema": ReviewSummary.model_json_schema(),
+            },
+        },
+    }
+
+
+# The single-item summary request for `reviews_text` and its cache key, or
+# None when there is nothing to summarize. tools.summary_batch queues these
+# requests offline and caches results under the same keys.
+def build_summary_request(reviews_text: str) -> tuple[dict, str] | None:
+    clean_text = _prepare_review_text(reviews_text)
+    if clean_text is None:
+        return None
+    request = _summary_request(clean_text)
+    return request, _summary_cache_key(request)
+
+
+def _parse_summary_response(response) -> ReviewSummary:
+    content = response.choices[0].message.content or ""
+    return ReviewSummary.model_validate(json.loads(content))
+
+
+def _log_missing_client() -> None:
+    logger.warning(
+        "Skipping review summarization because OPENAI_API_KEY is not configured."
+    )
+
+
+def summarize_reviews(reviews_text: str) -> ReviewSummary:
+    logger.info("Starting review summarization.")
+    clean_text = _prepare_review_text(reviews_text)
+    if clean_text is None:
+        return ReviewSummary(overall_sentiment="Unknown")
+
+    request = _summary_request(clean_text)
+    cache_key, cached = _cached_summary(request)
+    if cached is not None:
+        return cached
+    client = get_openai_client()
+    if client is None:
+        _log_missing_client()
+        return ReviewSummary(overall_sentiment="Unknown")
+
+    try:
+        response = call_with_limiter(
+            get_limiter("openai", "chat"),
+            timed_call("openai", "chat", client.chat.completions.create),
+            **request,
         )
+        observe_llm_usage(request["model"], response)
+        parsed = _parse_summary_response(response)
+        store_summary(cache_key, parsed)
+        logger.info("Review summarization complete.")
+        return parsed
+    except Exception:
+        logger.exception("Review summarization failed.")
+        return ReviewSummary(overall_sentiment="Unknown")
 
-        content = response.choices[0].message.content or ""
-        parsed = ReviewSummary.model_validate(json.loads(content))
+
+async def asummarize_reviews(reviews_text: str) -> ReviewSummary:
+    logger.info("Starting review summarization.")
+    clean_text = _prepare_review_text(reviews_text)
+    if clean_text is None:
+        return ReviewSummary(overall_sentiment="Unknown")
+
+    request = _summary_request(clean_text)
+    cache_key, cached = _cached_summary(request)
+    if cached is not None:
+        return cached
+    client = get_async_openai_client()
+    if client is None:
+        _log_missing_client()
+        return ReviewSummary(overall_sentiment="Unknown")
+
+    try:
+        response = await acall_with_limiter(
+            get_limiter("openai", "chat"),
+            atimed_call("openai", "chat", client.chat.completions.create),
+            **request,
+        )
+        observe_llm_usage(request["model"], response)
+        parsed = _parse_summary_response(response)
+        store_summary(cache_key, parsed)
         logger.info("Review summarization complete.")
         return parsed
     except Exception:
         logger.exception("Review summarization failed.")
         return ReviewSummary(overall_sentiment="Unknown")
+
+
+# Several contractors' reviews are packed into one structured-output request
+# that returns a keyed list of summaries. Each item is still cached under its
+# single-request key, so batched and unbatched calls share cache entries.
+def _summary_batch_limits() -> tuple[int, int]:
+    return (
+        max(1, env_int("SUMMARY_BATCH_MAX_ITEMS", 8)),
+        env_int("SUMMARY_BATCH_MAX_CHARS", 60000),
+    )
+
+
+def _batch_summary_request(items: list[tuple[str, str]]) -> dict:
+    sections = "\n\n---\n\n".join(
+        f"Contractor {key}:\nReviews: {clean_text}" for key, clean_text in items
+    )
+    return {
+        "model": os.getenv("OPENAI_SUMMARY_MODEL", "gpt-4o-mini"),
+        "messages": [
+            {
+                "role": "system",
+                "content": (
+                    "Summarize customer reviews for each contractor separately. For each "
+                    "contractor key, identify positive and negative themes and provide "
+                    "overall sentiment, using only that contractor's reviews. Return one "
+                    "entry per key. Return JSON only."
+                ),
+            },
+            {"role": "user", "content": sections},
+        ],
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "review_summary_batch",
+                "schema": ReviewSummaryBatch.model_json_schema(),
+            },
+        },
+    }
+
+
+def _chunk_batch_items(items: list[tuple[str, str]]) -> list[list[tuple[str, str]]]:
+    max_items, max_chars = _summary_batch_limits()
+    chunks: list[list[tuple[str, str]]] = []
+    chunk: list[tuple[str, str]] = []
+    chunk_chars = 0
+    for key, clean_text in items:
+        if chunk and (len(chunk) >= max_items or chunk_chars + len(clean_text) > max_chars):
+            chunks.append(chunk)
+            chunk, chunk_chars = [], 0
+        chunk.append((key, clean_text))
+        chunk_chars += len(clean_text)
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+async def _asummarize_chunk(chunk: list[tuple[str, str]]) -> dict[str, ReviewSummary]:
+    if len(chunk) == 1:
+        key, clean_text = chunk[0]
+        return {key: await asummarize_reviews(clean_text)}
+
+    # The model sees short positional keys; caller keys may be long or unsafe
+    # to echo back.
+    by_position = {f"c{position}": key for position, (key, _) in enumerate(chunk, start=1)}
+    request = _batch_summary_request(
+        [(f"c{position}", text) for position, (_, text) in enumerate(chunk, start=1)]
+    )
+    results: dict[str, ReviewSummary] = {}
+    client = get_async_openai_client()
+    try:
+        response = await acall_with_limiter(
+            get_limiter("openai", "chat"),
+            atimed_call("openai", "chat", client.chat.completions.create),
+            **request,
+        )
+        observe_llm_usage(request["model"], response)
+        content = response.choices[0].message.content or ""
+        batch = ReviewSummaryBatch.model_validate(json.loads(content))
+        for entry in batch.summaries:
+            key = by_position.get(entry.key.strip())
+            if key is not None and key not in results:
+                results[key] = entry.summary
+        logger.info(
+            "Batched review summarization returned %d/%d summaries.",
+            len(results),
+            len(chunk),
+        )
+    except RateLimitExhaustedError:
+        # Retrying each item on its own would multiply the load on an API
+        # that is already throttling us.
+        logger.warning(
+            "Batched review summarization throttled for %d items; not falling back.",
+            len(chunk),
+        )
+        return {key: ReviewSummary(overall_sentiment="Unknown") for key, _ in chunk}
+    except Exception:
+        logger.exception("Batched review summarization failed for %d items.", len(chunk))
+
+    for key, text in chunk:
+        if key in results:
+            store_summary(_summary_cache_key(_summary_request(text)), results[key])
+    missing = [(key, text) for key, text in chunk if key not in results]
+    if missing:
+        logger.warning(
+            "Falling back to single summarization for %d of %d batched items.",
+            len(missing),
+            len(chunk),
+        )
+        summaries = await asyncio.gather(*(asummarize_reviews(text) for _, text in missing))
+        results.update(zip((key for key, _ in missing), summaries))
+    return results
+
+
+async def asummarize_reviews_batch(reviews: dict[str, str]) -> dict[str, ReviewSummary]:
+    logger.info("Starting batched review summarization for %d items.", len(reviews))
+    results: dict[str, ReviewSummary] = {}
+    pending: list[tuple[str, str]] = []
+    for key, reviews_text in reviews.items():
+        clean_text = _prepare_review_text(reviews_text)
+        if clean_text is None:
+            results[key] = ReviewSummary(overall_sentiment="Unknown")
+            continue
+        _, cached = _cached_summary(_summary_request(clean_text))
+        if cached is not None:
+            results[key] = cached
+        else:
+            pending.append((key, clean_text))
+
+    if pending and get_async_openai_client() is None:
+        _log_missing_client()
+        results.update(
+            (key, ReviewSummary(overall_sentiment="Unknown")) for key, _ in pending
+        )
+        return results
+
+    chunks = _chunk_batch_items(pending)
+    for chunk_results in await asyncio.gather(*(_asummarize_chunk(chunk) for chunk in chunks)):
+        results.update(chunk_results)
+    logger.info(
+        "Batched review summarization complete: %d items, %d requests.",
+        len(reviews),
+        len(chunks),
+    )
+    return {key: results[key] for key in reviews}
+
+
+# Collects asummarize_reviews_coalesced calls made within a short window (the
+# vet_candidate fan-out, concurrent batch items) and sends them as one
+# batched request.
+class ReviewSummaryBatcher:
+    def __init__(self, window_seconds: float, max_items: int) -> None:
+        self.window_seconds = window_seconds
+        self.max_items = max_items
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def summarize(self, reviews_text: str) -> ReviewSummary:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((reviews_text, future))
+        if len(self._pending) >= self.max_items:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window_seconds, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        if pending:
+            task = asyncio.ensure_future(self._run(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pending: list[tuple[str, asyncio.Future]]) -> None:
+        # Identical texts (the same contractor from several searches) share a key.
+        keys: dict[str, str] = {}
+        for reviews_text, _ in pending:
+            keys.setdefault(reviews_text, str(len(keys)))
+        try:
+            results = await asummarize_reviews_batch(
+                {key: reviews_text for reviews_text, key in keys.items()}
+            )
+        except Exception:
+            logger.exception("Coalesced review summarization failed.")
+            results = {}
+        for reviews_text, future in pending:
+            if not future.done():
+                future.set_result(
+                    results.get(keys[reviews_text])
+                    or ReviewSummary(overall_sentiment="Unknown")
+                )
+
+
+_batchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ReviewSummaryBatcher]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_review_summary_batcher() -> ReviewSummaryBatcher:
+    loop = asyncio.get_running_loop()
+    batcher = _batchers.get(loop)
+    if batcher is None:
+        batcher = ReviewSummaryBatcher(
+            window_seconds=env_float("SUMMARY_BATCH_WINDOW_MS", 25.0) / 1000.0,
+            max_items=_summary_batch_limits()[0],
+        )
+        _batchers[loop] = batcher
+    return batcher
+
+
+async def asummarize_reviews_coalesced(reviews_text: str) -> ReviewSummary:
+    if _summary_batch_limits()[0] <= 1:
+        return await asummarize_reviews(reviews_text)
+    return await get_review_summary_batcher().summarize(reviews_text)
@@ -0,0 +1,269 @@
+import logging
+import math
+import re
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from tools.env import env_float
+
+logger = logging.getLogger(__name__)
+
+_NON_DIGIT_RE = re.compile(r"\D+")
+_NON_DIGIT_OR_NEWLINE_RE = re.compile(r"[^\d\n]+")
+
+# Byte tables for the hot normalization paths. After lower() and an ASCII
+# encode (non-ASCII characters become "?"), [a-z0-9] is kept, "\n" is kept as
+# a line separator and everything else becomes a space, which is what the
+# regex-based [^a-z0-9 ]+ / \s+ normalization produces.
+_ALNUM_BYTES = b"abcdefghijklmnopqrstuvwxyz0123456789"
+_NORMALIZE_TABLE = bytes(
+    byte if byte in _ALNUM_BYTES or byte == ord("\n") else ord(" ")
+    for byte in range(256)
+)
+_NON_DIGIT_BYTES = bytes(
+    byte for byte in range(256) if not (48 <= byte <= 57 or byte == ord("\n"))
+)
+_ASCII_BYTES = bytes(range(128))
+
+# Dropped from business names before comparing them.
+BUSINESS_NAME_STOPWORDS = frozenset(
+    {
+        "llc",
+        "inc",
+        "co",
+        "corp",
+        "corporation",
+        "company",
+        "ltd",
+        "llp",
+        "pllc",
+        "the",
+        "and",
+    }
+)
+
+DEFAULT_MIN_SCORE = 0.6
+# Evidence weights for the noisy-OR combination in TrigramIndex.match: an
+# exact name or phone match alone clears the default threshold, an address
+# alone does not.
+NAME_WEIGHT = 0.95
+PHONE_WEIGHT = 0.9
+ADDRESS_WEIGHT = 0.5
+MIN_PHONE_DIGITS = 7
+
+
+def normalize_text(text: str) -> str:
+    ascii_text = (text or "").lower().encode("ascii", "replace")
+    return " ".join(ascii_text.translate(_NORMALIZE_TABLE).decode("ascii").split())
+
+
+def digits_only(text: str) -> str:
+    return _NON_DIGIT_RE.sub("", text or "")
+
+
+def _has_non_ascii_decimals(text: str) -> bool:
+    # \d also matches non-ASCII decimal digits, which the byte fast path
+    # drops. ASCII bytes never occur inside multi-byte UTF-8 sequences, so
+    # deleting them leaves exactly the non-ASCII characters.
+    if text.isascii():
+        return False
+    non_ascii = text.encode("utf-8").translate(None, _ASCII_BYTES).decode("utf-8")
+    return any(char.isdecimal() for char in set(non_ascii))
+
+
+def normalize_many(texts: Sequence[str]) -> list[str]:
+    # normalize_text for many single-line strings in one pass over the joined
+    # text. Callers pass lines, so "\n" only separates them.
+    normalized = (
+        "\n".join(texts)
+        .lower()
+        .encode("ascii", "replace")
+        .translate(_NORMALIZE_TABLE)
+        .decode("ascii")
+    )
+    return [" ".join(line.split()) for line in normalized.split("\n")]
+
+
+def digits_many(texts: Sequence[str]) -> list[str]:
+    # digits_only for many single-line strings in one pass.
+    joined = "\n".join(texts)
+    if _has_non_ascii_decimals(joined):
+        return _NON_DIGIT_OR_NEWLINE_RE.sub("", joined).split("\n")
+    return (
+        joined.encode("ascii", "replace")
+        .translate(None, _NON_DIGIT_BYTES)
+        .decode("ascii")
+        .split("\n")
+    )
+
+
+def _name_tokens(normalized: str) -> list[str]:
+    # Runs of single letters are initials ("a b c" from "A.B.C."), so they
+    # are merged into one token before stopwords are dropped.
+    tokens: list[str] = []
+    initials = ""
+    for token in normalized.split():
+        if token in BUSINESS_NAME_STOPWORDS:
+            continue
+        if len(token) == 1 and token.isalpha():
+            initials += token
+            continue
+        if initials:
+            tokens.append(initials)
+            initials = ""
+        tokens.append(token)
+    if initials:
+        tokens.append(initials)
+    return tokens
+
+
+def normalize_business_name(name: str) -> str:
+    return " ".join(_name_tokens(normalize_text((name or "").replace("&", " and "))))
+
+
+def name_trigrams(normalized_name: str) -> set[str]:
+    # Padded so that word starts and ends ("  ab", "bc ") count; trigrams
+    # spanning a space also encode which words are adjacent.
+    padded = f" {normalized_name} "
+    return {padded[idx : idx + 3] for idx in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    index: int
+    score: float
+    name_score: float
+    phone_match: bool
+    address_score: float
+    text: str
+
+
+# Index over the blocks of one results page (Google listings, BBB search
+# results). Each document is a (title, body) pair: the name is compared
+# against the title, phone and address against the whole block. Each title is
+# stored as its set of character trigrams; trigrams that occur in many titles
+# ("roofing", "services") are down-weighted by IDF so the distinctive part of
+# the name decides the match. Body tokens and digits are only computed when a
+# query needs them.
+class TrigramIndex:
+    def __init__(self, documents: Sequence[tuple[str, str]]) -> None:
+        self.documents = list(documents)
+        titles = normalize_many(
+            [
+                " ".join(title.splitlines()).replace("&", " and ")
+                for title, _ in self.documents
+            ]
+        )
+        self._title_trigrams = [
+            name_trigrams(" ".join(_name_tokens(title))) for title in titles
+        ]
+        self._flat_bodies: Optional[list[str]] = None
+        self._body_tokens: Optional[list[set[str]]] = None
+        self._body_digits: Optional[list[str]] = None
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def _bodies(self) -> list[str]:
+        # Flattened to one line each so the whole page is normalized in one pass.
+        if self._flat_bodies is None:
+            self._flat_bodies = [" ".join(body.splitlines()) for _, body in self.documents]
+        return self._flat_bodies
+
+    def _tokens(self) -> list[set[str]]:
+        if self._body_tokens is None:
+            self._body_tokens = [set(body.split()) for body in normalize_many(self._bodies())]
+        return self._body_tokens
+
+    def _digits(self) -> list[str]:
+        if self._body_digits is None:
+            self._body_digits = digits_many(self._bodies())
+        return self._body_digits
+
+    def _name_scores(self, name: str) -> dict[int, float]:
+        normalized_name = normalize_business_name(name)
+        if not normalized_name:
+            return {}
+        query = name_trigrams(normalized_name)
+        shared: dict[int, set[str]] = {}
+        document_frequency: dict[str, int] = dict.fromkeys(query, 0)
+        for doc_index, title_trigrams in enumerate(self._title_trigrams):
+            common = query & title_trigrams
+            if common:
+                shared[doc_index] = common
+                for trigram in common:
+                    document_frequency[trigram] += 1
+
+        doc_count = len(self.documents)
+        weights = {
+            trigram: math.log(1.0 + (doc_count + 1) / (frequency + 1))
+            for trigram, frequency in document_frequency.items()
+        }
+        total = sum(weights.values())
+        return {
+            doc_index: sum(weights[trigram] for trigram in common) / total
+            for doc_index, common in shared.items()
+        }
+
+    def match(
+        self,
+        name: str,
+        phone: Optional[str] = None,
+        address: Optional[str] = None,
+    ) -> list[MatchResult]:
+        # Every document with any evidence, best first; ties keep page order.
+        evidence: dict[int, list[float]] = {
+            doc_index: [name_score, 0.0, 0.0]
+            for doc_index, name_score in self._name_scores(name).items()
+        }
+
+        phone_digits = digits_only(phone or "")[-10:]
+        if len(phone_digits) >= MIN_PHONE_DIGITS:
+            for doc_index, digits in enumerate(self._digits()):
+                if phone_digits in digits:
+                    evidence.setdefault(doc_index, [0.0, 0.0, 0.0])[1] = 1.0
+
+        address_tokens = {
+            token for token in normalize_text(address or "").split() if len(token) >= 4
+        }
+        if address_tokens:
+            for doc_index, tokens in enumerate(self._tokens()):
+                overlap = len(address_tokens & tokens)
+                if overlap:
+                    evidence.setdefault(doc_index, [0.0, 0.0, 0.0])[2] = overlap / len(
+                        address_tokens
+                    )
+
+        results = []
+        for doc_index, (name_score, phone_match, address_score) in evidence.items():
+            score = 1.0 - (
+                (1.0 - NAME_WEIGHT * name_score)
+                * (1.0 - PHONE_WEIGHT * phone_match)
+                * (1.0 - ADDRESS_WEIGHT * address_score)
+            )
+            results.append(
+                MatchResult(
+                    index=doc_index,
+                    score=round(score, 4),
+                    name_score=round(name_score, 4),
+                    phone_match=bool(phone_match),
+                    address_score=round(address_score, 4),
+                    text=self.documents[doc_index][1],
+                )
+            )
+        results.sort(key=lambda result: (-result.score, result.index))
+        return results
+
+    def best_match(
+        self,
+        name: str,
+        phone: Optional[str] = None,
+        address: Optional[str] = None,
+        min_score: Optional[float] = None,
+    ) -> Optional[MatchResult]:
+        if min_score is None:
+            min_score = env_float("MATCH_MIN_SCORE", DEFAULT_MIN_SCORE)
+        results = self.match(name, phone=phone, address=address)
+        if results and results[0].score >= min_score:
+            return results[0]
+        return None
@@ -0,0 +1,185 @@
+import functools
+import json
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+from prometheus_client import Counter, Histogram
+
+from tools.rate_limiter import is_throttle_error
+
+logger = logging.getLogger(__name__)
+
+_DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+_BYTES_BUCKETS = tuple(1024 * 4**power for power in range(9))
+_TOKEN_BUCKETS = (100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000)
+
+NODE_DURATION = Histogram(
+    "discovery_node_duration_seconds",
+    "Duration of discovery graph nodes.",
+    ["node", "outcome"],
+    buckets=_DURATION_BUCKETS,
+)
+UPSTREAM_LATENCY = Histogram(
+    "upstream_request_duration_seconds",
+    "Latency of single external API attempts (Firecrawl, OpenAI).",
+    ["api", "upstream", "outcome"],
+    buckets=_DURATION_BUCKETS,
+)
+PAYLOAD_BYTES = Histogram(
+    "upstream_payload_bytes",
+    "Size of content returned by external APIs.",
+    ["source"],
+    buckets=_BYTES_BUCKETS,
+)
+LLM_TOKENS = Histogram(
+    "llm_tokens",
+    "Tokens per LLM request as reported by the API.",
+    ["model", "kind"],
+    buckets=_TOKEN_BUCKETS,
+)
+FLAGS_RAISED = Counter(
+    "discovery_flags_total", "Flags raised by discovery graph nodes.", ["node"]
+)
+EMPTY_RESULTS = Counter(
+    "upstream_empty_results_total",
+    "External lookups that returned no usable content.",
+    ["source"],
+)
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total", "Persistent cache lookups.", ["namespace", "result"]
+)
+
+
+# Per-job breakdown of where time went, filled in by the node and upstream
+# wrappers below for whatever job is running in the current context.
+class JobTimings:
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.nodes: dict[str, list[float]] = {}
+        self.upstream: dict[str, list[float]] = {}
+
+    def snapshot(self) -> dict[str, Any]:
+        def summarize(bucket: dict[str, list[float]]) -> dict[str, Any]:
+            return {
+                key: {"calls": int(calls), "total_seconds": round(seconds, 3)}
+                for key, (calls, seconds) in sorted(bucket.items())
+            }
+
+        return {
+            "total_seconds": round(time.monotonic() - self.started, 3),
+            "nodes": summarize(self.nodes),
+            "upstream": summarize(self.upstream),
+        }
+
+
+def _accumulate(bucket: dict[str, list[float]], key: str, seconds: float) -> None:
+    entry = bucket.setdefault(key, [0, 0.0])
+    entry[0] += 1
+    entry[1] += seconds
+
+
+_current_timings: ContextVar[Optional[JobTimings]] = ContextVar(
+    "current_timings", default=None
+)
+
+
+@contextmanager
+def record_timings(timings: JobTimings) -> Iterator[JobTimings]:
+    # Tasks created inside (graph nodes, gathered fetches) copy the context,
+    # so they record into the same JobTimings.
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+
+def _record_upstream(api: str, upstream: str, outcome: str, seconds: float) -> None:
+    UPSTREAM_LATENCY.labels(api, upstream, outcome).observe(seconds)
+    timings = _current_timings.get()
+    if timings is not None:
+        _accumulate(timings.upstream, f"{api}:{upstream}", seconds)
+
+
+def _outcome(exc: BaseException) -> str:
+    return "throttled" if is_throttle_error(exc) else "error"
+
+
+def timed_call(api: str, upstream: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+    # Wraps the raw client method, so each retry attempt is one observation
+    # and limiter wait time is not counted as upstream latency.
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            _record_upstream(api, upstream, _outcome(exc), time.perf_counter() - started)
+            raise
+        _record_upstream(api, upstream, "ok", time.perf_counter() - started)
+        return result
+
+    return wrapper
+
+
+def atimed_call(
+    api: str, upstream: str, fn: Callable[..., Awaitable[Any]]
+) -> Callable[..., Awaitable[Any]]:
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            result = await fn(*args, **kwargs)
+        except BaseException as exc:
+            _record_upstream(api, upstream, _outcome(exc), time.perf_counter() - started)
+            raise
+        _record_upstream(api, upstream, "ok", time.perf_counter() - started)
+        return result
+
+    return wrapper
+
+
+def timed_node(name: str, fn: Callable[..., Awaitable[dict]]) -> Callable[..., Awaitable[dict]]:
+    # functools.wraps keeps the node's signature visible to LangGraph, which
+    # only passes `config` to nodes that declare it.
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await fn(*args, **kwargs)
+            outcome = "ok"
+        finally:
+            seconds = time.perf_counter() - started
+            NODE_DURATION.labels(name, outcome).observe(seconds)
+            timings = _current_timings.get()
+            if timings is not None:
+                _accumulate(timings.nodes, name, seconds)
+        if isinstance(result, dict) and result.get("flags"):
+            FLAGS_RAISED.labels(name).inc(len(result["flags"]))
+        return result
+
+    return wrapper
+
+
+def observe_payload(source: str, content: Any) -> None:
+    if not content:
+        EMPTY_RESULTS.labels(source).inc()
+        return
+    if not isinstance(content, (str, bytes)):
+        content = json.dumps(content, default=str)
+    size = len(content.encode("utf-8")) if isinstance(content, str) else len(content)
+    PAYLOAD_BYTES.labels(source).observe(size)
+
+
+def observe_llm_usage(model: str, response: Any) -> None:
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+    for kind in ("prompt_tokens", "completion_tokens"):
+        value = getattr(usage, kind, None)
+        if isinstance(value, int):
+            LLM_TOKENS.labels(model, kind.split("_")[0]).observe(value)
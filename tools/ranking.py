@@ -0,0 +1,202 @@
+import logging
+import math
+import os
+from typing import Optional, Sequence
+
+import numpy as np
+
+from schema.models import RankedContractor, SynthesisResult
+from tools.env import env_float
+
+logger = logging.getLogger(__name__)
+
+FEATURES = (
+    "yelp_rating",
+    "google_rating",
+    "review_volume",
+    "bbb_grade",
+    "bbb_accredited",
+    "years_in_business",
+    "license",
+    "sentiment",
+    "flags",
+)
+
+# Every feature is scaled to 0..1 before weighting; `flags` is a penalty.
+DEFAULT_WEIGHTS = {
+    "yelp_rating": 0.25,
+    "google_rating": 0.25,
+    "review_volume": 0.1,
+    "bbb_grade": 0.15,
+    "bbb_accredited": 0.05,
+    "years_in_business": 0.05,
+    "license": 0.05,
+    "sentiment": 0.1,
+    "flags": -0.15,
+}
+
+BBB_GRADE_SCORES = {
+    "A+": 1.0,
+    "A": 0.95,
+    "A-": 0.9,
+    "B+": 0.8,
+    "B": 0.75,
+    "B-": 0.7,
+    "C+": 0.55,
+    "C": 0.5,
+    "C-": 0.45,
+    "D+": 0.3,
+    "D": 0.25,
+    "D-": 0.2,
+    "F": 0.0,
+}
+# Missing data scores as neutral rather than as bad.
+NEUTRAL_SCORE = 0.5
+SENTIMENT_SCORES = {"positive": 1.0, "mixed": 0.5, "negative": 0.0}
+# Unknown accreditation (None) is neutral, not a penalty.
+ACCREDITATION_SCORES = {True: 1.0, False: 0.0}
+MAX_YEARS = 20
+MAX_FLAGS = 5
+# Review volume is log-scaled and saturates at this many reviews.
+REVIEW_VOLUME_CAP = 1000
+
+
+def weights_from_env() -> dict[str, float]:
+    # RANKING_WEIGHTS="google_rating=0.4,flags=-0.3" overrides single weights.
+    weights = dict(DEFAULT_WEIGHTS)
+    for item in os.getenv("RANKING_WEIGHTS", "").split(","):
+        if not item.strip():
+            continue
+        name, _, value = item.partition("=")
+        name = name.strip()
+        try:
+            if name not in weights:
+                raise ValueError(name)
+            weights[name] = float(value)
+        except ValueError:
+            logger.warning("Ignoring invalid RANKING_WEIGHTS entry '%s'.", item.strip())
+    return weights
+
+
+def _smoothed_ratings(
+    ratings: np.ndarray, counts: np.ndarray, prior_reviews: float
+) -> np.ndarray:
+    # Bayesian average: every rating is pulled toward the review-weighted mean
+    # of all candidates as if it had `prior_reviews` extra reviews at that
+    # mean, so 5.0 from 3 reviews does not beat 4.8 from 400. Missing ratings
+    # get the mean itself.
+    known = ~np.isnan(ratings)
+    weights = np.where(known, counts, 0.0)
+    total = weights.sum()
+    if total > 0:
+        prior = float((np.where(known, ratings, 0.0) * weights).sum() / total)
+    elif known.any():
+        prior = float(ratings[known].mean())
+    else:
+        prior = 3.0
+    prior_reviews = max(prior_reviews, 1e-9)
+    smoothed = (np.where(known, ratings, 0.0) * weights + prior * prior_reviews) / (
+        weights + prior_reviews
+    )
+    return np.clip((smoothed - 1.0) / 4.0, 0.0, 1.0)
+
+
+def build_feature_matrix(
+    summaries: Sequence[SynthesisResult], prior_reviews: Optional[float] = None
+) -> np.ndarray:
+    # One row per candidate, one column per FEATURES entry, all in 0..1.
+    if prior_reviews is None:
+        prior_reviews = env_float("RANKING_PRIOR_REVIEWS", 10.0, minimum=0.0)
+    count = len(summaries)
+    rows = []
+    for summary in summaries:
+        contractor = summary.contractor
+        if contractor is None:
+            rows.append((np.nan,) * 9 + (len(summary.flags),))
+            continue
+        sentiment = (
+            contractor.review_summary.overall_sentiment.strip().lower()
+            if contractor.review_summary
+            else ""
+        )
+        rows.append(
+            (
+                contractor.yelp_rating if contractor.yelp_rating is not None else np.nan,
+                contractor.yelp_review_count or 0,
+                contractor.google_rating if contractor.google_rating is not None else np.nan,
+                contractor.google_review_count or 0,
+                BBB_GRADE_SCORES.get((contractor.bbb_rating or "").upper(), NEUTRAL_SCORE),
+                ACCREDITATION_SCORES.get(contractor.bbb_accredited, NEUTRAL_SCORE),
+                (
+                    contractor.years_in_business
+                    if contractor.years_in_business is not None
+                    else np.nan
+                ),
+                # No license number means the website did not state one.
+                1.0 if contractor.license_number else NEUTRAL_SCORE,
+                SENTIMENT_SCORES.get(sentiment, NEUTRAL_SCORE),
+                len(contractor.red_flags) + len(summary.flags),
+            )
+        )
+    raw = np.array(rows, dtype=float).reshape(count, 10)
+
+    matrix = np.empty((count, len(FEATURES)))
+    if count == 0:
+        return matrix
+    yelp_counts = np.nan_to_num(raw[:, 1])
+    google_counts = np.nan_to_num(raw[:, 3])
+    matrix[:, 0] = _smoothed_ratings(raw[:, 0], yelp_counts, prior_reviews)
+    matrix[:, 1] = _smoothed_ratings(raw[:, 2], google_counts, prior_reviews)
+    matrix[:, 2] = np.minimum(
+        np.log1p(yelp_counts + google_counts) / math.log1p(REVIEW_VOLUME_CAP), 1.0
+    )
+    matrix[:, 3] = np.nan_to_num(raw[:, 4], nan=NEUTRAL_SCORE)
+    matrix[:, 4] = np.nan_to_num(raw[:, 5], nan=NEUTRAL_SCORE)
+    matrix[:, 5] = np.nan_to_num(
+        np.minimum(raw[:, 6], MAX_YEARS) / MAX_YEARS, nan=NEUTRAL_SCORE
+    )
+    matrix[:, 6] = np.nan_to_num(raw[:, 7], nan=NEUTRAL_SCORE)
+    matrix[:, 7] = np.nan_to_num(raw[:, 8], nan=NEUTRAL_SCORE)
+    matrix[:, 8] = np.minimum(np.nan_to_num(raw[:, 9]), MAX_FLAGS) / MAX_FLAGS
+    return matrix
+
+
+def score_matrix(
+    matrix: np.ndarray, weights: Optional[dict[str, float]] = None
+) -> tuple[np.ndarray, np.ndarray]:
+    # Returns (scores, per-feature contributions); scores are row sums.
+    weights = weights or weights_from_env()
+    weight_vector = np.array([weights.get(name, 0.0) for name in FEATURES])
+    contributions = matrix * weight_vector
+    return contributions.sum(axis=1), contributions
+
+
+def rank_candidates(
+    summaries: Sequence[SynthesisResult],
+    weights: Optional[dict[str, float]] = None,
+    prior_reviews: Optional[float] = None,
+    limit: Optional[int] = None,
+) -> list[RankedContractor]:
+    # Scores every candidate; `limit` only caps how many results are built.
+    if not summaries:
+        return []
+    matrix = build_feature_matrix(summaries, prior_reviews)
+    scores, contributions = score_matrix(matrix, weights)
+    # Stable sort on the negated score keeps Yelp order for ties.
+    order = np.argsort(-scores, kind="stable")
+    if limit is not None:
+        order = order[:limit]
+    rounded_scores = np.round(scores, 4)[order].tolist()
+    rounded_contributions = np.round(contributions, 4)[order].tolist()
+    return [
+        RankedContractor(
+            rank=rank,
+            contractor_name=summaries[index].contractor_name,
+            selected_contractor_index=summaries[index].selected_contractor_index,
+            score=score,
+            contributions=dict(zip(FEATURES, row)),
+        )
+        for rank, (index, score, row) in enumerate(
+            zip(order.tolist(), rounded_scores, rounded_contributions), start=1
+        )
+    ]
@@ -0,0 +1,242 @@
+import asyncio
+import logging
+import re
+import threading
+import time
+from typing import Any, Awaitable, Callable
+
+from tools.env import env_float
+
+logger = logging.getLogger(__name__)
+
+# Defaults per API, overridable with RATE_LIMIT_<API>_RPS and
+# RATE_LIMIT_<API>_MAX_IN_FLIGHT.
+DEFAULT_LIMITS = {
+    "scrape": {"rps": 5.0, "max_in_flight": 10},
+    "extract": {"rps": 2.0, "max_in_flight": 5},
+    "openai": {"rps": 10.0, "max_in_flight": 20},
+}
+
+_POLL_SECONDS = 0.05
+# A 429 only counts when the message presents it as a status ("HTTP 429",
+# "status code: 429"); a bare "429" is as likely part of a URL or ZIP code.
+_THROTTLE_MESSAGE_RE = re.compile(
+    r"\b(?:http(?:/[\d.]+)?|status(?:[\s_]code)?|code|error)\W{0,3}429\b"
+    r"|\btoo many requests\b|\brate[\s_-]?limit",
+    re.IGNORECASE,
+)
+
+
+def is_throttle_error(exc: BaseException) -> bool:
+    status_code = getattr(exc, "status_code", None) or getattr(
+        getattr(exc, "response", None), "status_code", None
+    )
+    if status_code == 429:
+        return True
+    if isinstance(exc, (TimeoutError, asyncio.TimeoutError)):
+        return True
+    name = type(exc).__name__.lower()
+    if "ratelimit" in name or "timeout" in name:
+        return True
+    return _THROTTLE_MESSAGE_RE.search(str(exc)) is not None
+
+
+# Raised when a call is still throttled after RATE_LIMIT_MAX_RETRIES retries,
+# so callers can report rate-limit exhaustion separately from other errors.
+# The name keeps is_throttle_error() true for it.
+class RateLimitExhaustedError(Exception):
+    def __init__(self, limiter_name: str, attempts: int) -> None:
+        super().__init__(f"'{limiter_name}' still throttled after {attempts} attempts")
+        self.limiter_name = limiter_name
+        self.attempts = attempts
+
+
+# Token bucket plus in-flight cap, both adjusted AIMD-style: every success
+# nudges the rate and concurrency up, a 429/timeout halves them. Decreases
+# are applied at most once per cooldown so a burst of throttled responses to
+# requests that were already in flight counts as a single congestion signal.
+class AdaptiveLimiter:
+    def __init__(
+        self,
+        name: str,
+        rate_per_second: float,
+        max_in_flight: int,
+        min_rate: float = 0.2,
+        additive_step: float | None = None,
+        decrease_factor: float = 0.5,
+        decrease_cooldown_seconds: float = 1.0,
+    ) -> None:
+        self.name = name
+        self.max_rate = rate_per_second
+        self.max_in_flight = max_in_flight
+        self.min_rate = min(min_rate, rate_per_second)
+        self.additive_step = (
+            additive_step if additive_step is not None else rate_per_second / 20
+        )
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown_seconds = decrease_cooldown_seconds
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+        self._rate = rate_per_second
+        self._concurrency_limit = float(max_in_flight)
+        self._tokens = max(1.0, rate_per_second)
+        self._updated = time.monotonic()
+        self._in_flight = 0
+        self._throttle_count = 0
+
+    def _try_acquire(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            burst = max(1.0, self._rate)
+            self._tokens = min(burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._in_flight >= max(1, int(self._concurrency_limit)):
+                return _POLL_SECONDS
+            if self._tokens < 1.0:
+                return (1.0 - self._tokens) / self._rate
+            self._tokens -= 1.0
+            self._in_flight += 1
+            return 0.0
+
+    def acquire(self) -> None:
+        while (wait_seconds := self._try_acquire()) > 0:
+            time.sleep(wait_seconds)
+
+    async def aacquire(self) -> None:
+        while (wait_seconds := self._try_acquire()) > 0:
+            await asyncio.sleep(wait_seconds)
+
+    def release(self, outcome: str = "success") -> None:
+        # outcome is "success", "throttled" or "error"; plain errors leave the
+        # rate untouched since they say nothing about upstream capacity.
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            if outcome == "error":
+                return
+            if outcome == "throttled":
+                self._throttle_count += 1
+                now = time.monotonic()
+                if now - self._last_decrease < self.decrease_cooldown_seconds:
+                    return
+                self._last_decrease = now
+                self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+                self._concurrency_limit = max(
+                    1.0, self._concurrency_limit * self.decrease_factor
+                )
+                self._tokens = min(self._tokens, 0.0)
+                logger.warning(
+                    "Upstream '%s' throttled; backing off to %.2f req/s, %d in flight.",
+                    self.name,
+                    self._rate,
+                    int(self._concurrency_limit),
+                )
+                return
+            self._rate = min(self.max_rate, self._rate + self.additive_step)
+            self._concurrency_limit = min(
+                float(self.max_in_flight),
+                self._concurrency_limit + 1.0 / max(1.0, self._concurrency_limit),
+            )
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "rate_per_second": self._rate,
+                "max_rate_per_second": self.max_rate,
+                "concurrency_limit": int(self._concurrency_limit),
+                "in_flight": self._in_flight,
+                "throttle_count": self._throttle_count,
+            }
+
+
+_limiters: dict[str, AdaptiveLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(api: str, upstream: str) -> AdaptiveLimiter:
+    key = f"{api}:{upstream}"
+    limiter = _limiters.get(key)
+    if limiter is not None:
+        return limiter
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            defaults = DEFAULT_LIMITS.get(api, {"rps": 5.0, "max_in_flight": 10})
+            limiter = AdaptiveLimiter(
+                key,
+                rate_per_second=env_float(
+                    f"RATE_LIMIT_{api.upper()}_RPS", defaults["rps"]
+                ),
+                max_in_flight=int(
+                    env_float(
+                        f"RATE_LIMIT_{api.upper()}_MAX_IN_FLIGHT",
+                        defaults["max_in_flight"],
+                    )
+                ),
+            )
+            _limiters[key] = limiter
+        return limiter
+
+
+def limiter_snapshots() -> list[dict[str, Any]]:
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return [limiter.snapshot() for limiter in limiters]
+
+
+def _max_retries() -> int:
+    return int(env_float("RATE_LIMIT_MAX_RETRIES", 3))
+
+
+def _backoff_seconds(attempt: int) -> float:
+    return env_float("RATE_LIMIT_BACKOFF_SECONDS", 0.5) * (2**attempt)
+
+
+def call_with_limiter(
+    limiter: AdaptiveLimiter, fn: Callable[..., Any], *args, **kwargs
+) -> Any:
+    attempt = 0
+    while True:
+        limiter.acquire()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as exc:
+            throttled = is_throttle_error(exc)
+            limiter.release("throttled" if throttled else "error")
+            if not throttled:
+                raise
+            if attempt >= _max_retries():
+                raise RateLimitExhaustedError(limiter.name, attempt + 1) from exc
+            time.sleep(_backoff_seconds(attempt))
+            attempt += 1
+            continue
+        except BaseException:
+            limiter.release("error")
+            raise
+        limiter.release()
+        return result
+
+
+async def acall_with_limiter(
+    limiter: AdaptiveLimiter, fn: Callable[..., Awaitable[Any]], *args, **kwargs
+) -> Any:
+    attempt = 0
+    while True:
+        await limiter.aacquire()
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception as exc:
+            throttled = is_throttle_error(exc)
+            limiter.release("throttled" if throttled else "error")
+            if not throttled:
+                raise
+            if attempt >= _max_retries():
+                raise RateLimitExhaustedError(limiter.name, attempt + 1) from exc
+            await asyncio.sleep(_backoff_seconds(attempt))
+            attempt += 1
+            continue
+        except BaseException:
+            limiter.release("error")
+            raise
+        limiter.release()
+        return result
@@ -0,0 +1,200 @@
+import io
+import json
+import logging
+import os
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+from schema.models import ReviewSummary
+from tools.llm_tool import (
+    build_summary_request,
+    cached_summary,
+    get_openai_client,
+    store_summary,
+)
+
+logger = logging.getLogger(__name__)
+
+BATCH_COMPLETED = "completed"
+BATCH_FAILED_STATUSES = {"failed", "expired", "cancelled"}
+
+
+# Offline bulk summarization: requests are queued with a batch backend and
+# collected later, trading latency for the lower batch price. Backends take
+# chat-completion requests keyed by custom_id and return the response bodies.
+class SummaryBatchBackend(ABC):
+    @abstractmethod
+    def submit(self, requests: dict[str, dict]) -> str: ...
+
+    @abstractmethod
+    def status(self, batch_id: str) -> str: ...
+
+    @abstractmethod
+    def results(self, batch_id: str) -> dict[str, dict]: ...
+
+
+class OpenAISummaryBatchBackend(SummaryBatchBackend):
+    def __init__(self, client=None, completion_window: str = "24h") -> None:
+        self._client = client
+        self.completion_window = completion_window
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_openai_client()
+        return self._client
+
+    def submit(self, requests: dict[str, dict]) -> str:
+        if self.client is None:
+            raise RuntimeError("OPENAI_API_KEY is not configured.")
+        lines = "\n".join(
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": request,
+                }
+            )
+            for custom_id, request in requests.items()
+        )
+        batch_file = self.client.files.create(
+            file=("review_summaries.jsonl", io.BytesIO(lines.encode("utf-8"))),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self.completion_window,
+        )
+        return batch.id
+
+    def status(self, batch_id: str) -> str:
+        return self.client.batches.retrieve(batch_id).status
+
+    def results(self, batch_id: str) -> dict[str, dict]:
+        batch = self.client.batches.retrieve(batch_id)
+        if not batch.output_file_id:
+            return {}
+        output = self.client.files.content(batch.output_file_id).text
+        results = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                results[record["custom_id"]] = response.get("body") or {}
+        return results
+
+
+def _stub_summary(request: dict) -> ReviewSummary:
+    return ReviewSummary(overall_sentiment="Unknown")
+
+
+# In-process stand-in for a batch API, for tests and local runs: every batch
+# completes immediately with summaries from `responder`.
+class LocalSummaryBatchBackend(SummaryBatchBackend):
+    def __init__(
+        self, responder: Optional[Callable[[dict], ReviewSummary]] = None
+    ) -> None:
+        self.responder = responder or _stub_summary
+        self.batches: dict[str, dict[str, dict]] = {}
+
+    def submit(self, requests: dict[str, dict]) -> str:
+        batch_id = f"local-{uuid.uuid4().hex}"
+        self.batches[batch_id] = dict(requests)
+        return batch_id
+
+    def status(self, batch_id: str) -> str:
+        return BATCH_COMPLETED if batch_id in self.batches else "failed"
+
+    def results(self, batch_id: str) -> dict[str, dict]:
+        return {
+            custom_id: {
+                "choices": [
+                    {"message": {"content": self.responder(request).model_dump_json()}}
+                ]
+            }
+            for custom_id, request in self.batches.get(batch_id, {}).items()
+        }
+
+
+def create_summary_batch_backend() -> SummaryBatchBackend:
+    backend = os.getenv("SUMMARY_BATCH_BACKEND", "openai").strip().lower()
+    if backend == "local":
+        return LocalSummaryBatchBackend()
+    return OpenAISummaryBatchBackend()
+
+
+def summarize_reviews_offline(
+    reviews: dict[str, str],
+    backend: Optional[SummaryBatchBackend] = None,
+    poll_interval_seconds: float = 30.0,
+    timeout_seconds: float = 24 * 60 * 60,
+) -> dict[str, ReviewSummary]:
+    # Blocks until the batch finishes. Cached summaries are returned without
+    # being queued, and new results are cached under the same keys as
+    # summarize_reviews so online calls reuse them.
+    backend = backend or create_summary_batch_backend()
+    results: dict[str, ReviewSummary] = {}
+    queued: dict[str, tuple[str, str]] = {}
+    requests: dict[str, dict] = {}
+    for key, reviews_text in reviews.items():
+        prepared = build_summary_request(reviews_text)
+        if prepared is None:
+            results[key] = ReviewSummary(overall_sentiment="Unknown")
+            continue
+        request, cache_key = prepared
+        cached = cached_summary(cache_key)
+        if cached is not None:
+            results[key] = cached
+            continue
+        custom_id = f"summary-{len(requests)}"
+        queued[custom_id] = (key, cache_key)
+        requests[custom_id] = request
+
+    if not requests:
+        return results
+
+    try:
+        batch_id = backend.submit(requests)
+        logger.info("Queued %d review summaries as batch '%s'.", len(requests), batch_id)
+        deadline = time.monotonic() + timeout_seconds
+        status = backend.status(batch_id)
+        while status != BATCH_COMPLETED and status not in BATCH_FAILED_STATUSES:
+            if time.monotonic() >= deadline:
+                logger.warning(
+                    "Review summary batch '%s' did not finish within %.0fs.",
+                    batch_id,
+                    timeout_seconds,
+                )
+                break
+            time.sleep(poll_interval_seconds)
+            status = backend.status(batch_id)
+        bodies = backend.results(batch_id) if status == BATCH_COMPLETED else {}
+    except Exception:
+        logger.exception("Review summary batch failed.")
+        bodies = {}
+
+    for custom_id, (key, cache_key) in queued.items():
+        body = bodies.get(custom_id)
+        try:
+            summary = ReviewSummary.model_validate(
+                json.loads(body["choices"][0]["message"]["content"] or "")
+            )
+        except Exception:
+            if body is not None:
+                logger.warning("Unparseable batch summary for custom_id='%s'.", custom_id)
+            results[key] = ReviewSummary(overall_sentiment="Unknown")
+            continue
+        store_summary(cache_key, summary)
+        results[key] = summary
+    logger.info(
+        "Offline review summarization complete: %d items, %d from batch.",
+        len(reviews),
+        len(bodies),
+    )
+    return {key: results[key] for key in reviews}
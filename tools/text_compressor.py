@@ -0,0 +1,183 @@
+import logging
+import re
+from typing import Optional, Sequence
+
+from tools.env import env_int
+from tools.matching import normalize_text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_BUDGET = 2500
+# Longer units (tables, run-on scraped text) are split into chunks of this
+# size so one unit cannot take a whole source budget.
+MAX_UNIT_TOKENS = 80
+MIN_UNIT_WORDS = 3
+
+# Rough BPE approximation: a token per short word piece or punctuation mark.
+# Only used for budgeting, so it just has to be consistent and cheap.
+_TOKEN_RE = re.compile(r"\w{1,6}|[^\w\s]")
+
+_IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_MARKUP_RE = re.compile(r"^[#>\s*+\-|]+|[*_`~|]+|\\")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(])")
+
+# Words that mark a sentence as carrying review or reputation signal.
+SIGNAL_TERMS = frozenset(
+    {
+        "recommend", "recommended", "professional", "quality", "great", "excellent",
+        "amazing", "friendly", "responsive", "honest", "reliable", "clean", "fair",
+        "price", "prices", "pricing", "quote", "estimate", "expensive", "cheap",
+        "late", "delay", "delayed", "never", "poor", "bad", "terrible", "worst",
+        "rude", "unprofessional", "damage", "damaged", "refund", "scam", "avoid",
+        "complaint", "complaints", "resolved", "unresolved", "warranty", "leak",
+        "leaks", "repair", "repaired", "install", "installed", "job", "work",
+        "crew", "team", "service", "communication", "schedule", "time",
+        "rating", "rated", "stars", "star", "review", "reviews", "accredited",
+        "accreditation", "bbb", "license", "licensed", "insured", "years",
+    }
+)
+# Words that mark page chrome rather than content.
+BOILERPLATE_TERMS = frozenset(
+    {
+        "sign", "login", "log", "cookie", "cookies", "privacy", "terms", "menu",
+        "directions", "share", "save", "copyright", "subscribe", "skip", "navigation",
+        "download", "app", "feedback", "advertise", "careers",
+    }
+)
+
+
+def estimate_tokens(text: str) -> int:
+    return len(_TOKEN_RE.findall(text or ""))
+
+
+def strip_markdown_noise(text: str) -> str:
+    # Drops images, URLs and HTML, keeps link text, and removes markdown markup
+    # so only readable text is left, one line per source line.
+    text = _IMAGE_RE.sub(" ", text or "")
+    text = _LINK_RE.sub(r"\1", text)
+    text = _URL_RE.sub(" ", text)
+    text = _HTML_TAG_RE.sub(" ", text)
+    lines = []
+    for line in text.splitlines():
+        line = " ".join(_MARKUP_RE.sub(" ", line).split())
+        if line:
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def _split_units(text: str) -> list[str]:
+    units = []
+    for line in text.splitlines():
+        for sentence in _SENTENCE_SPLIT_RE.split(line):
+            words = sentence.split()
+            if len(words) < MIN_UNIT_WORDS and not any(c.isdigit() for c in sentence):
+                # Nav labels and lone words ("Menu", "Photos"); ratings such
+                # as "4.8" are short but kept.
+                continue
+            if estimate_tokens(sentence) <= MAX_UNIT_TOKENS:
+                units.append(sentence)
+                continue
+            chunk: list[str] = []
+            chunk_tokens = 0
+            for word in words:
+                word_tokens = estimate_tokens(word)
+                if chunk and chunk_tokens + word_tokens > MAX_UNIT_TOKENS:
+                    units.append(" ".join(chunk))
+                    chunk, chunk_tokens = [], 0
+                chunk.append(word)
+                chunk_tokens += word_tokens
+            if chunk:
+                units.append(" ".join(chunk))
+    return units
+
+
+def _signal_score(normalized_unit: str, raw_unit: str) -> float:
+    words = normalized_unit.split()
+    if not words:
+        return 0.0
+    signal = sum(1 for word in words if word in SIGNAL_TERMS)
+    boilerplate = sum(1 for word in words if word in BOILERPLATE_TERMS)
+    score = signal / len(words) ** 0.5 - 2.0 * boilerplate / len(words)
+    if any(char.isdigit() for char in raw_unit):
+        # Ratings, review counts, years in business, complaint counts.
+        score += 0.5
+    if raw_unit.endswith((".", "!", "?")):
+        # Prose rather than labels or table cells.
+        score += 0.25
+    return score
+
+
+def _select_units(
+    units: list[tuple[int, str, int, float]], budget: int
+) -> list[tuple[int, str, int, float]]:
+    # Highest-signal units that fit the budget, returned in page order.
+    chosen = []
+    remaining = budget
+    for unit in sorted(units, key=lambda unit: (-unit[3], unit[0])):
+        if unit[2] <= remaining:
+            chosen.append(unit)
+            remaining -= unit[2]
+    chosen.sort(key=lambda unit: unit[0])
+    return chosen
+
+
+def _allocate_budgets(needs: list[int], budget: int) -> list[int]:
+    # Equal shares, with whatever a small source does not need handed on to
+    # the larger ones, so every non-empty source gets a fair slice.
+    budgets = [0] * len(needs)
+    remaining = budget
+    pending = sorted(
+        (index for index, need in enumerate(needs) if need), key=lambda index: needs[index]
+    )
+    while pending:
+        share = remaining // len(pending)
+        index = pending.pop(0)
+        budgets[index] = min(needs[index], share)
+        remaining -= budgets[index]
+    return budgets
+
+
+def compress_sources(
+    sources: Sequence[tuple[str, Optional[str]]],
+    token_budget: Optional[int] = None,
+) -> str:
+    # Builds LLM input from labelled sources: markdown noise stripped,
+    # sentences repeated within or across sources dropped, and each source
+    # cut to its share of the token budget by keeping its highest-signal
+    # sentences in their original order.
+    if token_budget is None:
+        token_budget = env_int("SUMMARY_INPUT_TOKEN_BUDGET", DEFAULT_TOKEN_BUDGET, minimum=1)
+
+    seen: set[str] = set()
+    source_units: list[list[tuple[int, str, int, float]]] = []
+    for _, text in sources:
+        units = []
+        for position, unit in enumerate(_split_units(strip_markdown_noise(text or ""))):
+            normalized = normalize_text(unit)
+            if not normalized or normalized in seen:
+                continue
+            seen.add(normalized)
+            units.append(
+                (position, unit, estimate_tokens(unit), _signal_score(normalized, unit))
+            )
+        source_units.append(units)
+
+    needs = [sum(unit[2] for unit in units) for units in source_units]
+    budgets = _allocate_budgets(needs, token_budget)
+
+    parts = []
+    for (label, text), units, budget in zip(sources, source_units, budgets):
+        chosen = _select_units(units, budget)
+        if chosen:
+            parts.append(f"{label}: " + " ".join(unit[1] for unit in chosen))
+        logger.debug(
+            "Compressed source '%s' from %d to %d tokens (budget %d).",
+            label,
+            estimate_tokens(text or ""),
+            sum(unit[2] for unit in chosen),
+            budget,
+        )
+    return "\n\n".join(parts)
@@ -1,4 +1,29 @@
-from .state import AgentState
-from .discovery_vetting_graph import build_discovery_vetting_graph
+import importlib
 
-__all__ = ["AgentState", "build_discovery_vetting_graph"]
+# Imported on first access: the graph module pulls in LangGraph and the tool
+# SDKs, which callers that only need the state types should not pay for.
+_EXPORTS = {
+    "AgentState": "state",
+    "CandidateTask": "state",
+    "build_discovery_vetting_graph": "discovery_vetting_graph",
+    "get_discovery_vetting_graph": "discovery_vetting_graph",
+    "graph_build_stats": "discovery_vetting_graph",
+    "initial_agent_state": "state",
+    "BatchProgress": "batch_runner",
+    "run_discovery_batch": "batch_runner",
+    "EnrichmentMemo": "enrichment_memo",
+    "contractor_identity_key": "enrichment_memo",
+    "VettingRecordStore": "vetting_records",
+    "vetting_records": "vetting_records",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Callable, Optional
+
+from tools.env import env_int
+from tools.metrics import JobTimings, record_timings
+from workflows.discovery_vetting_graph import get_discovery_vetting_graph
+from workflows.enrichment_memo import EnrichmentMemo
+from workflows.state import initial_agent_state
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_PARALLEL_ITEMS = 4
+
+
+class BatchProgress:
+    def __init__(self, total: int, memo: EnrichmentMemo) -> None:
+        self.total = total
+        self.memo = memo
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+
+    def snapshot(self) -> dict[str, Any]:
+        elapsed = (self.finished or time.monotonic()) - self.started
+        done = self.completed + self.failed
+        return {
+            "total_items": self.total,
+            "running_items": self.running,
+            "completed_items": self.completed,
+            "failed_items": self.failed,
+            "elapsed_seconds": round(elapsed, 3),
+            "items_per_second": round(done / elapsed, 3) if elapsed > 0 else 0.0,
+            "shared_enrichment": self.memo.stats(),
+        }
+
+
+async def _run_item(
+    index: int,
+    item: dict[str, Any],
+    memo: EnrichmentMemo,
+    progress: BatchProgress,
+    slots: asyncio.Semaphore,
+    on_item_started: Optional[Callable[[int], None]],
+) -> dict[str, Any]:
+    async with slots:
+        progress.running += 1
+        if on_item_started is not None:
+            on_item_started(index)
+        started = time.monotonic()
+        try:
+            with record_timings(JobTimings()) as timings:
+                final_state = await get_discovery_vetting_graph().ainvoke(
+                    initial_agent_state(
+                        item.get("service_type"),
+                        item.get("zip_code") or "",
+                        target_contractor_count=item.get("target_contractor_count") or 5,
+                        vet_all_candidates=bool(item.get("vet_all_candidates")),
+                    ),
+                    config={"configurable": {"enrichment_memo": memo}},
+                )
+            progress.completed += 1
+            return {
+                "index": index,
+                "status": "completed",
+                "final_state": final_state,
+                "timings": timings.snapshot(),
+                "duration_seconds": time.monotonic() - started,
+            }
+        except Exception as exc:
+            logger.exception(
+                "Batch item %d failed for service='%s' zip='%s'.",
+                index,
+                item.get("service_type"),
+                item.get("zip_code"),
+            )
+            progress.failed += 1
+            return {
+                "index": index,
+                "status": "failed",
+                "error": str(exc),
+                "duration_seconds": time.monotonic() - started,
+            }
+        finally:
+            progress.running -= 1
+
+
+async def run_discovery_batch(
+    items: list[dict[str, Any]],
+    progress: Optional[BatchProgress] = None,
+    max_parallel_items: Optional[int] = None,
+    on_item_started: Optional[Callable[[int], None]] = None,
+) -> AsyncIterator[dict[str, Any]]:
+    # Runs every item through the discovery graph with one shared
+    # EnrichmentMemo, so a contractor returned for several ZIPs or repeated
+    # items is enriched once. Outcomes are yielded as items finish.
+    if progress is None:
+        progress = BatchProgress(len(items), EnrichmentMemo())
+    parallel_items = max_parallel_items or env_int(
+        "DISCOVERY_BATCH_PARALLEL_ITEMS", DEFAULT_BATCH_PARALLEL_ITEMS, minimum=1
+    )
+    slots = asyncio.Semaphore(parallel_items)
+    tasks = [
+        asyncio.create_task(
+            _run_item(index, item, progress.memo, progress, slots, on_item_started)
+        )
+        for index, item in enumerate(items)
+    ]
+    logger.info("Started discovery batch with %d items.", len(items))
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        progress.finished = time.monotonic()
+        logger.info("Discovery batch finished: %s", progress.snapshot())
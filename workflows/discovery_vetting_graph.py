@@ -1,19 +1,75 @@
+import asyncio
+import hashlib
 import logging
-import json
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, StateGraph
-
+from langgraph.types import Send
+
+from schema.models import (
+    BBBProfile,
+    BlobRef,
+    ContractorWebsiteInfo,
+    GoogleListing,
+    ReviewSummary,
+    SynthesisResult,
+    VettedContractor,
+    YelpSource,
+)
+from tools.bbb_parser import parse_bbb_markdown
+from tools.blob_store import blob_store
+from tools.cache import make_cache_key
+from tools.env import env_int
 from tools.firecrawl_tool import (
-    analyze_contractor_website,
-    get_bbb_info,
-    get_google_reviews,
-    search_contractors,
+    aanalyze_contractor_website,
+    aget_bbb_info,
+    aget_google_reviews,
+    asearch_contractors,
+)
+from tools.google_listing import parse_google_listing
+from tools.llm_tool import asummarize_reviews_coalesced, summary_fingerprint
+from tools.metrics import timed_node
+from tools.ranking import rank_candidates
+from tools.rate_limiter import RateLimitExhaustedError
+from tools.text_compressor import compress_sources, estimate_tokens
+from workflows.enrichment_memo import (
+    EnrichmentMemo,
+    contractor_identity_key,
+    enrichment_memo_from_config,
 )
-from tools.llm_tool import summarize_reviews
-from workflows.state import AgentState
+from workflows.state import AgentState, CandidateTask
+from workflows.vetting_records import vetting_records
 
 logger = logging.getLogger(__name__)
 
+ENRICHMENT_NODES = ("scrape_google", "scrape_bbb", "scrape_website")
+LOW_BBB_GRADES = {"C+", "C", "C-", "D+", "D", "D-", "F"}
+# Below this, parsed Google numbers are kept on the listing but not copied to
+# VettedContractor (e.g. a rating line found without the listing link).
+GOOGLE_LISTING_MIN_CONFIDENCE = 0.5
+DEFAULT_MAX_CONCURRENCY = 5
+# Part of every flag raised when a source is still throttled after all rate
+# limiter retries. Such a result is incomplete for a transient reason, so it
+# must not be reused for later identical requests.
+THROTTLED_FLAG = "throttled (rate limit retries exhausted)"
+
+# Compiled graphs are immutable and safe to share across jobs, so each
+# configuration is compiled once per process.
+_compiled_graphs: dict[str, Any] = {}
+_compiled_graphs_lock = threading.Lock()
+_graph_build_stats: dict[str, dict[str, Any]] = {}
+
+# Nodes return only the keys they change. `flags` is reducer-backed in
+# AgentState, so each node returns just the flags it raised.
+
+
+def was_throttled(flags: list[str] | None) -> bool:
+    return any(THROTTLED_FLAG in flag for flag in flags or [])
+
 
 def _resolve_selected_yelp_candidate(state: AgentState):
     candidates = state.get("yelp_candidates") or []
@@ -27,13 +83,34 @@ def _resolve_selected_yelp_candidate(state: AgentState):
     return candidates[selected_index]
 
 
-def scrape_yelp_node(state: AgentState) -> AgentState:
-    updated_state = dict(state)
-    flags = list(updated_state.get("flags", []))
+def _flag_invalid_selection(state: AgentState, selected_candidate, flags: list[str]) -> None:
+    yelp_candidates = state.get("yelp_candidates") or []
+    selected_index = state.get("selected_contractor_index")
+    if yelp_candidates and selected_candidate is None:
+        logger.warning(
+            "Selected contractor index '%s' is invalid for %d Yelp candidates.",
+            selected_index,
+            len(yelp_candidates),
+        )
+        flags.append(
+            f"Invalid selected_contractor_index='{selected_index}' for Yelp candidates."
+        )
+
+
+def _resolve_contractor_name(state: AgentState, selected_candidate) -> str:
+    return (
+        (selected_candidate.name if selected_candidate else None)
+        or state.get("contractor_name")
+        or ""
+    ).strip()
+
+
+async def scrape_yelp_node(state: AgentState) -> dict[str, Any]:
+    flags: list[str] = []
 
-    zip_code = (updated_state.get("zip_code") or "").strip()
-    service_type = (updated_state.get("service_type") or "home improvement").strip()
-    target_count = updated_state.get("target_contractor_count") or 5
+    zip_code = (state.get("zip_code") or "").strip()
+    service_type = (state.get("service_type") or "home improvement").strip()
+    target_count = state.get("target_contractor_count") or 5
     if target_count <= 0:
         logger.warning(
             "Invalid target_contractor_count='%s'; defaulting to 5.", target_count
@@ -53,12 +130,10 @@ def scrape_yelp_node(state: AgentState) -> AgentState:
     if not zip_code:
         logger.warning("Skipping Yelp discovery because zip_code is missing.")
         flags.append("Missing zip_code for Yelp discovery.")
-        updated_state["flags"] = flags
-        updated_state["raw_yelp_data"] = ""
-        return updated_state
+        return {"flags": flags, "raw_yelp_data": ""}
 
     try:
-        search_result = search_contractors(service_type, zip_code)
+        search_result = await asearch_contractors(service_type, zip_code)
         contractors = search_result.contractors[:target_count]
         if not contractors:
             logger.warning(
@@ -69,9 +144,7 @@ def scrape_yelp_node(state: AgentState) -> AgentState:
             flags.append(
                 f"No Yelp contractors found for service='{service_type}' in zip='{zip_code}'."
             )
-            updated_state["flags"] = flags
-            updated_state["raw_yelp_data"] = ""
-            return updated_state
+            return {"flags": flags, "raw_yelp_data": ""}
 
         if len(search_result.contractors) < target_count:
             logger.warning(
@@ -85,28 +158,38 @@ def scrape_yelp_node(state: AgentState) -> AgentState:
                 f"Only {len(search_result.contractors)} contractors found; target was {target_count}."
             )
 
-        if not (updated_state.get("contractor_name") or "").strip():
-            updated_state["contractor_name"] = contractors[0].name
-
-        updated_state["yelp_candidates"] = contractors
-        updated_state["selected_contractor_index"] = 0
-        updated_state["yelp_url"] = search_result.source_url
-        updated_state["raw_yelp_data"] = "\n".join(
-            f"{idx}. {contractor.name} | rating={contractor.rating} | reviews={contractor.reviews_count}"
-            f" | phone={contractor.phone or 'n/a'} | website={contractor.website or 'n/a'}"
-            f" | yelp_profile_url={contractor.yelp_profile_url or 'n/a'}"
-            f" | address={contractor.address or 'n/a'}"
-            for idx, contractor in enumerate(contractors, start=1)
-        )
-        updated_state["flags"] = flags
-
         logger.info(
             "Yelp discovery complete for service='%s' zip='%s' with %d candidates.",
             service_type,
             zip_code,
             len(contractors),
         )
-        return updated_state
+        # The enrichment branches run in parallel and must not race on
+        # contractor_name, so the selected candidate's name is resolved here.
+        return {
+            "contractor_name": contractors[0].name,
+            "yelp_candidates": contractors,
+            "selected_contractor_index": 0,
+            "yelp_url": search_result.source_url,
+            "raw_yelp_data": "\n".join(
+                f"{idx}. {contractor.name} | rating={contractor.rating} | reviews={contractor.reviews_count}"
+                f" | phone={contractor.phone or 'n/a'} | website={contractor.website or 'n/a'}"
+                f" | yelp_profile_url={contractor.yelp_profile_url or 'n/a'}"
+                f" | address={contractor.address or 'n/a'}"
+                for idx, contractor in enumerate(contractors, start=1)
+            ),
+            "flags": flags,
+        }
+    except RateLimitExhaustedError:
+        logger.warning(
+            "Yelp discovery throttled for service='%s', zip='%s'.",
+            service_type,
+            zip_code,
+        )
+        flags.append(
+            f"Yelp discovery {THROTTLED_FLAG} for service='{service_type}' in zip='{zip_code}'."
+        )
+        return {"flags": flags, "raw_yelp_data": ""}
     except Exception:
         logger.exception(
             "Yelp discovery failed for service='%s', zip='%s'.",
@@ -116,37 +199,66 @@ def scrape_yelp_node(state: AgentState) -> AgentState:
         flags.append(
             f"Yelp discovery failed for service='{service_type}' in zip='{zip_code}'."
         )
-        updated_state["flags"] = flags
-        updated_state["raw_yelp_data"] = ""
-        return updated_state
+        return {"flags": flags, "raw_yelp_data": ""}
 
 
-def scrape_google_node(state: AgentState) -> AgentState:
-    updated_state = dict(state)
-    flags = list(updated_state.get("flags", []))
+async def _memoized(memo: EnrichmentMemo | None, key: tuple[str, ...], fetch, keep=bool):
+    if memo is None:
+        return await fetch()
+    return await memo.get_or_fetch(key, fetch, keep)
 
-    yelp_candidates = updated_state.get("yelp_candidates") or []
-    selected_index = updated_state.get("selected_contractor_index")
-    selected_candidate = _resolve_selected_yelp_candidate(updated_state)
-    if yelp_candidates and selected_candidate is None:
-        logger.warning(
-            "Selected contractor index '%s' is invalid for %d Yelp candidates.",
-            selected_index,
-            len(yelp_candidates),
-        )
-        flags.append(
-            f"Invalid selected_contractor_index='{selected_index}' for Yelp candidates."
+
+def _has_website_facts(website_info: ContractorWebsiteInfo) -> bool:
+    # A failed extraction returns a model with only source_url set, which
+    # looks like an empty one; neither is memoized or recorded.
+    return bool(
+        website_info.services_offered
+        or website_info.license_number
+        or website_info.years_in_business
+    )
+
+
+# Vetting records (workflows.vetting_records) remember each source per
+# contractor across jobs; a source is fetched again only once its record is
+# stale. Google/BBB records point at the page in the blob store. Record reads
+# and writes are SQLite calls, so they run in a worker thread.
+async def _recorded_page(identity: str, service_type: str, source: str) -> str | None:
+    record = await asyncio.to_thread(vetting_records.fresh, identity, service_type, source)
+    if record is None:
+        return None
+    try:
+        content = await asyncio.to_thread(
+            blob_store.get, BlobRef.model_validate_json(record.payload).digest
         )
+    except Exception:
+        logger.exception("Could not read recorded %s page for '%s'.", source, identity)
+        return None
+    if content:
+        logger.info("Reusing %s page for '%s' from the vetting record.", source, identity)
+    return content or None
 
-    contractor_name = (
-        (selected_candidate.name if selected_candidate else None)
-        or updated_state.get("contractor_name")
-        or ""
-    ).strip()
-    if contractor_name:
-        updated_state["contractor_name"] = contractor_name
-    service_type = (updated_state.get("service_type") or "home improvement").strip()
-    zip_code = (updated_state.get("zip_code") or "").strip()
+
+async def _record_page(identity: str, service_type: str, source: str, content: str) -> None:
+    data = content.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()
+    await asyncio.to_thread(
+        vetting_records.put,
+        identity,
+        service_type,
+        source,
+        BlobRef(digest=digest, size_bytes=len(data)).model_dump_json(),
+        digest,
+    )
+
+
+async def _fetch_google_data(
+    candidate,
+    contractor_name: str,
+    service_type: str,
+    zip_code: str,
+    memo: EnrichmentMemo | None = None,
+) -> tuple[str, list[str]]:
+    flags: list[str] = []
     logger.info(
         "Starting Google review scrape for contractor='%s', service='%s', zip='%s'.",
         contractor_name,
@@ -159,18 +271,25 @@ def scrape_google_node(state: AgentState) -> AgentState:
             "Skipping Google review scrape due to missing contractor_name or zip_code."
         )
         flags.append("Missing contractor_name or zip_code for Google review scrape.")
-        updated_state["flags"] = flags
-        updated_state["raw_google_data"] = ""
-        return updated_state
+        return "", flags
 
     try:
-        google_content = get_google_reviews(
-            contractor_name,
-            zip_code,
-            service_type,
-            expected_phone=selected_candidate.phone if selected_candidate else None,
-            expected_address=selected_candidate.address if selected_candidate else None,
-        )
+        identity = contractor_identity_key(candidate, contractor_name, zip_code)
+        google_content = await _recorded_page(identity, service_type, "google")
+        if google_content is None:
+            google_content = await _memoized(
+                memo,
+                ("google", identity, service_type.lower()),
+                lambda: aget_google_reviews(
+                    contractor_name,
+                    zip_code,
+                    service_type,
+                    expected_phone=candidate.phone if candidate else None,
+                    expected_address=candidate.address if candidate else None,
+                ),
+            )
+            if google_content:
+                await _record_page(identity, service_type, "google", google_content)
         if not google_content:
             logger.warning(
                 "No Google review content found for contractor='%s' zip='%s'.",
@@ -180,18 +299,25 @@ def scrape_google_node(state: AgentState) -> AgentState:
             flags.append(
                 f"No Google review data found for contractor='{contractor_name}' in zip='{zip_code}'."
             )
-            updated_state["flags"] = flags
-            updated_state["raw_google_data"] = ""
-            return updated_state
+            return "", flags
 
-        updated_state["raw_google_data"] = google_content
-        updated_state["flags"] = flags
         logger.info(
             "Google review scrape complete for contractor='%s' zip='%s'.",
             contractor_name,
             zip_code,
         )
-        return updated_state
+        return google_content, flags
+    except RateLimitExhaustedError:
+        logger.warning(
+            "Google review scrape throttled for contractor='%s', zip='%s'.",
+            contractor_name,
+            zip_code,
+        )
+        flags.append(
+            f"Google review scrape {THROTTLED_FLAG} for "
+            f"contractor='{contractor_name}' in zip='{zip_code}'."
+        )
+        return "", flags
     except Exception:
         logger.exception(
             "Google review scrape failed for contractor='%s', zip='%s'.",
@@ -201,37 +327,17 @@ def scrape_google_node(state: AgentState) -> AgentState:
         flags.append(
             f"Google review scrape failed for contractor='{contractor_name}' in zip='{zip_code}'."
         )
-        updated_state["flags"] = flags
-        updated_state["raw_google_data"] = ""
-        return updated_state
-
+        return "", flags
 
-def scrape_bbb_node(state: AgentState) -> AgentState:
-    updated_state = dict(state)
-    flags = list(updated_state.get("flags", []))
-
-    yelp_candidates = updated_state.get("yelp_candidates") or []
-    selected_index = updated_state.get("selected_contractor_index")
-    selected_candidate = _resolve_selected_yelp_candidate(updated_state)
-    if yelp_candidates and selected_candidate is None:
-        logger.warning(
-            "Selected contractor index '%s' is invalid for %d Yelp candidates.",
-            selected_index,
-            len(yelp_candidates),
-        )
-        flags.append(
-            f"Invalid selected_contractor_index='{selected_index}' for Yelp candidates."
-        )
 
-    contractor_name = (
-        (selected_candidate.name if selected_candidate else None)
-        or updated_state.get("contractor_name")
-        or ""
-    ).strip()
-    if contractor_name:
-        updated_state["contractor_name"] = contractor_name
-    service_type = (updated_state.get("service_type") or "home improvement").strip()
-    zip_code = (updated_state.get("zip_code") or "").strip()
+async def _fetch_bbb_data(
+    contractor_name: str,
+    service_type: str,
+    zip_code: str,
+    candidate=None,
+    memo: EnrichmentMemo | None = None,
+) -> tuple[str, list[str]]:
+    flags: list[str] = []
     logger.info(
         "Starting BBB scrape for contractor='%s', service='%s', zip='%s'.",
         contractor_name,
@@ -242,12 +348,25 @@ def scrape_bbb_node(state: AgentState) -> AgentState:
     if not contractor_name or not zip_code:
         logger.warning("Skipping BBB scrape due to missing contractor_name or zip_code.")
         flags.append("Missing contractor_name or zip_code for BBB scrape.")
-        updated_state["flags"] = flags
-        updated_state["raw_bbb_data"] = ""
-        return updated_state
+        return "", flags
 
     try:
-        bbb_content = get_bbb_info(contractor_name, zip_code, service_type)
+        identity = contractor_identity_key(candidate, contractor_name, zip_code)
+        bbb_content = await _recorded_page(identity, service_type, "bbb")
+        if bbb_content is None:
+            bbb_content = await _memoized(
+                memo,
+                ("bbb", identity, service_type.lower()),
+                lambda: aget_bbb_info(
+                    contractor_name,
+                    zip_code,
+                    service_type,
+                    expected_phone=candidate.phone if candidate else None,
+                    expected_address=candidate.address if candidate else None,
+                ),
+            )
+            if bbb_content:
+                await _record_page(identity, service_type, "bbb", bbb_content)
         if not bbb_content:
             logger.warning(
                 "No BBB content found for contractor='%s' zip='%s'.",
@@ -257,18 +376,25 @@ def scrape_bbb_node(state: AgentState) -> AgentState:
             flags.append(
                 f"No BBB data found for contractor='{contractor_name}' in zip='{zip_code}'."
             )
-            updated_state["flags"] = flags
-            updated_state["raw_bbb_data"] = ""
-            return updated_state
+            return "", flags
 
-        updated_state["raw_bbb_data"] = bbb_content
-        updated_state["flags"] = flags
         logger.info(
             "BBB scrape complete for contractor='%s' zip='%s'.",
             contractor_name,
             zip_code,
         )
-        return updated_state
+        return bbb_content, flags
+    except RateLimitExhaustedError:
+        logger.warning(
+            "BBB scrape throttled for contractor='%s', zip='%s'.",
+            contractor_name,
+            zip_code,
+        )
+        flags.append(
+            f"BBB scrape {THROTTLED_FLAG} for "
+            f"contractor='{contractor_name}' in zip='{zip_code}'."
+        )
+        return "", flags
     except Exception:
         logger.exception(
             "BBB scrape failed for contractor='%s', zip='%s'.",
@@ -278,41 +404,21 @@ def scrape_bbb_node(state: AgentState) -> AgentState:
         flags.append(
             f"BBB scrape failed for contractor='{contractor_name}' in zip='{zip_code}'."
         )
-        updated_state["flags"] = flags
-        updated_state["raw_bbb_data"] = ""
-        return updated_state
-
-
-def scrape_website_node(state: AgentState) -> AgentState:
-    updated_state = dict(state)
-    flags = list(updated_state.get("flags", []))
-
-    service_type = (updated_state.get("service_type") or "home improvement").strip()
-    yelp_candidates = updated_state.get("yelp_candidates") or []
-    selected_index = updated_state.get("selected_contractor_index")
-    selected_candidate = _resolve_selected_yelp_candidate(updated_state)
-    if yelp_candidates and selected_candidate is None:
-        logger.warning(
-            "Selected contractor index '%s' is invalid for %d Yelp candidates.",
-            selected_index,
-            len(yelp_candidates),
-        )
-        flags.append(
-            f"Invalid selected_contractor_index='{selected_index}' for Yelp candidates."
-        )
-
-    contractor_name = (
-        (selected_candidate.name if selected_candidate else None)
-        or updated_state.get("contractor_name")
-        or ""
-    ).strip()
-    if contractor_name:
-        updated_state["contractor_name"] = contractor_name
-
-    contractor_data = updated_state.get("contractor_data")
-    website_url = (selected_candidate.website if selected_candidate else None) or ""
-    if not website_url and contractor_data and contractor_data.website:
-        website_url = contractor_data.website.strip()
+        return "", flags
+
+
+async def _fetch_website_data(
+    candidate,
+    contractor_name: str,
+    service_type: str,
+    fallback_website: str | None = None,
+    memo: EnrichmentMemo | None = None,
+    zip_code: str | None = None,
+) -> tuple[ContractorWebsiteInfo | None, list[str]]:
+    flags: list[str] = []
+    website_url = (candidate.website if candidate else None) or ""
+    if not website_url and fallback_website:
+        website_url = fallback_website.strip()
 
     logger.info(
         "Starting website scrape for contractor='%s', service='%s', website='%s'.",
@@ -324,12 +430,35 @@ def scrape_website_node(state: AgentState) -> AgentState:
     if not website_url:
         logger.warning("Skipping website scrape because contractor website URL is missing.")
         flags.append("Missing contractor website URL for website scrape.")
-        updated_state["flags"] = flags
-        updated_state["raw_website_data"] = ""
-        return updated_state
+        return None, flags
 
     try:
-        website_info = analyze_contractor_website(website_url, service_type)
+        identity = contractor_identity_key(candidate, contractor_name, zip_code)
+        url_hash = hashlib.sha256(website_url.encode("utf-8")).hexdigest()
+        record = await asyncio.to_thread(
+            vetting_records.fresh, identity, service_type, "website"
+        )
+        if record is not None and record.input_hash == url_hash:
+            logger.info("Reusing website analysis for '%s' from the vetting record.", identity)
+            website_info = ContractorWebsiteInfo.model_validate_json(record.payload)
+        else:
+            website_info = await _memoized(
+                memo,
+                ("website", website_url, service_type.lower()),
+                lambda: aanalyze_contractor_website(website_url, service_type),
+                keep=_has_website_facts,
+            )
+            if _has_website_facts(website_info):
+                payload = website_info.model_dump_json()
+                await asyncio.to_thread(
+                    vetting_records.put,
+                    identity,
+                    service_type,
+                    "website",
+                    payload,
+                    hashlib.sha256(payload.encode("utf-8")).hexdigest(),
+                    input_hash=url_hash,
+                )
         if not website_info.services_offered and not website_info.license_number:
             logger.warning(
                 "Website analysis returned sparse data for website='%s'.",
@@ -339,119 +468,466 @@ def scrape_website_node(state: AgentState) -> AgentState:
                 f"Website analysis returned sparse data for website='{website_url}'."
             )
 
-        updated_state["raw_website_data"] = website_info.model_dump_json()
-        updated_state["flags"] = flags
         logger.info("Website scrape complete for website='%s'.", website_url)
-        return updated_state
+        return website_info, flags
+    except RateLimitExhaustedError:
+        logger.warning("Website scrape throttled for website='%s'.", website_url)
+        flags.append(f"Website scrape {THROTTLED_FLAG} for website='{website_url}'.")
+        return None, flags
     except Exception:
         logger.exception("Website scrape failed for website='%s'.", website_url)
         flags.append(f"Website scrape failed for website='{website_url}'.")
-        updated_state["flags"] = flags
-        updated_state["raw_website_data"] = ""
-        return updated_state
+        return None, flags
 
 
-def synthesize_vetting_node(state: AgentState) -> AgentState:
-    updated_state = dict(state)
-    flags = list(updated_state.get("flags", []))
+async def _store_raw(
+    source: str, content: str | None, flags: list[str]
+) -> BlobRef | None:
+    # Scraped pages are written to the blob store once; state and results
+    # only carry the reference. Hashing, gzip and file I/O run in a worker
+    # thread so they do not block the event loop.
+    if not content:
+        return None
+    try:
+        return await asyncio.to_thread(blob_store.put, content)
+    except Exception:
+        logger.exception("Could not store raw %s content in the blob store.", source)
+        flags.append(f"Raw {source} content could not be stored.")
+        return None
 
-    selected_candidate = _resolve_selected_yelp_candidate(updated_state)
-    contractor_name = (
-        (selected_candidate.name if selected_candidate else None)
-        or updated_state.get("contractor_name")
-        or ""
-    ).strip()
+
+async def _load_raw(ref: BlobRef | None) -> str:
+    if ref is None:
+        return ""
+    try:
+        content = await asyncio.to_thread(blob_store.get, ref.digest)
+    except Exception:
+        logger.exception("Could not read blob '%s'.", ref.digest)
+        return ""
+    if content is None:
+        logger.warning("Blob '%s' is missing from the blob store.", ref.digest)
+    return content or ""
+
+
+async def _recorded_summary(
+    identity: str, service_type: str, scraped_input: str, review_input: str
+) -> ReviewSummary:
+    # The summary is regenerated only when the scraped review text (or the
+    # model/prompt) changed. Yelp's rating and count are left out of the
+    # input hash: they change often, are copied to VettedContractor as is,
+    # and do not change what the reviews say.
+    input_hash = make_cache_key(summary_fingerprint(), scraped_input)
+    record = await asyncio.to_thread(
+        vetting_records.fresh, identity, service_type, "summary"
+    )
+    if record is not None and record.input_hash == input_hash:
+        logger.info("Reusing review summary for '%s'; review input is unchanged.", identity)
+        return ReviewSummary.model_validate_json(record.payload)
+
+    # Coalesced with other candidates summarizing at the same time
+    # (vet_all_candidates fan-out, batch items) into one LLM request.
+    review_summary = await asummarize_reviews_coalesced(review_input)
+    if review_summary.overall_sentiment != "Unknown":
+        payload = review_summary.model_dump_json()
+        await asyncio.to_thread(
+            vetting_records.put,
+            identity,
+            service_type,
+            "summary",
+            payload,
+            hashlib.sha256(payload.encode("utf-8")).hexdigest(),
+            input_hash=input_hash,
+        )
+    return review_summary
+
+
+def _vetted_contractor(
+    candidate,
+    contractor_name: str,
+    google_listing: GoogleListing | None,
+    bbb_profile: BBBProfile | None,
+    website_info: ContractorWebsiteInfo | None,
+    review_summary: ReviewSummary,
+) -> VettedContractor:
+    trusted_listing = (
+        google_listing
+        if google_listing and google_listing.confidence >= GOOGLE_LISTING_MIN_CONFIDENCE
+        else None
+    )
+    red_flags = []
+    if bbb_profile and bbb_profile.rating in LOW_BBB_GRADES:
+        red_flags.append(f"BBB rating is {bbb_profile.rating}.")
+    return VettedContractor(
+        name=contractor_name,
+        address=(candidate.address if candidate else None)
+        or (trusted_listing.address if trusted_listing else None)
+        or "",
+        phone=(candidate.phone if candidate else None)
+        or (trusted_listing.phone if trusted_listing else None),
+        website=candidate.website if candidate else None,
+        yelp_rating=candidate.rating if candidate else None,
+        yelp_review_count=candidate.reviews_count if candidate else None,
+        google_rating=trusted_listing.rating if trusted_listing else None,
+        google_review_count=trusted_listing.review_count if trusted_listing else None,
+        bbb_rating=bbb_profile.rating if bbb_profile else None,
+        bbb_accredited=bbb_profile.accredited if bbb_profile else None,
+        services_offered=website_info.services_offered if website_info else [],
+        license_number=website_info.license_number if website_info else None,
+        years_in_business=(website_info.years_in_business if website_info else None)
+        or (bbb_profile.years_in_business if bbb_profile else None),
+        review_summary=review_summary,
+        red_flags=red_flags,
+        bbb_profile=bbb_profile,
+        google_listing=google_listing,
+    )
+
+
+async def _synthesize_candidate(
+    candidate,
+    contractor_name: str,
+    candidate_index: int | None,
+    service_type: str | None,
+    zip_code: str | None,
+    yelp_url: str | None,
+    google_blob: BlobRef | None,
+    bbb_blob: BlobRef | None,
+    website_info: ContractorWebsiteInfo | None,
+    flags: list[str],
+) -> tuple[SynthesisResult | None, list[str]]:
+    synthesis_flags: list[str] = []
     logger.info("Starting synthesis for contractor='%s'.", contractor_name)
 
     if not contractor_name:
         logger.warning("Skipping synthesis because no contractor is selected.")
-        flags.append("No contractor selected for synthesis.")
-        updated_state["flags"] = flags
-        updated_state["raw_synthesis_data"] = ""
-        return updated_state
+        synthesis_flags.append("No contractor selected for synthesis.")
+        return None, synthesis_flags
 
     try:
         yelp_snippet = ""
-        if selected_candidate:
+        if candidate:
             yelp_snippet = (
-                f"name={selected_candidate.name}, rating={selected_candidate.rating}, "
-                f"reviews={selected_candidate.reviews_count}, website={selected_candidate.website or 'n/a'}, "
-                f"yelp_profile_url={selected_candidate.yelp_profile_url or 'n/a'}, "
-                f"phone={selected_candidate.phone or 'n/a'}, address={selected_candidate.address or 'n/a'}"
+                f"name={candidate.name}, rating={candidate.rating}, "
+                f"reviews={candidate.reviews_count}, website={candidate.website or 'n/a'}, "
+                f"yelp_profile_url={candidate.yelp_profile_url or 'n/a'}, "
+                f"phone={candidate.phone or 'n/a'}, address={candidate.address or 'n/a'}"
             )
 
+        # Yelp details are already compact; the scraped pages are compressed
+        # so both Google and BBB fit the summary budget.
+        raw_google_data, raw_bbb_data = await asyncio.gather(
+            _load_raw(google_blob), _load_raw(bbb_blob)
+        )
+        # Google rating/count/contact fields and BBB grade, accreditation and
+        # complaint counts are read by rules; only the rest of each page
+        # (mostly review text) goes to the model.
+        google_listing, google_free_text = parse_google_listing(raw_google_data)
+        bbb_profile, bbb_free_text = parse_bbb_markdown(
+            raw_bbb_data,
+            contractor_name,
+            expected_phone=candidate.phone if candidate else None,
+        )
+        scraped_input = compress_sources(
+            [
+                ("Google review content", google_free_text),
+                ("BBB content", bbb_free_text),
+            ]
+        )
+        logger.info(
+            "Compressed review input for contractor='%s' from %d to %d tokens.",
+            contractor_name,
+            estimate_tokens(raw_google_data) + estimate_tokens(raw_bbb_data),
+            estimate_tokens(scraped_input),
+        )
         review_input = "\n\n".join(
             part
             for part in [
                 f"Yelp candidate details: {yelp_snippet}" if yelp_snippet else "",
-                f"Google review content: {updated_state.get('raw_google_data') or ''}",
-                f"BBB content: {updated_state.get('raw_bbb_data') or ''}",
+                scraped_input,
             ]
             if part.strip()
         )
-        review_summary = summarize_reviews(review_input)
-
-        website_info = {}
-        raw_website_data = (updated_state.get("raw_website_data") or "").strip()
-        if raw_website_data:
-            try:
-                website_info = json.loads(raw_website_data)
-            except Exception:
-                logger.warning("Website data was not valid JSON; storing as raw text.")
-                website_info = {"raw_text": raw_website_data}
-
-        consolidated = {
-            "contractor_name": contractor_name,
-            "selected_contractor_index": updated_state.get("selected_contractor_index"),
-            "service_type": updated_state.get("service_type"),
-            "zip_code": updated_state.get("zip_code"),
-            "yelp": {
-                "source_url": updated_state.get("yelp_url"),
-                "candidate": {
-                    "name": selected_candidate.name,
-                    "rating": selected_candidate.rating,
-                    "reviews_count": selected_candidate.reviews_count,
-                    "website": selected_candidate.website,
-                    "yelp_profile_url": selected_candidate.yelp_profile_url,
-                    "phone": selected_candidate.phone,
-                    "address": selected_candidate.address,
-                }
-                if selected_candidate
-                else None,
-            },
-            "google_reviews_raw": updated_state.get("raw_google_data"),
-            "bbb_raw": updated_state.get("raw_bbb_data"),
-            "website_analysis": website_info,
-            "review_summary": review_summary.model_dump(),
-            "flags": flags,
-        }
+        review_summary = await _recorded_summary(
+            contractor_identity_key(candidate, contractor_name, zip_code),
+            service_type or "",
+            scraped_input,
+            review_input,
+        )
+
+        consolidated = SynthesisResult(
+            contractor_name=contractor_name,
+            selected_contractor_index=candidate_index,
+            service_type=service_type,
+            zip_code=zip_code,
+            yelp=YelpSource(source_url=yelp_url, candidate=candidate),
+            google_reviews_blob=google_blob,
+            bbb_blob=bbb_blob,
+            website_analysis=website_info,
+            review_summary=review_summary,
+            contractor=_vetted_contractor(
+                candidate,
+                contractor_name,
+                google_listing,
+                bbb_profile,
+                website_info,
+                review_summary,
+            ),
+            flags=list(flags),
+        )
 
-        updated_state["raw_synthesis_data"] = json.dumps(consolidated, indent=2)
-        updated_state["flags"] = flags
         logger.info("Synthesis complete for contractor='%s'.", contractor_name)
-        return updated_state
+        return consolidated, synthesis_flags
     except Exception:
         logger.exception("Synthesis failed for contractor='%s'.", contractor_name)
-        flags.append(f"Synthesis failed for contractor='{contractor_name}'.")
-        updated_state["flags"] = flags
-        updated_state["raw_synthesis_data"] = ""
-        return updated_state
+        synthesis_flags.append(f"Synthesis failed for contractor='{contractor_name}'.")
+        return None, synthesis_flags
+
 
+async def scrape_google_node(
+    state: AgentState, config: RunnableConfig
+) -> dict[str, Any]:
+    flags: list[str] = []
+
+    selected_candidate = _resolve_selected_yelp_candidate(state)
+    _flag_invalid_selection(state, selected_candidate, flags)
+
+    raw_google_data, source_flags = await _fetch_google_data(
+        selected_candidate,
+        _resolve_contractor_name(state, selected_candidate),
+        (state.get("service_type") or "home improvement").strip(),
+        (state.get("zip_code") or "").strip(),
+        memo=enrichment_memo_from_config(config),
+    )
+    google_data = await _store_raw("Google", raw_google_data, source_flags)
+    return {"flags": flags + source_flags, "google_data": google_data}
 
-def build_discovery_vetting_graph():
+
+async def scrape_bbb_node(state: AgentState, config: RunnableConfig) -> dict[str, Any]:
+    flags: list[str] = []
+
+    selected_candidate = _resolve_selected_yelp_candidate(state)
+    _flag_invalid_selection(state, selected_candidate, flags)
+
+    raw_bbb_data, source_flags = await _fetch_bbb_data(
+        _resolve_contractor_name(state, selected_candidate),
+        (state.get("service_type") or "home improvement").strip(),
+        (state.get("zip_code") or "").strip(),
+        candidate=selected_candidate,
+        memo=enrichment_memo_from_config(config),
+    )
+    bbb_data = await _store_raw("BBB", raw_bbb_data, source_flags)
+    return {"flags": flags + source_flags, "bbb_data": bbb_data}
+
+
+async def scrape_website_node(
+    state: AgentState, config: RunnableConfig
+) -> dict[str, Any]:
+    flags: list[str] = []
+
+    selected_candidate = _resolve_selected_yelp_candidate(state)
+    _flag_invalid_selection(state, selected_candidate, flags)
+
+    contractor_data = state.get("contractor_data")
+    website_info, source_flags = await _fetch_website_data(
+        selected_candidate,
+        _resolve_contractor_name(state, selected_candidate),
+        (state.get("service_type") or "home improvement").strip(),
+        fallback_website=contractor_data.website if contractor_data else None,
+        memo=enrichment_memo_from_config(config),
+        zip_code=(state.get("zip_code") or "").strip(),
+    )
+    return {"flags": flags + source_flags, "website_info": website_info}
+
+
+async def synthesize_vetting_node(state: AgentState) -> dict[str, Any]:
+    selected_candidate = _resolve_selected_yelp_candidate(state)
+    consolidated, flags = await _synthesize_candidate(
+        selected_candidate,
+        _resolve_contractor_name(state, selected_candidate),
+        state.get("selected_contractor_index"),
+        state.get("service_type"),
+        state.get("zip_code"),
+        state.get("yelp_url"),
+        state.get("google_data"),
+        state.get("bbb_data"),
+        state.get("website_info"),
+        list(state.get("flags") or []),
+    )
+    return {
+        "flags": flags,
+        "synthesis": consolidated,
+        "contractor_data": consolidated.contractor if consolidated else None,
+    }
+
+
+async def vet_candidate_node(
+    task: CandidateTask, config: RunnableConfig
+) -> dict[str, Any]:
+    candidate = task["candidate"]
+    candidate_index = task["candidate_index"]
+    contractor_name = (candidate.name or "").strip()
+    service_type = (task.get("service_type") or "home improvement").strip()
+    zip_code = (task.get("zip_code") or "").strip()
+    logger.info(
+        "Vetting Yelp candidate index=%d contractor='%s'.",
+        candidate_index,
+        contractor_name,
+    )
+
+    # Each candidate's sources are independent, so they are fetched together;
+    # the number of candidates in flight is bounded by the graph's
+    # max_concurrency.
+    memo = enrichment_memo_from_config(config)
+    (
+        (raw_google_data, google_flags),
+        (raw_bbb_data, bbb_flags),
+        (website_info, website_flags),
+    ) = await asyncio.gather(
+        _fetch_google_data(candidate, contractor_name, service_type, zip_code, memo=memo),
+        _fetch_bbb_data(
+            contractor_name, service_type, zip_code, candidate=candidate, memo=memo
+        ),
+        _fetch_website_data(
+            candidate, contractor_name, service_type, memo=memo, zip_code=zip_code
+        ),
+    )
+
+    flags = google_flags + bbb_flags + website_flags
+    google_blob = await _store_raw("Google", raw_google_data, flags)
+    bbb_blob = await _store_raw("BBB", raw_bbb_data, flags)
+    consolidated, synthesis_flags = await _synthesize_candidate(
+        candidate,
+        contractor_name,
+        candidate_index,
+        service_type,
+        zip_code,
+        task.get("yelp_url"),
+        google_blob,
+        bbb_blob,
+        website_info,
+        flags,
+    )
+    flags.extend(synthesis_flags)
+    return {
+        "flags": flags,
+        "candidate_summaries": [consolidated] if consolidated is not None else [],
+    }
+
+
+async def rank_candidates_node(state: AgentState) -> dict[str, Any]:
+    summaries = list(state.get("candidate_summaries") or [])
+    if not summaries and state.get("synthesis") is not None:
+        summaries = [state["synthesis"]]
+    ranked = rank_candidates(summaries)
+    if ranked:
+        logger.info(
+            "Ranked %d candidates; top contractor='%s' (score=%.3f).",
+            len(ranked),
+            ranked[0].contractor_name,
+            ranked[0].score,
+        )
+    return {"ranked_candidates": ranked}
+
+
+def route_after_yelp(state: AgentState):
+    if not state.get("vet_all_candidates"):
+        return list(ENRICHMENT_NODES)
+
+    candidates = state.get("yelp_candidates") or []
+    if not candidates:
+        logger.warning("No Yelp candidates to vet; ending discovery run.")
+        return END
+
+    logger.info("Fanning out enrichment for %d Yelp candidates.", len(candidates))
+    return [
+        Send(
+            "vet_candidate",
+            {
+                "candidate": candidate,
+                "candidate_index": idx,
+                "service_type": state.get("service_type"),
+                "zip_code": state.get("zip_code"),
+                "yelp_url": state.get("yelp_url"),
+            },
+        )
+        for idx, candidate in enumerate(candidates)
+    ]
+
+
+def _default_max_concurrency() -> int:
+    return env_int("DISCOVERY_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY, minimum=1)
+
+
+def build_discovery_vetting_graph(max_concurrency: int | None = None):
     graph = StateGraph(AgentState)
 
-    graph.add_node("scrape_yelp", scrape_yelp_node)
-    graph.add_node("scrape_google", scrape_google_node)
-    graph.add_node("scrape_bbb", scrape_bbb_node)
-    graph.add_node("scrape_website", scrape_website_node)
-    graph.add_node("synthesize_vetting", synthesize_vetting_node)
+    nodes = {
+        "scrape_yelp": scrape_yelp_node,
+        "scrape_google": scrape_google_node,
+        "scrape_bbb": scrape_bbb_node,
+        "scrape_website": scrape_website_node,
+        "synthesize_vetting": synthesize_vetting_node,
+        "vet_candidate": vet_candidate_node,
+        "rank_candidates": rank_candidates_node,
+    }
+    for name, node in nodes.items():
+        graph.add_node(name, timed_node(name, node))
 
     graph.set_entry_point("scrape_yelp")
-    graph.add_edge("scrape_yelp", "scrape_google")
-    graph.add_edge("scrape_google", "scrape_bbb")
-    graph.add_edge("scrape_bbb", "scrape_website")
-    graph.add_edge("scrape_website", "synthesize_vetting")
-    graph.add_edge("synthesize_vetting", END)
+    # Google, BBB and website enrichment are independent of each other, so
+    # they fan out from Yelp discovery and join at synthesis. When
+    # vet_all_candidates is set, every Yelp candidate is vetted instead.
+    graph.add_conditional_edges(
+        "scrape_yelp",
+        route_after_yelp,
+        [*ENRICHMENT_NODES, "vet_candidate", END],
+    )
+    graph.add_edge(list(ENRICHMENT_NODES), "synthesize_vetting")
+    # Runs once after synthesis, or once after every vet_candidate task.
+    graph.add_edge("synthesize_vetting", "rank_candidates")
+    graph.add_edge("vet_candidate", "rank_candidates")
+    graph.add_edge("rank_candidates", END)
+
+    if max_concurrency is None:
+        max_concurrency = _default_max_concurrency()
+    return graph.compile().with_config(max_concurrency=max_concurrency)
+
+
+def _graph_config_key(max_concurrency: int) -> str:
+    return f"max_concurrency={max_concurrency}"
+
+
+def get_discovery_vetting_graph(max_concurrency: int | None = None):
+    if max_concurrency is None:
+        max_concurrency = _default_max_concurrency()
+    config_key = _graph_config_key(max_concurrency)
+
+    graph = _compiled_graphs.get(config_key)
+    if graph is None:
+        with _compiled_graphs_lock:
+            graph = _compiled_graphs.get(config_key)
+            if graph is None:
+                started = time.perf_counter()
+                graph = build_discovery_vetting_graph(max_concurrency)
+                compile_seconds = time.perf_counter() - started
+                _compiled_graphs[config_key] = graph
+                _graph_build_stats[config_key] = {
+                    "config_key": config_key,
+                    "compile_seconds": compile_seconds,
+                    "compiled_at": datetime.now(tz=timezone.utc).isoformat(),
+                    "reuse_count": 0,
+                }
+                logger.info(
+                    "Compiled discovery graph '%s' in %.1f ms.",
+                    config_key,
+                    compile_seconds * 1000,
+                )
+                return graph
+
+    with _compiled_graphs_lock:
+        _graph_build_stats[config_key]["reuse_count"] += 1
+    return graph
+
 
-    return graph.compile()
+def graph_build_stats() -> list[dict[str, Any]]:
+    with _compiled_graphs_lock:
+        return [dict(stats) for stats in _graph_build_stats.values()]
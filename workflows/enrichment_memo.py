@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import re
+from typing import Any, Awaitable, Callable, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+# Hosts that serve many businesses under one domain (social pages, site
+# builders); on these the path is what identifies the business.
+SHARED_WEBSITE_HOSTS = {
+    "facebook.com",
+    "m.facebook.com",
+    "instagram.com",
+    "linkedin.com",
+    "twitter.com",
+    "x.com",
+    "yelp.com",
+    "nextdoor.com",
+    "houzz.com",
+    "angi.com",
+    "homeadvisor.com",
+    "thumbtack.com",
+    "sites.google.com",
+    "google.com",
+    "business.site",
+    "wixsite.com",
+    "squarespace.com",
+    "godaddysites.com",
+    "linktr.ee",
+}
+
+
+def _normalize_name(name: Optional[str]) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", (name or "").lower()).strip()
+
+
+def _website_identity(website: str) -> Optional[str]:
+    website = website.strip()
+    parts = urlsplit(website if "//" in website else f"//{website}")
+    host = (parts.hostname or "").removeprefix("www.")
+    if not host:
+        return None
+    if host not in SHARED_WEBSITE_HOSTS:
+        return host
+    path = parts.path.strip("/").lower()
+    # A bare shared host says nothing about which business it is.
+    return f"{host}/{path}" if path else None
+
+
+def contractor_identity_key(
+    candidate: Any, contractor_name: Optional[str] = None, zip_code: Optional[str] = None
+) -> str:
+    # Same business across searches: Yelp profile first, then phone number,
+    # then website domain (domain + path on shared hosts). Without any, fall back to name + ZIP so unrelated
+    # businesses that share a name in different areas are not merged.
+    profile_url = getattr(candidate, "yelp_profile_url", None) if candidate else None
+    if profile_url:
+        parts = urlsplit(profile_url.strip())
+        return f"yelp:{parts.netloc.lower()}{parts.path.rstrip('/').lower()}"
+
+    phone = getattr(candidate, "phone", None) if candidate else None
+    phone_digits = re.sub(r"\D", "", phone or "")[-10:]
+    if len(phone_digits) == 10:
+        return f"phone:{phone_digits}"
+
+    website = getattr(candidate, "website", None) if candidate else None
+    website_identity = _website_identity(website) if website else None
+    if website_identity:
+        return f"web:{website_identity}"
+
+    name = _normalize_name(contractor_name or getattr(candidate, "name", None))
+    return f"name:{name}|zip:{(zip_code or '').strip()}"
+
+
+# Shares enrichment results between graph runs, e.g. across the items of a
+# batch. Passed to the graph as config["configurable"]["enrichment_memo"].
+# Concurrent requests for the same key wait on the first one; failures and
+# empty results (as judged by `keep`) are not remembered so a later item can
+# retry.
+class EnrichmentMemo:
+    def __init__(self) -> None:
+        self._results: dict[tuple[str, ...], asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_fetch(
+        self,
+        key: tuple[str, ...],
+        fetch: Callable[[], Awaitable[Any]],
+        keep: Callable[[Any], bool] = bool,
+    ) -> Any:
+        future = self._results.get(key)
+        if future is not None:
+            self.hits += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The first caller was cancelled; fetch on our own behalf.
+                return await self.get_or_fetch(key, fetch, keep)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._results[key] = future
+        try:
+            result = await fetch()
+        except BaseException as exc:
+            del self._results[key]
+            if isinstance(exc, Exception):
+                future.set_exception(exc)
+                # Mark retrieved in case nobody else was waiting.
+                future.exception()
+            else:
+                future.cancel()
+            raise
+        future.set_result(result)
+        if not keep(result):
+            # The scrape helpers return "" both for "not found" and for
+            # errors they swallowed, so empty results are not kept either.
+            # Callers already waiting on this fetch still share it.
+            del self._results[key]
+        return result
+
+    def stats(self) -> dict[str, int]:
+        return {"entries": len(self._results), "hits": self.hits, "misses": self.misses}
+
+
+def enrichment_memo_from_config(config: Optional[dict]) -> Optional[EnrichmentMemo]:
+    return ((config or {}).get("configurable") or {}).get("enrichment_memo")
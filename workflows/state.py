@@ -1,6 +1,24 @@
-from typing import List, Optional, TypedDict
+import operator
+from typing import Annotated, List, Optional, TypedDict
 
-from schema.models import Contractor, VettedContractor
+from schema.models import (
+    BlobRef,
+    Contractor,
+    ContractorWebsiteInfo,
+    RankedContractor,
+    SynthesisResult,
+    VettedContractor,
+)
+
+
+def merge_candidate_summaries(
+    left: List[SynthesisResult], right: List[SynthesisResult]
+) -> List[SynthesisResult]:
+    # Per-candidate branches finish in any order; keep summaries in Yelp order.
+    return sorted(
+        [*(left or []), *(right or [])],
+        key=lambda summary: summary.selected_contractor_index or 0,
+    )
 
 
 class AgentState(TypedDict):
@@ -8,6 +26,7 @@ class AgentState(TypedDict):
     target_contractor_count: Optional[int]
     contractor_name: Optional[str]
     selected_contractor_index: Optional[int]
+    vet_all_candidates: Optional[bool]
     zip_code: str
     yelp_candidates: List[Contractor]
     contractor_data: Optional[VettedContractor]
@@ -15,8 +34,51 @@ class AgentState(TypedDict):
     google_url: Optional[str]
     bbb_url: Optional[str]
     raw_yelp_data: Optional[str]
-    raw_google_data: Optional[str]
-    raw_bbb_data: Optional[str]
-    raw_website_data: Optional[str]
-    raw_synthesis_data: Optional[str]
-    flags: List[str]
+    # Scraped pages live in the blob store; state only carries references.
+    google_data: Optional[BlobRef]
+    bbb_data: Optional[BlobRef]
+    website_info: Optional[ContractorWebsiteInfo]
+    synthesis: Optional[SynthesisResult]
+    candidate_summaries: Annotated[List[SynthesisResult], merge_candidate_summaries]
+    ranked_candidates: List[RankedContractor]
+    # Google, BBB and website branches run concurrently, so flags are merged
+    # with a reducer instead of being overwritten by the last branch to finish.
+    flags: Annotated[List[str], operator.add]
+
+
+class CandidateTask(TypedDict):
+    candidate: Contractor
+    candidate_index: int
+    service_type: Optional[str]
+    zip_code: str
+    yelp_url: Optional[str]
+
+
+def initial_agent_state(
+    service_type: Optional[str],
+    zip_code: str,
+    target_contractor_count: int = 5,
+    selected_contractor_index: int = 0,
+    vet_all_candidates: bool = False,
+) -> AgentState:
+    return {
+        "service_type": (service_type or "").strip() or "home improvement",
+        "target_contractor_count": target_contractor_count,
+        "contractor_name": None,
+        "selected_contractor_index": selected_contractor_index,
+        "vet_all_candidates": vet_all_candidates,
+        "zip_code": (zip_code or "").strip(),
+        "yelp_candidates": [],
+        "contractor_data": None,
+        "yelp_url": None,
+        "google_url": None,
+        "bbb_url": None,
+        "raw_yelp_data": None,
+        "google_data": None,
+        "bbb_data": None,
+        "website_info": None,
+        "synthesis": None,
+        "candidate_summaries": [],
+        "ranked_candidates": [],
+        "flags": [],
+    }
@@ -0,0 +1,195 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from schema.models import SourceRecord
+from tools.env import env_float
+from tools.metrics import CACHE_LOOKUPS
+
+logger = logging.getLogger(__name__)
+
+SOURCES = ("google", "bbb", "website", "summary")
+# Sources whose payload is a BlobRef to the page in tools.blob_store; their
+# content_hash is the blob digest.
+PAGE_SOURCES = ("google", "bbb")
+# How long a fetched source is trusted before it is fetched again; override
+# with VETTING_MAX_AGE_<SOURCE> (seconds). A Google listing changes more often
+# than a BBB profile or a company website. The summary is also regenerated
+# whenever its input hash changes.
+DEFAULT_MAX_AGE_SECONDS = {
+    "google": 3 * 24 * 60 * 60,
+    "bbb": 14 * 24 * 60 * 60,
+    "website": 30 * 24 * 60 * 60,
+    "summary": 30 * 24 * 60 * 60,
+}
+
+
+# Per-contractor vetting records: for each contractor identity
+# (workflows.enrichment_memo.contractor_identity_key) and service type, the
+# last fetched value of every source with its fetch time and content hash.
+# The graph asks for a source with fresh() and only fetches it again when
+# the record is missing or older than the source's max age, so vetting the
+# same contractor again is mostly reads from here.
+class VettingRecordStore:
+    def __init__(
+        self,
+        path: str,
+        enabled: bool = True,
+        max_age_seconds: Optional[dict[str, float]] = None,
+    ) -> None:
+        self.path = path
+        self.enabled = enabled
+        self.max_age_seconds = max_age_seconds or {
+            source: env_float(f"VETTING_MAX_AGE_{source.upper()}", default)
+            for source, default in DEFAULT_MAX_AGE_SECONDS.items()
+        }
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._counters = {"fresh": 0, "stale": 0, "missing": 0, "stores": 0, "changed": 0}
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS vetting_sources ("
+                "identity TEXT NOT NULL, service TEXT NOT NULL, source TEXT NOT NULL, "
+                "fetched_at REAL NOT NULL, content_hash TEXT NOT NULL, input_hash TEXT, "
+                "payload TEXT NOT NULL, PRIMARY KEY (identity, service, source))"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_vetting_sources_fetched_at "
+                "ON vetting_sources (fetched_at)"
+            )
+            self._conn = conn
+            logger.info("Opened vetting record store at '%s'.", self.path)
+        return self._conn
+
+    def get(self, identity: str, service: str, source: str) -> Optional[SourceRecord]:
+        if not self.enabled:
+            return None
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT fetched_at, content_hash, input_hash, payload FROM vetting_sources "
+                    "WHERE identity = ? AND service = ? AND source = ?",
+                    (identity, service.lower(), source),
+                ).fetchone()
+        except Exception:
+            logger.exception("Vetting record lookup failed for source='%s'.", source)
+            return None
+        if row is None:
+            return None
+        fetched_at, content_hash, input_hash, payload = row
+        return SourceRecord(
+            source=source,
+            fetched_at=fetched_at,
+            content_hash=content_hash,
+            input_hash=input_hash,
+            payload=payload,
+        )
+
+    def fresh(self, identity: str, service: str, source: str) -> Optional[SourceRecord]:
+        # The record if it is younger than the source's max age, else None.
+        record = self.get(identity, service, source)
+        if record is None:
+            outcome = "missing"
+        elif time.time() - record.fetched_at > self.max_age_seconds.get(source, 0):
+            outcome = "stale"
+            record = None
+        else:
+            outcome = "fresh"
+        if self.enabled:
+            with self._lock:
+                self._counters[outcome] += 1
+            CACHE_LOOKUPS.labels(f"vetting_{source}", "hit" if record else "miss").inc()
+        return record
+
+    def put(
+        self,
+        identity: str,
+        service: str,
+        source: str,
+        payload: str,
+        content_hash: str,
+        input_hash: Optional[str] = None,
+    ) -> None:
+        if not self.enabled:
+            return
+        try:
+            with self._lock:
+                conn = self._connection()
+                previous = conn.execute(
+                    "SELECT content_hash FROM vetting_sources "
+                    "WHERE identity = ? AND service = ? AND source = ?",
+                    (identity, service.lower(), source),
+                ).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO vetting_sources "
+                    "(identity, service, source, fetched_at, content_hash, input_hash, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        identity,
+                        service.lower(),
+                        source,
+                        time.time(),
+                        content_hash,
+                        input_hash,
+                        payload,
+                    ),
+                )
+                self._counters["stores"] += 1
+                if previous is not None and previous[0] != content_hash:
+                    self._counters["changed"] += 1
+                    logger.info("Vetting source '%s' changed for '%s'.", source, identity)
+        except Exception:
+            logger.exception("Vetting record store failed for source='%s'.", source)
+
+    def purge_expired(self) -> int:
+        # Records older than every source's max age can never be fresh again.
+        if not self.enabled:
+            return 0
+        cutoff = time.time() - max(self.max_age_seconds.values(), default=0)
+        with self._lock:
+            cursor = self._connection().execute(
+                "DELETE FROM vetting_sources WHERE fetched_at < ?", (cutoff,)
+            )
+        if cursor.rowcount:
+            logger.info("Purged %d expired vetting records.", cursor.rowcount)
+        return cursor.rowcount
+
+    def fresh_blob_digests(self) -> set[str]:
+        # Blobs that fresh page records point at; the blob store purge keeps
+        # them so a record is not outlived by its page.
+        if not self.enabled:
+            return set()
+        now = time.time()
+        digests: set[str] = set()
+        with self._lock:
+            conn = self._connection()
+            for source in PAGE_SOURCES:
+                rows = conn.execute(
+                    "SELECT content_hash FROM vetting_sources "
+                    "WHERE source = ? AND fetched_at >= ?",
+                    (source, now - self.max_age_seconds.get(source, 0)),
+                ).fetchall()
+                digests.update(row[0] for row in rows)
+        return digests
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"path": self.path, "enabled": self.enabled, **self._counters}
+
+
+vetting_records = VettingRecordStore(
+    path=os.getenv("VETTING_RECORDS_PATH", ".cache/vetting_records.sqlite3"),
+    enabled=os.getenv("VETTING_RECORDS_DISABLED", "").strip().lower()
+    not in {"1", "true", "yes"},
+)